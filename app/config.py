@@ -1,31 +1,110 @@
 from __future__ import annotations
 
+from datetime import date
 from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from arq.connections import RedisSettings
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+if TYPE_CHECKING:
+    from arq.connections import RedisSettings
+
 
 class Settings(BaseSettings):
     """Application configuration sourced from environment variables."""
 
     project_name: str = Field("invilso-landing", alias="PROJECT_NAME")
+    site_url: str = Field("https://invilso.pp.ua", alias="SITE_URL")
+    sitemap_max_urls: int = Field(50_000, alias="SITEMAP_MAX_URLS")
+    site_home_updated_at: date | None = Field(None, alias="SITE_HOME_UPDATED_AT")
+    static_max_memory_file_bytes: int = Field(1024 * 1024, alias="STATIC_MAX_MEMORY_FILE_BYTES")
+    preload_enabled: bool = Field(True, alias="PRELOAD_ENABLED")
+    early_hints_enabled: bool = Field(True, alias="EARLY_HINTS_ENABLED")
+    preload_font_pattern: str = Field("fonts/*.woff2", alias="PRELOAD_FONT_PATTERN")
+    preload_routes: dict[str, str] = Field(
+        default_factory=lambda: {"home": "home.html", "legal-page": "legal.html"}, alias="PRELOAD_ROUTES"
+    )
+    service_worker_enabled: bool = Field(True, alias="SERVICE_WORKER_ENABLED")
+    service_worker_precache: list[str] | None = Field(None, alias="SERVICE_WORKER_PRECACHE")
     telegram_bot_token: str = Field("test-token", alias="TELEGRAM_BOT_TOKEN")
     telegram_chat_id: int = Field(0, alias="TELEGRAM_CHAT_ID")
+    telegram_api_base: str = Field("https://api.telegram.org", alias="TELEGRAM_API_BASE")
+    telegram_max_connections: int = Field(10, alias="TELEGRAM_MAX_CONNECTIONS")
+    telegram_default_retry_after: float = Field(1.0, alias="TELEGRAM_DEFAULT_RETRY_AFTER")
+    notification_destinations: list[dict[str, Any]] | None = Field(None, alias="NOTIFICATION_DESTINATIONS")
+    notification_concurrency: int = Field(4, alias="NOTIFICATION_CONCURRENCY")
+    notification_dedupe_ttl_seconds: int = Field(86_400, alias="NOTIFICATION_DEDUPE_TTL_SECONDS")
     redis_host: str = Field("redis", alias="REDIS_HOST")
     redis_port: int = Field(6379, alias="REDIS_PORT")
     redis_db: int = Field(0, alias="REDIS_DB")
     redis_password: str | None = Field(None, alias="REDIS_PASSWORD")
+    redis_connect_attempts: int = Field(10, alias="REDIS_CONNECT_ATTEMPTS")
+    redis_connect_backoff_seconds: float = Field(0.5, alias="REDIS_CONNECT_BACKOFF_SECONDS")
+    redis_connect_backoff_max_seconds: float = Field(10.0, alias="REDIS_CONNECT_BACKOFF_MAX_SECONDS")
+    redis_reconnect_interval_seconds: float = Field(30.0, alias="REDIS_RECONNECT_INTERVAL_SECONDS")
+    redis_ready_wait_seconds: float = Field(2.0, alias="REDIS_READY_WAIT_SECONDS")
+    web_host: str = Field("0.0.0.0", alias="WEB_HOST")
+    web_port: int = Field(8000, alias="WEB_PORT")
+    web_workers: int = Field(0, alias="WEB_WORKERS")
+    web_backlog: int = Field(2048, alias="WEB_BACKLOG")
+    web_max_requests: int = Field(0, alias="WEB_MAX_REQUESTS")
+    web_max_requests_jitter: int = Field(0, alias="WEB_MAX_REQUESTS_JITTER")
+    web_graceful_timeout: float = Field(30.0, alias="WEB_GRACEFUL_TIMEOUT")
+    forwarded_allow_ips: str = Field("127.0.0.1", alias="FORWARDED_ALLOW_IPS")
+    admission_enabled: bool = Field(True, alias="ADMISSION_ENABLED")
+    admission_pages_limit: int = Field(64, alias="ADMISSION_PAGES_LIMIT")
+    admission_static_limit: int = Field(256, alias="ADMISSION_STATIC_LIMIT")
+    admission_api_limit: int = Field(16, alias="ADMISSION_API_LIMIT")
+    admission_queue_size: int = Field(32, alias="ADMISSION_QUEUE_SIZE")
+    admission_queue_timeout_seconds: float = Field(0.5, alias="ADMISSION_QUEUE_TIMEOUT_SECONDS")
+    admission_codel_target_seconds: float = Field(0.05, alias="ADMISSION_CODEL_TARGET_SECONDS")
+    admission_codel_interval_seconds: float = Field(0.1, alias="ADMISSION_CODEL_INTERVAL_SECONDS")
+    admission_retry_after_seconds: float = Field(1.0, alias="ADMISSION_RETRY_AFTER_SECONDS")
+    queue_sample_interval_seconds: float = Field(1.0, alias="QUEUE_SAMPLE_INTERVAL_SECONDS")
+    queue_soft_depth: int = Field(100, alias="QUEUE_SOFT_DEPTH")
+    queue_hard_depth: int = Field(1000, alias="QUEUE_HARD_DEPTH")
+    queue_soft_age_seconds: float = Field(60.0, alias="QUEUE_SOFT_AGE_SECONDS")
+    queue_hard_age_seconds: float = Field(600.0, alias="QUEUE_HARD_AGE_SECONDS")
+    queue_soft_delay_seconds: float = Field(0.5, alias="QUEUE_SOFT_DELAY_SECONDS")
+    queue_retry_after_seconds: float = Field(60.0, alias="QUEUE_RETRY_AFTER_SECONDS")
+    health_cache_ttl_seconds: float = Field(2.0, alias="HEALTH_CACHE_TTL_SECONDS")
+    health_check_timeout_seconds: float = Field(1.0, alias="HEALTH_CHECK_TIMEOUT_SECONDS")
+    contact_max_body_bytes: int = Field(16 * 1024, alias="CONTACT_MAX_BODY_BYTES")
+    spam_enabled: bool = Field(True, alias="SPAM_ENABLED")
+    spam_token_secret: str | None = Field(None, alias="SPAM_TOKEN_SECRET")
+    spam_min_submit_seconds: float = Field(3.0, alias="SPAM_MIN_SUBMIT_SECONDS")
+    spam_max_links: int = Field(2, alias="SPAM_MAX_LINKS")
+    spam_patterns: list[str] | None = Field(None, alias="SPAM_PATTERNS")
+    spam_recent_window_seconds: float = Field(3600.0, alias="SPAM_RECENT_WINDOW_SECONDS")
+    spam_recent_max_submissions: int = Field(3, alias="SPAM_RECENT_MAX_SUBMISSIONS")
+    spam_quarantine_score: int = Field(50, alias="SPAM_QUARANTINE_SCORE")
+    spam_reject_score: int = Field(100, alias="SPAM_REJECT_SCORE")
     request_timeout_seconds: float = Field(10.0, alias="REQUEST_TIMEOUT_SECONDS")
+    worker_max_jobs: int = Field(10, alias="WORKER_MAX_JOBS")
+    worker_max_tries: int = Field(5, alias="WORKER_MAX_TRIES")
+    worker_processes: int = Field(1, alias="WORKER_PROCESSES")
+    worker_graceful_timeout: float = Field(30.0, alias="WORKER_GRACEFUL_TIMEOUT")
+    worker_heartbeat_seconds: int = Field(30, alias="WORKER_HEARTBEAT_SECONDS")
+    profiling_enabled: bool = Field(False, alias="PROFILING_ENABLED")
+    profiling_sample_rate: float = Field(0.0, alias="PROFILING_SAMPLE_RATE")
+    profiling_secret: str | None = Field(None, alias="PROFILING_SECRET")
+    profiling_interval_seconds: float = Field(0.005, alias="PROFILING_INTERVAL_SECONDS")
+    profiling_output_dir: str = Field("profiles", alias="PROFILING_OUTPUT_DIR")
+    trace_exporter: str = Field("none", alias="TRACE_EXPORTER")
+    trace_file_path: str = Field("traces.jsonl", alias="TRACE_FILE_PATH")
+    worker_metrics_host: str = Field("0.0.0.0", alias="WORKER_METRICS_HOST")
+    worker_metrics_port: int | None = Field(None, alias="WORKER_METRICS_PORT")
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
     @property
     def telegram_api_url(self) -> str:
-        return f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
+        return f"{self.telegram_api_base.rstrip('/')}/bot{self.telegram_bot_token}/sendMessage"
+
+    def redis_settings(self) -> "RedisSettings":
+        from arq.connections import RedisSettings
 
-    def redis_settings(self) -> RedisSettings:
         return RedisSettings(
             host=self.redis_host,
             port=self.redis_port,
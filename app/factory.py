@@ -1,50 +1,101 @@
 from __future__ import annotations
 
-import inspect
-from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
-from arq.connections import create_pool
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 
 from app.config import get_settings
 from app.routers.contact import router as contact_router
+from app.routers.health import router as health_router
+from app.routers.metrics import router as metrics_router
 from app.routers.pages import router as pages_router
-
-RedisPoolFactory = Callable[[], Awaitable[Any]]
+from app.routers.pages import templates, warm_up
+from app.services.admission import AdmissionController, AdmissionMiddleware
+from app.services.health import ReadinessProbe
+from app.services.metrics import MetricsMiddleware
+from app.services import tracing
+from app.services.preload import PreloadMiddleware
+from app.services.profiling import Profiler, ProfilingMiddleware
+from app.services.queue_monitor import BackpressurePolicy, QueueMonitor
+from app.services.redis_pool import RedisPoolFactory, RedisPoolManager
+from app.services.service_worker import DEFAULT_PRECACHE, ServiceWorkerScript
+from app.services.spam import SpamFilter
+from app.services.static_files import MemoryStaticFiles, install_reload_signal, remove_reload_signal
 
 
 def create_app(redis_pool_factory: RedisPoolFactory | None = None) -> FastAPI:
     """Application factory used by both uvicorn and the test suite."""
 
     settings = get_settings()
+    tracing.configure(settings)
     static_dir = Path(__file__).resolve().parent.parent / "static"
 
     async def default_redis_pool_factory() -> Any:
+        from arq.connections import create_pool
+
         return await create_pool(settings.redis_settings())
 
     factory: RedisPoolFactory = redis_pool_factory or default_redis_pool_factory
+    static_files = MemoryStaticFiles(static_dir, max_memory_bytes=settings.static_max_memory_file_bytes)
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        redis_pool = await factory()
-        app.state.redis = redis_pool
+        warm_up()
+        pool_manager = RedisPoolManager(
+            factory,
+            on_ready=lambda pool: setattr(app.state, "redis", pool),
+            attempts=settings.redis_connect_attempts,
+            backoff_initial=settings.redis_connect_backoff_seconds,
+            backoff_max=settings.redis_connect_backoff_max_seconds,
+            retry_interval=settings.redis_reconnect_interval_seconds,
+        )
+        app.state.redis_pool = pool_manager
+        pool_manager.start()
+        app.state.warmed_up = True
+        reload_on_sighup = install_reload_signal(static_files)
         try:
             yield
         finally:
-            close = getattr(redis_pool, "close", None)
-            if close is not None:
-                maybe_awaitable = close()
-                if inspect.isawaitable(maybe_awaitable):
-                    await maybe_awaitable
+            if reload_on_sighup:
+                remove_reload_signal()
+            await pool_manager.close()
 
     app = FastAPI(title=settings.project_name, lifespan=lifespan)
+    app.state.queue_monitor = QueueMonitor(sample_interval=settings.queue_sample_interval_seconds)
+    app.state.backpressure_policy = BackpressurePolicy.from_settings(settings)
+    app.state.static_files = static_files
+    app.state.service_worker = None
+    if settings.service_worker_enabled:
+        precache = DEFAULT_PRECACHE if settings.service_worker_precache is None else settings.service_worker_precache
+        app.state.service_worker = ServiceWorkerScript(templates.env, static_files, precache)
+    app.state.spam_filter = SpamFilter.from_settings(settings) if settings.spam_enabled else None
+    app.state.redis = None
+    app.state.redis_pool = None
+    app.state.warmed_up = False
+    app.state.readiness_probe = ReadinessProbe(
+        ttl=settings.health_cache_ttl_seconds,
+        timeout=settings.health_check_timeout_seconds,
+    )
     app.include_router(pages_router)
     app.include_router(contact_router, prefix="/api")
+    app.include_router(metrics_router)
+    app.include_router(health_router)
 
-    app.mount("/static", StaticFiles(directory=static_dir), name="static")
+    app.mount("/static", static_files, name="static")
+    if settings.preload_enabled:
+        app.add_middleware(
+            PreloadMiddleware,
+            env=templates.env,
+            routes=settings.preload_routes,
+            font_pattern=settings.preload_font_pattern,
+            early_hints=settings.early_hints_enabled,
+        )
+    if settings.profiling_enabled:
+        app.add_middleware(ProfilingMiddleware, profiler=Profiler.from_settings(settings))
+    if settings.admission_enabled:
+        app.add_middleware(AdmissionMiddleware, controller=AdmissionController.from_settings(settings))
+    app.add_middleware(MetricsMiddleware)
 
     return app
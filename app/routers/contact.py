@@ -1,33 +1,159 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from limits import RateLimitItemPerHour
+import json
+from typing import Any, AsyncIterator
 
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from app.config import get_settings
 from app.schemas import ContactRequest, ContactResponse
-from app.services.rate_limit import rate_limit_by_ip
-from app.services.telegram import send_telegram_message
-from app.workers import registry
+from app.services import tracing
+from app.services.metrics import ENQUEUE_DURATION
+from app.services.queue_monitor import queue_backpressure
+from app.services.rate_limit import rate_limit_by_ip, resolve_client_ip
+from app.services.spam import ACCEPT, SpamFilter, Submission
+from app.workers.jobs import SEND_TELEGRAM_MESSAGE
+from app.workers.registry import ENVELOPE_KWARG
 
 router = APIRouter(prefix="/contact", tags=["contact"])
 CONTACT_REQUESTS_PER_HOUR = 3
 
 contact_rate_limit = rate_limit_by_ip(
-    RateLimitItemPerHour(CONTACT_REQUESTS_PER_HOUR),
+    f"{CONTACT_REQUESTS_PER_HOUR}/hour",
     namespace="contact",
     detail="Too many contact requests from this address. Please try again later.",
 )
 
 
-@router.post("", response_model=ContactResponse, status_code=status.HTTP_202_ACCEPTED)
+async def contact_trace(response: Response) -> AsyncIterator[str]:
+    """Open a trace for the submission; it follows the job into the worker."""
+    trace_id = tracing.new_trace_id()
+    response.headers[tracing.TRACE_HEADER] = trace_id
+    with tracing.trace_context(trace_id):
+        yield trace_id
+
+
+async def job_queue(request: Request) -> Any:
+    """The ARQ pool, waiting briefly for it while it is still connecting in the background."""
+    state = request.app.state
+    redis_queue = getattr(state, "redis", None)
+    pool_manager = getattr(state, "redis_pool", None)
+    if redis_queue is None and pool_manager is not None:
+        await pool_manager.wait(get_settings().redis_ready_wait_seconds)
+        redis_queue = getattr(state, "redis", None)
+    if redis_queue is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Job queue unavailable.")
+    return redis_queue
+
+
+def _body_errors(errors: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [{**error, "loc": ("body", *error["loc"])} for error in errors]
+
+
+def parse_contact_request(body: bytes) -> ContactRequest:
+    """Validate a raw JSON body, reporting errors in FastAPI's request-body shape."""
+    if not body:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    try:
+        data = json.loads(body)
+    except json.JSONDecodeError as exc:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", exc.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": exc.msg},
+                }
+            ],
+            body=exc.doc,
+        ) from None
+    except UnicodeDecodeError:
+        # FastAPI's own body parsing answers undecodable bytes with this 400.
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="There was an error parsing the body"
+        ) from None
+    try:
+        return ContactRequest.model_validate(data)
+    except ValidationError as exc:
+        raise RequestValidationError(_body_errors(exc.errors(include_url=False)), body=data) from None
+
+
+def _body_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,  # HTTP_413_CONTENT_TOO_LARGE, renamed across Starlette versions
+        detail="Request body is too large.",
+    )
+
+
+async def read_limited_body(request: Request, max_bytes: int) -> bytes:
+    """Read the body, giving up as soon as it exceeds ``max_bytes``.
+
+    A declared ``Content-Length`` over the limit is rejected before any of the
+    body is read; otherwise chunks are counted as they arrive, so an oversized
+    chunked upload costs at most ``max_bytes`` plus one chunk of memory.
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise _body_too_large()
+    chunks: list[bytes] = []
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise _body_too_large()
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def contact_payload(request: Request) -> ContactRequest:
+    body = await read_limited_body(request, get_settings().contact_max_body_bytes)
+    with tracing.span("contact.validation"):
+        return parse_contact_request(body)
+
+
+@router.post(
+    "",
+    response_model=ContactResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ContactRequest.model_json_schema()}},
+        }
+    },
+)
 async def enqueue_contact_message(
-    payload: ContactRequest,
     request: Request,
+    trace_id: str = Depends(contact_trace),
+    # Shed load before the rate limit, so a 503 does not use up the sender's quota.
+    redis_queue: Any = Depends(job_queue),
+    backpressure: None = Depends(queue_backpressure),
     rate_limit_check: None = Depends(contact_rate_limit),
+    payload: ContactRequest = Depends(contact_payload),
 ) -> ContactResponse:
-    redis_queue = getattr(request.app.state, "redis", None)
-    if redis_queue is None:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Job queue unavailable.")
+    spam_filter: SpamFilter | None = getattr(request.app.state, "spam_filter", None)
+    if spam_filter is not None:
+        with tracing.span("contact.spam_check"):
+            verdict = spam_filter.evaluate(
+                Submission(
+                    name=payload.name,
+                    email=payload.email,
+                    message=payload.message,
+                    client_ip=resolve_client_ip(request),
+                    honeypot=payload.website,
+                    form_token=payload.form_token,
+                )
+            )
+        if verdict.action != ACCEPT:
+            return ContactResponse(queued=False)
 
-    job_name = registry.job_name(send_telegram_message)
-    await redis_queue.enqueue_job(job_name, payload.model_dump())
+    job_name = SEND_TELEGRAM_MESSAGE
+    with ENQUEUE_DURATION.labels(job_name).time(), tracing.span("contact.enqueue", job=job_name):
+        await redis_queue.enqueue_job(job_name, payload.model_dump(), **{ENVELOPE_KWARG: tracing.build_envelope()})
     return ContactResponse(queued=True)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+
+router = APIRouter(include_in_schema=False)
+
+NO_STORE = {"Cache-Control": "no-store"}
+
+
+@router.get("/healthz", name="healthz")
+async def healthz() -> JSONResponse:
+    """Liveness: the event loop answers; no I/O."""
+    return JSONResponse({"status": "ok"}, headers=NO_STORE)
+
+
+@router.get("/readyz", name="readyz")
+async def readyz(request: Request) -> JSONResponse:
+    report = await request.app.state.readiness_probe.check(request.app.state)
+    status_code = status.HTTP_200_OK if report["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE
+    return JSONResponse(report, status_code=status_code, headers=NO_STORE)
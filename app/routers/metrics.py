@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+
+from app.services.metrics import CONTENT_TYPE_LATEST, metrics
+
+router = APIRouter(include_in_schema=False)
+
+
+@router.get("/metrics", name="metrics")
+async def metrics_endpoint(request: Request) -> Response:
+    redis = getattr(request.app.state, "redis", None)
+    if redis is not None:
+        await request.app.state.queue_monitor.sample(redis)
+    return Response(metrics.render(), media_type=CONTENT_TYPE_LATEST)
@@ -1,40 +1,79 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.templating import Jinja2Templates
 
+from app.config import get_settings
 from app.services.legal_pages import get_legal_links, get_legal_page
+from app.services.metrics import TEMPLATE_RENDER_DURATION
+from app.services.sitemap import CachedDocument, get_sitemap_documents
 
 templates = Jinja2Templates(directory=str(Path(__file__).resolve().parent.parent / "templates"))
-STATIC_ROOT = Path(__file__).resolve().parent.parent.parent / "static"
-ROBOTS_PATH = STATIC_ROOT / "robots.txt"
-SITEMAP_PATH = STATIC_ROOT / "sitemap.xml"
 
 router = APIRouter(include_in_schema=False)
 
-LEGAL_LINKS = get_legal_links()
+
+def warm_up() -> None:
+    """Load legal content and compile every template before traffic arrives."""
+    get_legal_links()
+    for name in templates.env.list_templates():
+        templates.env.get_template(name)
+    _documents()
+
+
+def _documents() -> dict[str, CachedDocument]:
+    settings = get_settings()
+    return get_sitemap_documents(settings.site_url, settings.sitemap_max_urls, settings.site_home_updated_at)
+
+
+def render_template(request: Request, name: str, context: dict[str, Any]):
+    with TEMPLATE_RENDER_DURATION.labels(name).time():
+        return templates.TemplateResponse(request, name, context)
+
+
+def _form_token(request: Request) -> str:
+    spam_filter = getattr(request.app.state, "spam_filter", None)
+    return spam_filter.issue_form_token() if spam_filter is not None else ""
 
 
 @router.get("/", name="home")
 async def home(request: Request):
-    return templates.TemplateResponse(
+    return render_template(
         request,
         "home.html",
-        {"legal_links": LEGAL_LINKS},
+        {"legal_links": get_legal_links(), "form_token": _form_token(request)},
     )
 
 
 @router.get("/robots.txt", include_in_schema=False)
-async def robots_txt() -> FileResponse:
-    return FileResponse(ROBOTS_PATH, media_type="text/plain")
+async def robots_txt(request: Request) -> Response:
+    return _documents()["robots.txt"].response(request)
 
 
 @router.get("/sitemap.xml", include_in_schema=False)
-async def sitemap_xml() -> FileResponse:
-    return FileResponse(SITEMAP_PATH, media_type="application/xml")
+async def sitemap_xml(request: Request) -> Response:
+    return _documents()["sitemap.xml"].response(request)
+
+
+@router.get("/sitemap-{shard:int}.xml", include_in_schema=False)
+async def sitemap_shard(shard: int, request: Request) -> Response:
+    document = _documents().get(f"sitemap-{shard}.xml")
+    if document is None:
+        raise HTTPException(status_code=404, detail="Sitemap not found.")
+    return document.response(request)
+
+
+@router.get("/sw.js", name="service_worker", include_in_schema=False)
+async def service_worker(request: Request) -> Response:
+    script = getattr(request.app.state, "service_worker", None)
+    if script is None:
+        raise HTTPException(status_code=404, detail="Service worker disabled.")
+    page_paths = [request.app.url_path_for("home")]
+    page_paths += [request.app.url_path_for("legal-page", slug=link["slug"]) for link in get_legal_links()]
+    return script.document(page_paths).response(request)
 
 
 @router.get("/legal/{slug}", name="legal-page")
@@ -43,13 +82,14 @@ async def legal_page(slug: str, request: Request):
     if page is None:
         raise HTTPException(status_code=404, detail="Legal document not found.")
 
-    other_links = tuple(link for link in LEGAL_LINKS if link["slug"] != slug)
-    return templates.TemplateResponse(
+    legal_links = get_legal_links()
+    other_links = tuple(link for link in legal_links if link["slug"] != slug)
+    return render_template(
         request,
         "legal.html",
         {
             "page": page,
-            "legal_links": LEGAL_LINKS,
+            "legal_links": legal_links,
             "other_links": other_links,
         },
     )
@@ -9,6 +9,8 @@ class ContactRequest(BaseModel):
     name: str = Field(..., min_length=2, max_length=100)
     email: EmailStr
     message: str = Field(..., min_length=10, max_length=2000)
+    website: str = Field("", max_length=200, exclude=True, description="Honeypot; left empty by people.")
+    form_token: str = Field("", max_length=200, exclude=True, description="Token rendered with the contact form.")
 
 
 class ContactResponse(BaseModel):
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+import random
+import socket
+import sys
+
+from app.config import Settings, get_settings
+from app.supervisor import ProcessSupervisor
+
+logger = logging.getLogger(__name__)
+
+APP_IMPORT_STRING = "main:app"
+
+
+def select_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio"
+
+
+def select_http() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
+
+
+def resolve_worker_count(configured: int) -> int:
+    """Use the configured count, or one worker per CPU available to this process."""
+    if configured > 0:
+        return configured
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return max(os.cpu_count() or 1, 1)  # pragma: no cover - platforms without sched_getaffinity
+
+
+def supports_reuse_port() -> bool:
+    return hasattr(socket, "SO_REUSEPORT")
+
+
+def bind_socket(host: str, port: int, reuse_port: bool, backlog: int | None = None) -> socket.socket:
+    """Bind the listening socket; ``listen`` only when ``backlog`` is given.
+
+    Workers bind their own ``SO_REUSEPORT`` socket without listening: uvicorn
+    calls ``listen`` after the lifespan warm-up, so the kernel never routes a
+    connection to a worker that is still loading templates and content.
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    if backlog is not None:
+        sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def build_uvicorn_config(settings: Settings):
+    import uvicorn
+
+    max_requests = None
+    if settings.web_max_requests > 0:
+        max_requests = settings.web_max_requests + random.randint(0, max(settings.web_max_requests_jitter, 0))
+    return uvicorn.Config(
+        APP_IMPORT_STRING,
+        loop=select_loop(),
+        http=select_http(),
+        proxy_headers=True,
+        forwarded_allow_ips=settings.forwarded_allow_ips,
+        limit_max_requests=max_requests,
+        timeout_graceful_shutdown=int(settings.web_graceful_timeout),
+        backlog=settings.web_backlog,
+    )
+
+
+def serve_worker(shared_socket: socket.socket | None = None) -> None:
+    """Entry point of one pre-forked web worker."""
+    import uvicorn
+
+    settings = get_settings()
+    sock = shared_socket or bind_socket(settings.web_host, settings.web_port, reuse_port=True)
+    server = uvicorn.Server(build_uvicorn_config(settings))
+    server.run(sockets=[sock])
+
+
+def run_production(settings: Settings | None = None) -> int:
+    """Pre-fork web workers sharing one port and supervise them until SIGTERM."""
+    settings = settings or get_settings()
+    workers = resolve_worker_count(settings.web_workers)
+    if workers > 1 and settings.spam_enabled and not settings.spam_token_secret:
+        # Each worker would sign form tokens with its own random secret, so a
+        # token issued by one worker fails on the others.
+        logger.error("SPAM_TOKEN_SECRET must be set to a shared value when running %s web workers.", workers)
+        return 1
+    shared_socket = None
+    if not supports_reuse_port():
+        shared_socket = bind_socket(settings.web_host, settings.web_port, reuse_port=False, backlog=settings.web_backlog)
+    logger.info(
+        "Starting %s web workers on %s:%s (loop=%s, http=%s).",
+        workers,
+        settings.web_host,
+        settings.web_port,
+        select_loop(),
+        select_http(),
+    )
+    supervisor = ProcessSupervisor(
+        serve_worker,
+        processes=workers,
+        args=lambda index: (shared_socket,),
+        name="web",
+        graceful_timeout=settings.web_graceful_timeout + 5,
+        # Workers reload their in-memory static tree on SIGHUP.
+        forward_sighup=True,
+    )
+    return supervisor.run()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(run_production())
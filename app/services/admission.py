@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from starlette.responses import JSONResponse
+
+from app.config import Settings
+from app.services.metrics import metrics
+
+ADMISSION_IN_FLIGHT = metrics.gauge(
+    "admission_in_flight_requests",
+    "Requests currently admitted per route class.",
+    ("route_class",),
+)
+ADMISSION_REJECTIONS = metrics.counter(
+    "admission_rejections_total",
+    "Requests shed with 503 by route class and reason.",
+    ("route_class", "reason"),
+)
+
+EXEMPT_PATHS = frozenset({"/metrics", "/healthz", "/readyz"})
+
+
+class Overloaded(Exception):
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+class ClassLimiter:
+    """Concurrency limit with a short FIFO wait queue and CoDel-style shedding.
+
+    Requests beyond ``max_in_flight`` wait at most ``queue_timeout`` seconds in a
+    queue of ``max_queue`` slots. When the time spent queued stays above
+    ``codel_target`` for a whole ``codel_interval`` the limiter enters a dropping
+    state and stops queueing: requests are admitted only while a slot is free,
+    until a request is dequeued under the target again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_in_flight: int,
+        max_queue: int,
+        queue_timeout: float,
+        codel_target: float,
+        codel_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.codel_target = codel_target
+        self.codel_interval = codel_interval
+        self._clock = clock
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._first_above: float = 0.0
+        self._dropping = False
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    @property
+    def dropping(self) -> bool:
+        return self._dropping
+
+    @property
+    def saturated(self) -> bool:
+        return self._dropping or self.queued > 0
+
+    def _set_in_flight(self, value: int) -> None:
+        self._in_flight = value
+        ADMISSION_IN_FLIGHT.labels(self.name).set(value)
+
+    def _observe_sojourn(self, sojourn: float) -> None:
+        now = self._clock()
+        if sojourn < self.codel_target:
+            self._first_above = 0.0
+            self._dropping = False
+        elif not self._first_above:
+            self._first_above = now + self.codel_interval
+        elif now >= self._first_above:
+            self._dropping = True
+
+    async def acquire(self) -> None:
+        if self._in_flight < self.max_in_flight:
+            # A free slot means the queue is empty: a zero sojourn ends any dropping state.
+            self._observe_sojourn(0.0)
+            self._set_in_flight(self._in_flight + 1)
+            return
+        if self._dropping:
+            raise Overloaded("codel")
+        if self.queued >= self.max_queue:
+            raise Overloaded("queue_full")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        enqueued_at = self._clock()
+        try:
+            done, _ = await asyncio.wait((waiter,), timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            if waiter.done():
+                self.release()
+            else:
+                waiter.cancel()
+            raise
+        self._observe_sojourn(self._clock() - enqueued_at)
+        if not done:
+            waiter.cancel()
+            raise Overloaded("timeout")
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Hand the slot straight to the oldest waiter; in-flight count is unchanged.
+                waiter.set_result(None)
+                return
+        self._set_in_flight(self._in_flight - 1)
+
+
+def classify(path: str) -> Optional[str]:
+    if path in EXEMPT_PATHS:
+        return None
+    if path.startswith("/static/"):
+        return "static"
+    if path.startswith("/api/"):
+        return "api"
+    return "pages"
+
+
+class AdmissionController:
+    """Per-route-class limiters; the API class is shed first while pages are saturated."""
+
+    def __init__(self, limiters: Dict[str, ClassLimiter], retry_after: int = 1) -> None:
+        self.limiters = limiters
+        self.retry_after = retry_after
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "AdmissionController":
+        limits = {
+            "pages": settings.admission_pages_limit,
+            "static": settings.admission_static_limit,
+            "api": settings.admission_api_limit,
+        }
+        limiters = {
+            name: ClassLimiter(
+                name,
+                max_in_flight=limit,
+                max_queue=settings.admission_queue_size,
+                queue_timeout=settings.admission_queue_timeout_seconds,
+                codel_target=settings.admission_codel_target_seconds,
+                codel_interval=settings.admission_codel_interval_seconds,
+            )
+            for name, limit in limits.items()
+        }
+        return cls(limiters, retry_after=math.ceil(settings.admission_retry_after_seconds))
+
+    async def admit(self, route_class: str) -> ClassLimiter:
+        limiter = self.limiters[route_class]
+        if route_class == "api" and self.limiters["pages"].saturated:
+            raise Overloaded("priority")
+        await limiter.acquire()
+        return limiter
+
+
+class AdmissionMiddleware:
+    """Fail fast with 503 and ``Retry-After`` instead of queueing without bound."""
+
+    def __init__(self, app, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send) -> None:
+        route_class = classify(scope["path"]) if scope["type"] == "http" else None
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            limiter = await self.controller.admit(route_class)
+        except Overloaded as exc:
+            ADMISSION_REJECTIONS.labels(route_class, exc.reason).inc()
+            response = JSONResponse(
+                {"detail": "Service is temporarily overloaded. Please retry shortly."},
+                status_code=503,
+                headers={"Retry-After": str(self.controller.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionMiddleware",
+    "ClassLimiter",
+    "Overloaded",
+    "classify",
+]
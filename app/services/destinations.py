@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Protocol, Sequence
+
+import httpx
+from arq import Retry
+
+from app.config import Settings
+from app.services import tracing
+from app.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+DELIVERED_KEY_PREFIX = "contact:delivered:"
+
+NOTIFICATION_DELIVERIES = metrics.counter(
+    "notification_deliveries_total",
+    "Contact notification attempts by destination and outcome.",
+    ("destination", "outcome"),
+)
+
+
+class DestinationThrottled(Exception):
+    """The destination asked us to come back after ``retry_after`` seconds."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"throttled for {retry_after}s")
+        self.retry_after = retry_after
+
+
+class Destination(Protocol):
+    name: str
+
+    async def deliver(self, client: httpx.AsyncClient, payload: Mapping[str, Any]) -> None: ...
+
+
+DestinationFactory = Callable[[Settings, Dict[str, Any]], Destination]
+
+
+def retry_after(response: httpx.Response, default: float) -> float:
+    """Read the back-off a destination asks for on 429, from a JSON body or the header."""
+    try:
+        value = response.json().get("parameters", {}).get("retry_after")
+    except (ValueError, AttributeError):
+        value = None
+    if value is None:
+        value = response.headers.get("retry-after")
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+def check_response(response: httpx.Response, default_retry_after: float) -> None:
+    if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+        raise DestinationThrottled(retry_after(response, default_retry_after))
+    response.raise_for_status()
+
+
+class DestinationRegistry:
+    """Destination kinds by ``type``, so new sinks plug in without touching the job."""
+
+    def __init__(self) -> None:
+        self._factories: Dict[str, DestinationFactory] = {}
+
+    def register(self, kind: str) -> Callable[[DestinationFactory], DestinationFactory]:
+        def decorator(factory: DestinationFactory) -> DestinationFactory:
+            if kind in self._factories:
+                raise ValueError(f"Destination type '{kind}' already registered.")
+            self._factories[kind] = factory
+            return factory
+
+        return decorator
+
+    def build(self, settings: Settings) -> List[Destination]:
+        """Destinations from ``NOTIFICATION_DESTINATIONS``, or the single legacy Telegram chat."""
+        specs = settings.notification_destinations
+        if specs is None:
+            specs = [{"type": "telegram", "name": "telegram", "chat_id": settings.telegram_chat_id}]
+        destinations = []
+        for spec in specs:
+            kind = spec.get("type")
+            if kind not in self._factories:
+                raise ValueError(f"Unknown notification destination type '{kind}'.")
+            destinations.append(self._factories[kind](settings, spec))
+        names = [destination.name for destination in destinations]
+        if len(set(names)) != len(names):
+            raise ValueError("Notification destination names must be unique.")
+        return destinations
+
+
+destination_registry = DestinationRegistry()
+
+
+@dataclass(frozen=True)
+class WebhookDestination:
+    """POST the submission as JSON, signed with ``X-Webhook-Signature`` when a secret is set."""
+
+    name: str
+    url: str
+    secret: str | None = None
+    default_retry_after: float = 1.0
+
+    async def deliver(self, client: httpx.AsyncClient, payload: Mapping[str, Any]) -> None:
+        body = json.dumps(dict(payload), separators=(",", ":")).encode()
+        headers = {"Content-Type": "application/json"}
+        if self.secret:
+            signature = hmac.new(self.secret.encode(), body, hashlib.sha256).hexdigest()
+            headers["X-Webhook-Signature"] = f"sha256={signature}"
+        with tracing.span("webhook.post", destination=self.name) as span:
+            response = await client.post(self.url, content=body, headers=headers)
+            span.attributes["status"] = response.status_code
+        check_response(response, self.default_retry_after)
+
+
+@destination_registry.register("webhook")
+def _webhook(settings: Settings, spec: Dict[str, Any]) -> WebhookDestination:
+    return WebhookDestination(
+        name=spec.get("name", "webhook"),
+        url=spec["url"],
+        secret=spec.get("secret"),
+        default_retry_after=settings.telegram_default_retry_after,
+    )
+
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+async def fan_out(
+    ctx: Dict[str, Any],
+    destinations: Sequence[Destination],
+    payload: Mapping[str, Any],
+    concurrency: int = 4,
+    dedupe_ttl: int = 86_400,
+    default_retry_after: float = 1.0,
+) -> None:
+    """Deliver ``payload`` to every destination at most ``concurrency`` at a time.
+
+    Each success and each permanent failure is recorded in a Redis set keyed by
+    the ARQ job id, so when a throttled or failing destination makes the job
+    retry, the destinations that are already settled are skipped. Transient
+    failures (429, 5xx, transport errors) raise ``Retry``; anything else is
+    re-raised once every destination has had its turn.
+    """
+    redis = ctx.get("redis")
+    job_id = ctx.get("job_id")
+    key = f"{DELIVERED_KEY_PREFIX}{job_id}" if redis is not None and job_id else None
+    delivered: set[str] = set()
+    if key is not None:
+        delivered = {member.decode() if isinstance(member, bytes) else member for member in await redis.smembers(key)}
+    client: httpx.AsyncClient = ctx["http_client"]
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def settle(destination: Destination) -> None:
+        # A failure to record must not turn a completed send into an error,
+        # which would invite a duplicate on retry.
+        if key is None:
+            return
+        try:
+            await redis.sadd(key, destination.name)
+            await redis.expire(key, dedupe_ttl)
+        except Exception as exc:
+            logger.warning("Could not record delivery state for %s: %s", destination.name, exc)
+
+    async def deliver(destination: Destination) -> None:
+        if destination.name in delivered:
+            NOTIFICATION_DELIVERIES.labels(destination.name, "skipped").inc()
+            return
+        async with semaphore:
+            await destination.deliver(client, payload)
+        await settle(destination)
+        NOTIFICATION_DELIVERIES.labels(destination.name, "delivered").inc()
+
+    results = await asyncio.gather(*(deliver(destination) for destination in destinations), return_exceptions=True)
+
+    defer: float | None = None
+    permanent: BaseException | None = None
+    for destination, result in zip(destinations, results):
+        if not isinstance(result, BaseException):
+            continue
+        if isinstance(result, DestinationThrottled):
+            defer = max(defer or 0.0, result.retry_after)
+            NOTIFICATION_DELIVERIES.labels(destination.name, "retry").inc()
+        elif _is_transient(result):
+            defer = max(defer or 0.0, default_retry_after)
+            NOTIFICATION_DELIVERIES.labels(destination.name, "retry").inc()
+            logger.warning("Delivery to %s failed, will retry: %s", destination.name, result)
+        else:
+            permanent = permanent or result
+            NOTIFICATION_DELIVERIES.labels(destination.name, "failed").inc()
+            logger.error("Delivery to %s failed permanently: %s", destination.name, result)
+            # Settled as well, so a retry caused by another destination does not send it again.
+            await settle(destination)
+    if defer is not None:
+        raise Retry(defer=defer)
+    if permanent is not None:
+        raise permanent
+
+
+__all__ = [
+    "Destination",
+    "DestinationRegistry",
+    "DestinationThrottled",
+    "WebhookDestination",
+    "check_response",
+    "destination_registry",
+    "fan_out",
+    "retry_after",
+]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, List
+
+from app.services.legal_pages import legal_content_loaded
+from app.services.rate_limit import get_rate_limit_service
+from app.workers.jobs import HEALTH_CHECK_KEY as WORKER_HEARTBEAT_KEY
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    name: str
+    ok: bool
+    latency_ms: float
+    detail: str | None = None
+    required: bool = True
+
+
+async def _timed(name: str, probe: Callable[[], Awaitable[Any]], timeout: float, required: bool = True) -> CheckResult:
+    start = time.perf_counter()
+    try:
+        ok = bool(await asyncio.wait_for(probe(), timeout))
+        detail = None
+    except asyncio.TimeoutError:
+        ok, detail = False, "timeout"
+    except Exception as exc:
+        ok, detail = False, f"{type(exc).__name__}: {exc}"
+    return CheckResult(name, ok, round((time.perf_counter() - start) * 1000, 3), detail, required)
+
+
+def _static(name: str, ok: bool, detail: str) -> CheckResult:
+    return CheckResult(name, ok, 0.0, None if ok else detail)
+
+
+class ReadinessProbe:
+    """Run dependency checks at most once per ``ttl`` seconds, however many probes arrive.
+
+    The worker heartbeat is reported but never fails readiness: a web process
+    without workers can still accept submissions, which simply queue up.
+    """
+
+    def __init__(self, ttl: float = 2.0, timeout: float = 1.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self.timeout = timeout
+        self._clock = clock
+        self._cached: Dict[str, Any] | None = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _run_checks(self, state: Any) -> List[CheckResult]:
+        results = [
+            _static("warm_up", getattr(state, "warmed_up", False), "lifespan warm-up in progress"),
+            _static("legal_content", legal_content_loaded(), "legal content not loaded"),
+        ]
+        redis = getattr(state, "redis", None)
+        if redis is None:
+            pool_manager = getattr(state, "redis_pool", None)
+            detail = pool_manager.detail if pool_manager is not None else "job queue pool unavailable"
+            results.append(_static("redis", False, detail))
+        else:
+            results.append(await _timed("redis", redis.ping, self.timeout))
+        results.append(await _timed("rate_limit_storage", self._check_rate_limit_storage, self.timeout))
+        if redis is not None:
+            results.append(
+                await _timed("worker_heartbeat", lambda: redis.exists(WORKER_HEARTBEAT_KEY), self.timeout, required=False)
+            )
+        return results
+
+    @staticmethod
+    async def _check_rate_limit_storage() -> bool:
+        service = await get_rate_limit_service()
+        return await service.storage.check()
+
+    async def check(self, state: Any) -> Dict[str, Any]:
+        if self._cached is not None and self._clock() < self._expires_at:
+            return self._cached
+        async with self._lock:
+            if self._cached is not None and self._clock() < self._expires_at:
+                return self._cached
+            results = await self._run_checks(state)
+            self._cached = {
+                "ready": all(result.ok for result in results if result.required),
+                "checks": {result.name: _describe(result) for result in results},
+            }
+            self._expires_at = self._clock() + self.ttl
+            return self._cached
+
+
+def _describe(result: CheckResult) -> Dict[str, Any]:
+    description = asdict(result)
+    del description["name"]
+    if description["detail"] is None:
+        del description["detail"]
+    return description
+
+
+__all__ = ["CheckResult", "ReadinessProbe", "WORKER_HEARTBEAT_KEY"]
@@ -16,6 +16,11 @@ def get_legal_page(slug: str) -> LegalPageModel | None:
     return pages.get(slug)
 
 
+def legal_content_loaded() -> bool:
+    return _pages_by_slug.cache_info().currsize > 0
+
+
+@lru_cache()
 def get_legal_links() -> tuple[dict[str, str], ...]:
     content: LegalContent = load_legal_content()
     pages = _pages_by_slug()
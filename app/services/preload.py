@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import fnmatch
+import posixpath
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Tuple
+
+from jinja2 import Environment, meta
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Match
+
+STATIC_ROOT = Path(__file__).resolve().parent.parent.parent / "static"
+STATIC_PREFIX = "/static/"
+EARLY_HINT = "http.response.early_hint"
+
+_STATIC_URL = r"\{\{\s*url_for\(\s*'static'\s*,\s*path\s*=\s*'([^']+)'\s*\)\s*\}\}"
+_STYLESHEET = re.compile(r"<link[^>]*rel=\"stylesheet\"[^>]*href=\"" + _STATIC_URL)
+_SCRIPT = re.compile(r"<script[^>]*src=\"" + _STATIC_URL)
+_CSS_URL = re.compile(r"url\(\s*['\"]?([^'\")]+)['\"]?\s*\)")
+
+
+@dataclass(frozen=True)
+class PreloadHint:
+    path: str
+    as_: str
+    type: str | None = None
+    crossorigin: bool = False
+
+    def link(self) -> str:
+        value = f"<{STATIC_PREFIX}{self.path}>; rel=preload; as={self.as_}"
+        if self.type:
+            value += f'; type="{self.type}"'
+        if self.crossorigin:
+            # Fonts are always fetched in CORS mode; without this the preload is wasted.
+            value += "; crossorigin"
+        return value
+
+
+def _template_sources(env: Environment, name: str) -> List[str]:
+    sources: List[str] = []
+    pending, seen = [name], set()
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        source = env.loader.get_source(env, current)[0]  # type: ignore[union-attr]
+        sources.append(source)
+        pending.extend(ref for ref in meta.find_referenced_templates(env.parse(source)) if ref)
+    return sources
+
+
+def _stylesheet_fonts(stylesheet: str, static_root: Path, font_pattern: str) -> List[str]:
+    path = static_root / stylesheet
+    if not path.is_file():
+        return []
+    fonts = []
+    base = posixpath.dirname(stylesheet)
+    for reference in _CSS_URL.findall(path.read_text(encoding="utf-8")):
+        resolved = posixpath.normpath(posixpath.join(base, reference.split("?", 1)[0].split("#", 1)[0]))
+        if fnmatch.fnmatch(resolved, font_pattern) and resolved not in fonts:
+            fonts.append(resolved)
+    return fonts
+
+
+def extract_hints(
+    env: Environment, template: str, font_pattern: str, static_root: Path = STATIC_ROOT
+) -> Tuple[PreloadHint, ...]:
+    """Critical subresources of ``template`` and the templates it extends or includes.
+
+    Stylesheets come first, then the fonts they declare that match
+    ``font_pattern``, then scripts, mirroring the order the browser needs them.
+    """
+    sources = _template_sources(env, template)
+    stylesheets = [path for source in reversed(sources) for path in _STYLESHEET.findall(source)]
+    scripts = [path for source in reversed(sources) for path in _SCRIPT.findall(source)]
+    hints: Dict[str, PreloadHint] = {}
+    for stylesheet in stylesheets:
+        hints.setdefault(stylesheet, PreloadHint(stylesheet, "style"))
+    for stylesheet in stylesheets:
+        for font in _stylesheet_fonts(stylesheet, static_root, font_pattern):
+            hints.setdefault(font, PreloadHint(font, "font", "font/woff2", crossorigin=True))
+    for script in scripts:
+        hints.setdefault(script, PreloadHint(script, "script"))
+    return tuple(hints.values())
+
+
+def route_hints(
+    env: Environment, routes: Mapping[str, str], font_pattern: str
+) -> Dict[str, Tuple[PreloadHint, ...]]:
+    """Hints per route name for the configured ``{route name: template}`` pairs."""
+    return {route: extract_hints(env, template, font_pattern) for route, template in routes.items()}
+
+
+class PreloadMiddleware:
+    """Announce a page's critical subresources as ``Link: rel=preload``.
+
+    Templates are parsed once, when Starlette builds the middleware stack at
+    startup. When the server offers the ``http.response.early_hint`` extension
+    the same links are sent as ``103 Early Hints`` before the endpoint renders.
+    """
+
+    def __init__(
+        self,
+        app,
+        env: Environment,
+        routes: Mapping[str, str],
+        font_pattern: str = "fonts/*.woff2",
+        early_hints: bool = True,
+    ) -> None:
+        self.app = app
+        self.early_hints = early_hints
+        self.links = {
+            route: [hint.link() for hint in hints] for route, hints in route_hints(env, routes, font_pattern).items() if hints
+        }
+
+    def _route_name(self, scope) -> str | None:
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match is Match.FULL:
+                return getattr(route, "name", None)
+        return None
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        links = self.links.get(self._route_name(scope) or "")
+        if not links:
+            await self.app(scope, receive, send)
+            return
+
+        if self.early_hints and EARLY_HINT in scope.get("extensions", {}):
+            await send({"type": EARLY_HINT, "links": [link.encode("latin-1") for link in links]})
+
+        async def send_with_links(message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                if headers.get("content-type", "").startswith("text/html"):
+                    headers.append("Link", ", ".join(links))
+            await send(message)
+
+        await self.app(scope, receive, send_with_links)
+
+
+__all__ = ["PreloadHint", "PreloadMiddleware", "extract_hints", "route_hints"]
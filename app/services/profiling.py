@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+
+from app.config import Settings
+from app.services.metrics import route_name
+
+PROFILE_HEADER = "x-profile-token"
+_PROFILE_HEADER_KEY = PROFILE_HEADER.encode()
+
+
+def _collapse(frame: FrameType | None) -> str:
+    names = []
+    while frame is not None:
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler(threading.Thread):
+    """Sample one thread's Python stack at a fixed interval and write collapsed stacks.
+
+    The output (``frame;frame;frame count`` per line) feeds straight into
+    ``flamegraph.pl`` or speedscope. Sampling the event-loop thread captures
+    every task interleaved with the profiled request, which is usually what
+    explains a latency spike.
+    """
+
+    def __init__(self, target_thread_id: int, interval: float) -> None:
+        super().__init__(name="stack-sampler", daemon=True)
+        self.target_thread_id = target_thread_id
+        self.interval = interval
+        self.output_path: Path | None = None
+        self.samples: Counter[str] = Counter()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread_id)
+            if frame is not None:
+                self.samples[_collapse(frame)] += 1
+        assert self.output_path is not None
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        lines = (f"{stack} {count}\n" for stack, count in self.samples.most_common())
+        self.output_path.write_text("".join(lines), encoding="utf-8")
+
+    def stop(self, output_path: Path) -> None:
+        """Signal the sampler; the profile is written from the sampler thread."""
+        self.output_path = output_path
+        self._stopped.set()
+
+
+def sign_profile_token(secret: str, ttl_seconds: int = 300, now: float | None = None) -> str:
+    """Build an ``X-Profile-Token`` value valid for ``ttl_seconds``."""
+    expires = int((now if now is not None else time.time()) + ttl_seconds)
+    signature = hmac.new(secret.encode(), str(expires).encode(), hashlib.sha256).hexdigest()
+    return f"{expires}.{signature}"
+
+
+class Profiler:
+    """Decide which requests or jobs to profile and run at most one sampler at a time."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        interval: float,
+        sample_rate: float = 0.0,
+        secret: str | None = None,
+    ) -> None:
+        self.output_dir = output_dir
+        self.interval = interval
+        self.sample_rate = sample_rate
+        self.secret = secret
+        self._active: StackSampler | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "Profiler":
+        return cls(
+            output_dir=Path(settings.profiling_output_dir),
+            interval=settings.profiling_interval_seconds,
+            sample_rate=settings.profiling_sample_rate,
+            secret=settings.profiling_secret,
+        )
+
+    def verify_token(self, token: str | None) -> bool:
+        if not token or not self.secret:
+            return False
+        expires, _, signature = token.partition(".")
+        if not expires.isdigit() or int(expires) < time.time():
+            return False
+        expected = hmac.new(self.secret.encode(), expires.encode(), hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature)
+
+    def should_profile(self, token: str | None = None) -> bool:
+        return self.verify_token(token) or (self.sample_rate > 0 and random.random() < self.sample_rate)
+
+    def start(self) -> StackSampler | None:
+        """Start sampling the calling thread unless a profile is already running."""
+        if self._active is not None and self._active.is_alive():
+            return None
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        sampler.start()
+        self._active = sampler
+        return sampler
+
+    def finish(self, sampler: StackSampler, label: str) -> Path:
+        safe_label = "".join(char if char.isalnum() or char in "-_" else "_" for char in label)
+        path = self.output_dir / f"{int(time.time())}-{safe_label}-{uuid.uuid4().hex[:8]}.collapsed"
+        sampler.stop(path)
+        return path
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests selected by signed header or sampling rate.
+
+    Only installed when ``PROFILING_ENABLED`` is set, so it costs nothing otherwise.
+    """
+
+    def __init__(self, app, profiler: Profiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = None
+        for key, value in scope["headers"]:
+            if key == _PROFILE_HEADER_KEY:
+                token = value.decode("latin-1")
+                break
+
+        sampler = self.profiler.start() if self.profiler.should_profile(token) else None
+        if sampler is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.profiler.finish(sampler, route_name(scope))
+
+
+__all__ = [
+    "PROFILE_HEADER",
+    "Profiler",
+    "ProfilingMiddleware",
+    "StackSampler",
+    "sign_profile_token",
+]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from fastapi import HTTPException, Request, status
+
+from app.config import Settings
+from app.services.metrics import metrics
+from app.workers.jobs import QUEUE_NAME
+
+logger = logging.getLogger(__name__)
+
+QUEUE_DEPTH = metrics.gauge("arq_queue_depth", "Jobs waiting or running in the ARQ queue.")
+QUEUE_OLDEST_AGE = metrics.gauge(
+    "arq_queue_oldest_job_age_seconds",
+    "Age of the oldest job that is due in the ARQ queue (worker lag).",
+)
+QUEUE_BACKPRESSURE = metrics.counter(
+    "contact_backpressure_total",
+    "Contact submissions delayed or rejected because the queue is behind.",
+    ("action",),
+)
+
+
+@dataclass(frozen=True)
+class QueueSnapshot:
+    depth: int = 0
+    oldest_age: float = 0.0
+    sampled_at: float = 0.0
+
+
+class QueueMonitor:
+    """Sample the ARQ queue at most once per ``sample_interval`` and cache the result.
+
+    Depth is the sorted-set cardinality and lag is the age of the lowest score
+    (jobs deferred into the future count as zero lag). Redis errors keep the last
+    snapshot so a flaky connection never blocks submissions on its own.
+    """
+
+    def __init__(
+        self,
+        queue_name: str = QUEUE_NAME,
+        sample_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.queue_name = queue_name
+        self.sample_interval = sample_interval
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._snapshot: QueueSnapshot | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def snapshot(self) -> QueueSnapshot:
+        return self._snapshot or QueueSnapshot()
+
+    def _fresh(self) -> bool:
+        return self._snapshot is not None and self._clock() - self._snapshot.sampled_at < self.sample_interval
+
+    async def sample(self, redis: Any) -> QueueSnapshot:
+        if self._fresh():
+            return self.snapshot
+        async with self._lock:
+            if self._fresh():
+                return self.snapshot
+            try:
+                depth = await redis.zcard(self.queue_name)
+                oldest = await redis.zrange(self.queue_name, 0, 0, withscores=True)
+            except Exception:
+                logger.warning("Failed to sample queue %s.", self.queue_name, exc_info=True)
+                self._snapshot = QueueSnapshot(self.snapshot.depth, self.snapshot.oldest_age, self._clock())
+                return self.snapshot
+            oldest_age = 0.0
+            if oldest:
+                oldest_age = max(self._wall_clock() - oldest[0][1] / 1000, 0.0)
+            self._snapshot = QueueSnapshot(int(depth), round(oldest_age, 3), self._clock())
+            QUEUE_DEPTH.set(self._snapshot.depth)
+            QUEUE_OLDEST_AGE.set(self._snapshot.oldest_age)
+            return self._snapshot
+
+
+@dataclass(frozen=True)
+class BackpressurePolicy:
+    soft_depth: int
+    hard_depth: int
+    soft_age: float
+    hard_age: float
+    max_delay: float
+    retry_after: float
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "BackpressurePolicy":
+        return cls(
+            soft_depth=settings.queue_soft_depth,
+            hard_depth=settings.queue_hard_depth,
+            soft_age=settings.queue_soft_age_seconds,
+            hard_age=settings.queue_hard_age_seconds,
+            max_delay=settings.queue_soft_delay_seconds,
+            retry_after=settings.queue_retry_after_seconds,
+        )
+
+    def rejects(self, snapshot: QueueSnapshot) -> bool:
+        return snapshot.depth >= self.hard_depth or snapshot.oldest_age >= self.hard_age
+
+    def delay(self, snapshot: QueueSnapshot) -> float:
+        """Delay growing linearly from the soft towards the hard threshold."""
+        pressure = max(
+            _progress(snapshot.depth, self.soft_depth, self.hard_depth),
+            _progress(snapshot.oldest_age, self.soft_age, self.hard_age),
+        )
+        return round(self.max_delay * pressure, 3)
+
+
+def _progress(value: float, soft: float, hard: float) -> float:
+    if value < soft:
+        return 0.0
+    if hard <= soft:
+        return 1.0
+    return min((value - soft) / (hard - soft), 1.0)
+
+
+async def queue_backpressure(request: Request) -> None:
+    """Slow submissions down past the soft thresholds and reject them past the hard ones."""
+    redis = getattr(request.app.state, "redis", None)
+    monitor: QueueMonitor | None = getattr(request.app.state, "queue_monitor", None)
+    if redis is None or monitor is None:
+        return
+    policy: BackpressurePolicy = request.app.state.backpressure_policy
+    snapshot = await monitor.sample(redis)
+    if policy.rejects(snapshot):
+        QUEUE_BACKPRESSURE.labels("rejected").inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="We are processing a backlog of messages. Please try again later.",
+            headers={"Retry-After": str(math.ceil(policy.retry_after))},
+        )
+    delay = policy.delay(snapshot)
+    if delay > 0:
+        QUEUE_BACKPRESSURE.labels("delayed").inc()
+        await asyncio.sleep(delay)
+
+
+__all__ = [
+    "BackpressurePolicy",
+    "QueueMonitor",
+    "QueueSnapshot",
+    "queue_backpressure",
+]
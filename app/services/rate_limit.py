@@ -1,33 +1,45 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Awaitable, Callable, Optional
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Union
 
 from fastapi import HTTPException, Request, status
-from limits import RateLimitItem
-from limits.aio.storage import MemoryStorage, RedisStorage, Storage  # type: ignore[attr-defined]
-from limits.aio.strategies import FixedWindowRateLimiter  # type: ignore[attr-defined]
 
 from app.config import get_settings
+from app.services import tracing
+from app.services.metrics import RATE_LIMIT_DECISION_DURATION
 
+if TYPE_CHECKING:
+    from limits import RateLimitItem
+    from limits.aio.storage import Storage
+
+# `limits` imports every storage backend module on import, so it is loaded on first use.
 Identifier = Callable[[Request], str]
 DependencyCallable = Callable[[Request], Awaitable[None]]
+RateLimitSpec = Union["RateLimitItem", str]
+
+
+def _fixed_window(storage: "Storage"):
+    from limits.aio.strategies import FixedWindowRateLimiter  # type: ignore[attr-defined]
+
+    return FixedWindowRateLimiter(storage)
 
 
 class RateLimitService:
-    def __init__(self, storage: Storage):
+    def __init__(self, storage: "Storage"):
         self._storage = storage
-        self._strategy = FixedWindowRateLimiter(storage)
+        self._strategy = _fixed_window(storage)
 
     @property
-    def storage(self) -> Storage:
+    def storage(self) -> "Storage":
         return self._storage
 
-    def set_storage(self, storage: Storage) -> None:
+    def set_storage(self, storage: "Storage") -> None:
         self._storage = storage
-        self._strategy = FixedWindowRateLimiter(storage)
+        self._strategy = _fixed_window(storage)
 
-    async def hit(self, item: RateLimitItem, namespace: str, key: str) -> bool:
+    async def hit(self, item: "RateLimitItem", namespace: str, key: str) -> bool:
         return await self._strategy.hit(item, namespace, key)
 
 
@@ -35,7 +47,9 @@ _rate_limit_service: RateLimitService | None = None
 _rate_limit_service_lock = asyncio.Lock()
 
 
-def _build_redis_storage() -> Storage:
+def _build_redis_storage() -> "Storage":
+    from limits.aio.storage import RedisStorage  # type: ignore[attr-defined]
+
     settings = get_settings()
     password = getattr(settings, "redis_password", None) or ""
     credentials = f":{password}@" if password else ""
@@ -55,9 +69,11 @@ async def get_rate_limit_service() -> RateLimitService:
     return _rate_limit_service
 
 
-def reset_rate_limit_service(storage: Optional[Storage] = None) -> None:
+def reset_rate_limit_service(storage: Optional["Storage"] = None) -> None:
     global _rate_limit_service
     if storage is None:
+        from limits.aio.storage import MemoryStorage  # type: ignore[attr-defined]
+
         storage = MemoryStorage()
     if _rate_limit_service is None:
         _rate_limit_service = RateLimitService(storage)
@@ -77,19 +93,38 @@ def resolve_client_ip(request: Request) -> str:
     return "unknown"
 
 
+def _resolve_item(item: RateLimitSpec) -> "RateLimitItem":
+    if isinstance(item, str):
+        from limits import parse
+
+        return parse(item)
+    return item
+
+
 def rate_limit(
-    item: RateLimitItem,
+    item: RateLimitSpec,
     namespace: str = "default",
     identifier: Identifier | None = None,
     detail: str | None = None,
 ) -> DependencyCallable:
+    """Build a dependency enforcing ``item``; strings such as ``"3/hour"`` are parsed on first use."""
     resolved_identifier = identifier or resolve_client_ip
     error_detail = detail or "Too many requests."
+    resolved_item: "RateLimitItem | None" = None
 
     async def dependency(request: Request) -> None:
+        nonlocal resolved_item
+        if resolved_item is None:
+            resolved_item = _resolve_item(item)
+        start_wall = time.time()
+        start = time.perf_counter()
         service = await get_rate_limit_service()
         key = resolved_identifier(request)
-        allowed = await service.hit(item, namespace, key)
+        allowed = await service.hit(resolved_item, namespace, key)
+        outcome = "allowed" if allowed else "limited"
+        elapsed = time.perf_counter() - start
+        RATE_LIMIT_DECISION_DURATION.labels(namespace, outcome).observe(elapsed)
+        tracing.record_span(f"{namespace}.rate_limit", start_wall, elapsed, outcome=outcome)
         if not allowed:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -100,7 +135,7 @@ def rate_limit(
 
 
 def rate_limit_by_ip(
-    item: RateLimitItem,
+    item: RateLimitSpec,
     namespace: str = "default",
     detail: str | None = None,
 ) -> DependencyCallable:
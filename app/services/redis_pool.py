@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+RedisPoolFactory = Callable[[], Awaitable[Any]]
+
+CONNECTING = "connecting"
+READY = "ready"
+FAILED = "failed"
+
+
+class RedisPoolManager:
+    """Create the job-queue pool in the background with bounded, backed-off retries.
+
+    The lifespan calls ``start()`` and returns at once, so pages and static files
+    serve while Redis is still coming up. Callers that need the pool ``wait()`` on
+    it for a bounded time; ``on_ready`` publishes it (the factory stores it on
+    ``app.state.redis``). Once ``attempts`` are used up the manager reports
+    ``FAILED``, so waiters stop blocking, but keeps trying every
+    ``retry_interval`` seconds until Redis comes back.
+    """
+
+    def __init__(
+        self,
+        factory: RedisPoolFactory,
+        on_ready: Callable[[Any], None] = lambda pool: None,
+        attempts: int = 10,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 10.0,
+        retry_interval: float = 30.0,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self.factory = factory
+        self.on_ready = on_ready
+        self.attempts = max(attempts, 1)
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.retry_interval = retry_interval
+        self._sleep = sleep
+        self.pool: Any = None
+        self.state = CONNECTING
+        self.last_error: str | None = None
+        self._settled = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def detail(self) -> str:
+        if self.state == FAILED:
+            return (
+                f"job queue pool failed after {self.attempts} attempts: {self.last_error}; "
+                f"retrying every {self.retry_interval:g}s"
+            )
+        if self.last_error is not None:
+            return f"job queue pool connecting (last error: {self.last_error})"
+        return "job queue pool connecting"
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._connect(), name="redis-pool-connect")
+
+    async def _connect(self) -> None:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                pool = await self.factory()
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                if attempt < self.attempts:
+                    delay = min(self.backoff_initial * 2 ** (attempt - 1), self.backoff_max)
+                    logger.warning("Redis pool attempt %s/%s failed (%s); retrying in %.1fs.", attempt, self.attempts, self.last_error, delay)
+                else:
+                    delay = self.retry_interval
+                    if self.state != FAILED:
+                        self.state = FAILED
+                        logger.error(
+                            "Redis pool unavailable after %s attempts (%s); retrying every %.0fs.",
+                            self.attempts,
+                            self.last_error,
+                            delay,
+                        )
+                        self._settled.set()
+                await self._sleep(delay)
+                continue
+            self.pool = pool
+            self.state = READY
+            self.last_error = None
+            self.on_ready(pool)
+            self._settled.set()
+            if attempt > self.attempts:
+                logger.info("Redis pool connected after %s attempts.", attempt)
+            return
+
+    async def wait(self, timeout: float) -> Any:
+        """The pool once ready, or ``None`` if it is not within ``timeout`` seconds."""
+        if not self._settled.is_set():
+            try:
+                await asyncio.wait_for(self._settled.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self.pool
+
+    async def close(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        pool, self.pool = self.pool, None
+        close = getattr(pool, "close", None)
+        if close is not None:
+            maybe_awaitable = close()
+            if inspect.isawaitable(maybe_awaitable):
+                await maybe_awaitable
+
+
+__all__ = ["CONNECTING", "FAILED", "READY", "RedisPoolFactory", "RedisPoolManager"]
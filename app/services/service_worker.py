@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from jinja2 import Environment
+
+from app.services.sitemap import CachedDocument
+from app.services.static_files import MemoryStaticFiles, StaticAsset
+
+SCRIPT_TEMPLATE = "service-worker.js"
+# The script itself must always be revalidated, or browsers keep an old
+# version (and its old precache list) for up to a day.
+SCRIPT_CACHE_CONTROL = "no-cache"
+DEFAULT_PRECACHE = (
+    "css/*.css",
+    "fonts/*.woff2",
+    "vendor/*.min.css",
+    "vendor/*.min.js",
+    "vendor/fontawesome/webfonts/*.woff2",
+    "icons/favicon-*.png",
+    "icons/site.webmanifest",
+)
+
+
+def build_precache_manifest(
+    assets: Mapping[str, StaticAsset], patterns: Sequence[str], prefix: str = "/static/"
+) -> List[Dict[str, str]]:
+    """``{url, revision}`` for every static file matching ``patterns``; revisions are content ETags."""
+    return [
+        {"url": f"{prefix}{path}", "revision": asset.etag.strip('"')}
+        for path, asset in sorted(assets.items())
+        if any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
+    ]
+
+
+def manifest_version(manifest: Sequence[Mapping[str, str]]) -> str:
+    digest = hashlib.sha256()
+    for entry in manifest:
+        digest.update(f"{entry['url']}\0{entry['revision']}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def render_service_worker(env: Environment, manifest: Sequence[Mapping[str, str]], page_paths: Sequence[str]) -> str:
+    return env.get_template(SCRIPT_TEMPLATE).render(
+        version=manifest_version(manifest),
+        precache=json.dumps([entry["url"] for entry in manifest]),
+        pages=json.dumps(list(page_paths)),
+    )
+
+
+class ServiceWorkerScript:
+    """The generated ``/sw.js``, rebuilt whenever the static tree is reloaded.
+
+    Cache names carry a version hashed from every precached file's content, so
+    a deploy that changes any asset installs a fresh cache and drops the old one.
+    """
+
+    def __init__(self, env: Environment, static_files: MemoryStaticFiles, patterns: Sequence[str] = DEFAULT_PRECACHE) -> None:
+        self.env = env
+        self.static_files = static_files
+        self.patterns = tuple(patterns)
+        self._built: Tuple[object, Tuple[str, ...], CachedDocument] | None = None
+
+    def document(self, page_paths: Sequence[str]) -> CachedDocument:
+        assets = self.static_files.assets
+        key = tuple(page_paths)
+        if self._built is None or self._built[0] is not assets or self._built[1] != key:
+            manifest = build_precache_manifest(assets, self.patterns)
+            text = render_service_worker(self.env, manifest, key)
+            self._built = (assets, key, CachedDocument.build(text, "text/javascript", SCRIPT_CACHE_CONTROL))
+        return self._built[2]
+
+
+__all__ = [
+    "DEFAULT_PRECACHE",
+    "ServiceWorkerScript",
+    "build_precache_manifest",
+    "manifest_version",
+    "render_service_worker",
+]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, List, Sequence
+from xml.sax.saxutils import escape
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.services.legal_pages import get_ordered_pages
+from app.services.static_files import etag_matches
+
+SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+MAX_URLS_PER_SITEMAP = 50_000
+CACHE_CONTROL = "public, max-age=3600"
+UPDATED_AT_PREFIX = "Last updated:"
+
+
+@dataclass(frozen=True)
+class SitemapEntry:
+    loc: str
+    lastmod: date | None
+    changefreq: str
+    priority: str
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """A rendered document kept as identity and gzip bytes with matching validators."""
+
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    gzip_etag: str
+    media_type: str
+    cache_control: str = CACHE_CONTROL
+
+    @classmethod
+    def build(cls, text: str, media_type: str, cache_control: str = CACHE_CONTROL) -> "CachedDocument":
+        body = text.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        return cls(body, gzip.compress(body, mtime=0), f'"{digest}"', f'"{digest}-gz"', media_type, cache_control)
+
+    def response(self, request: Request) -> Response:
+        use_gzip = accepts_gzip(request.headers.get("accept-encoding", ""))
+        etag = self.gzip_etag if use_gzip else self.etag
+        headers = {"ETag": etag, "Cache-Control": self.cache_control, "Vary": "Accept-Encoding"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, (self.etag, self.gzip_etag)):
+            return Response(status_code=304, headers=headers)
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+        return Response(self.gzip_body if use_gzip else self.body, media_type=self.media_type, headers=headers)
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() in {"gzip", "*"}:
+            return params.replace(" ", "").lower() not in {"q=0", "q=0.0", "q=0.00", "q=0.000"}
+    return False
+
+
+def parse_updated_at(value: str) -> date | None:
+    """Turn ``"Last updated: May 7, 2025"`` into a date; unknown formats yield ``None``."""
+    text = value.removeprefix(UPDATED_AT_PREFIX).strip()
+    for fmt in ("%B %d, %Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def build_entries(site_url: str, home_updated_at: date | None = None) -> List[SitemapEntry]:
+    """Home page first, then the legal pages; ``/`` only gets a ``lastmod`` when one is configured."""
+    base = site_url.rstrip("/")
+    entries = [SitemapEntry(f"{base}/", home_updated_at, "weekly", "1.0")]
+    entries.extend(
+        SitemapEntry(f"{base}/legal/{page.slug}", parse_updated_at(page.updated_at), "yearly", "0.6")
+        for page in get_ordered_pages()
+    )
+    return entries
+
+
+def render_urlset(entries: Sequence[SitemapEntry]) -> str:
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<urlset xmlns="{SITEMAP_NAMESPACE}">']
+    for entry in entries:
+        lines.append("  <url>")
+        lines.append(f"    <loc>{escape(entry.loc)}</loc>")
+        if entry.lastmod is not None:
+            lines.append(f"    <lastmod>{entry.lastmod.isoformat()}</lastmod>")
+        lines.append(f"    <changefreq>{entry.changefreq}</changefreq>")
+        lines.append(f"    <priority>{entry.priority}</priority>")
+        lines.append("  </url>")
+    lines.append("</urlset>")
+    return "\n".join(lines) + "\n"
+
+
+def render_index(site_url: str, shards: Sequence[Sequence[SitemapEntry]]) -> str:
+    base = site_url.rstrip("/")
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<sitemapindex xmlns="{SITEMAP_NAMESPACE}">']
+    for number, shard in enumerate(shards, start=1):
+        dates = [entry.lastmod for entry in shard if entry.lastmod is not None]
+        lines.append("  <sitemap>")
+        lines.append(f"    <loc>{escape(f'{base}/sitemap-{number}.xml')}</loc>")
+        if dates:
+            lines.append(f"    <lastmod>{max(dates).isoformat()}</lastmod>")
+        lines.append("  </sitemap>")
+    lines.append("</sitemapindex>")
+    return "\n".join(lines) + "\n"
+
+
+def render_robots(site_url: str) -> str:
+    return f"User-agent: *\nAllow: /\n\nSitemap: {site_url.rstrip('/')}/sitemap.xml\n"
+
+
+@lru_cache()
+def get_sitemap_documents(
+    site_url: str, max_urls: int = MAX_URLS_PER_SITEMAP, home_updated_at: date | None = None
+) -> Dict[str, CachedDocument]:
+    """Render ``sitemap.xml`` (an index once entries exceed ``max_urls``), its shards and robots.txt.
+
+    Cached for the life of the process, like the legal content it is built from.
+    """
+    entries = build_entries(site_url, home_updated_at)
+    documents = {"robots.txt": CachedDocument.build(render_robots(site_url), "text/plain")}
+    if len(entries) <= max_urls:
+        documents["sitemap.xml"] = CachedDocument.build(render_urlset(entries), "application/xml")
+        return documents
+
+    shards = [entries[start : start + max_urls] for start in range(0, len(entries), max_urls)]
+    documents["sitemap.xml"] = CachedDocument.build(render_index(site_url, shards), "application/xml")
+    for number, shard in enumerate(shards, start=1):
+        documents[f"sitemap-{number}.xml"] = CachedDocument.build(render_urlset(shard), "application/xml")
+    return documents
+
+
+__all__ = [
+    "CachedDocument",
+    "MAX_URLS_PER_SITEMAP",
+    "SitemapEntry",
+    "accepts_gzip",
+    "build_entries",
+    "get_sitemap_documents",
+    "parse_updated_at",
+    "render_index",
+    "render_robots",
+    "render_urlset",
+]
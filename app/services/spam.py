@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+import re
+import secrets
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterable, List, Sequence, Tuple
+
+from app.config import Settings
+from app.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+ACCEPT = "accept"
+QUARANTINE = "quarantine"
+REJECT = "reject"
+
+SPAM_VERDICTS = metrics.counter(
+    "contact_spam_verdicts_total",
+    "Contact submissions by spam verdict; only accepted ones are queued.",
+    ("verdict",),
+)
+SPAM_SIGNALS = metrics.counter(
+    "contact_spam_signals_total",
+    "Spam signals raised by each scoring check.",
+    ("signal",),
+)
+
+# Matched against the lowercased message. Patterns that start with a literal
+# let ``re`` skip ahead with a substring search; a leading ``\b`` or an
+# alternation of them makes it try every position, which is ~20x slower.
+DEFAULT_PATTERNS = (
+    r"viagra",
+    r"casino",
+    r"crypto\s*currenc",
+    r"backlink",
+    r"seo\s+(?:services|agency|package)",
+    r"\[url=",
+    r"<a\s+href",
+)
+# One match per URL: "https://www.example.com" is a single link, not two.
+_LINK = re.compile(r"(?:https?://|www\.)\S+", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Submission:
+    name: str
+    email: str
+    message: str
+    client_ip: str
+    honeypot: str = ""
+    form_token: str = ""
+
+
+@dataclass(frozen=True)
+class Signal:
+    name: str
+    score: int
+
+
+@dataclass(frozen=True)
+class Verdict:
+    action: str
+    score: int
+    signals: Tuple[Signal, ...]
+
+
+SpamCheck = Callable[[Submission, float], Iterable[Signal]]
+
+
+class HoneypotCheck:
+    """A field hidden from people; anything typed into it came from a bot."""
+
+    def __init__(self, score: int = 100) -> None:
+        self.score = score
+
+    def __call__(self, submission: Submission, now: float) -> Iterable[Signal]:
+        if submission.honeypot.strip():
+            yield Signal("honeypot", self.score)
+
+
+class FormTokenCheck:
+    """Signed ``issued_at`` stamp rendered into the form to measure time-to-submit.
+
+    A missing or forged token only adds a little to the score, so browsers with
+    a stale page still get through; a valid token used faster than a person can
+    type is conclusive.
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        min_seconds: float = 3.0,
+        max_age: float = 86_400.0,
+        invalid_score: int = 40,
+        expired_score: int = 20,
+        too_fast_score: int = 100,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._secret = secret.encode()
+        self.min_seconds = min_seconds
+        self.max_age = max_age
+        self.invalid_score = invalid_score
+        self.expired_score = expired_score
+        self.too_fast_score = too_fast_score
+        self._clock = clock
+
+    def _sign(self, issued_at: str) -> str:
+        return hmac.new(self._secret, issued_at.encode(), hashlib.sha256).hexdigest()[:32]
+
+    def issue(self) -> str:
+        issued_at = f"{self._clock():.3f}"
+        return f"{issued_at}.{self._sign(issued_at)}"
+
+    def __call__(self, submission: Submission, now: float) -> Iterable[Signal]:
+        issued_at, _, signature = submission.form_token.rpartition(".")
+        try:
+            issued = float(issued_at)
+        except ValueError:
+            yield Signal("form_token_invalid", self.invalid_score)
+            return
+        if not hmac.compare_digest(self._sign(issued_at), signature):
+            yield Signal("form_token_invalid", self.invalid_score)
+        elif now - issued < self.min_seconds:
+            yield Signal("too_fast", self.too_fast_score)
+        elif now - issued > self.max_age:
+            yield Signal("form_token_expired", self.expired_score)
+
+
+class LinkCheck:
+    def __init__(self, max_links: int = 2, score_per_link: int = 30) -> None:
+        self.max_links = max_links
+        self.score_per_link = score_per_link
+
+    def __call__(self, submission: Submission, now: float) -> Iterable[Signal]:
+        excess = len(_LINK.findall(submission.message)) - self.max_links
+        if excess > 0:
+            yield Signal("links", excess * self.score_per_link)
+
+
+class PatternCheck:
+    """Known-bad phrases, each compiled once and searched in the lowercased message."""
+
+    def __init__(self, patterns: Sequence[str] = DEFAULT_PATTERNS, score: int = 60) -> None:
+        self.patterns = tuple(re.compile(pattern) for pattern in patterns)
+        self.score = score
+
+    def __call__(self, submission: Submission, now: float) -> Iterable[Signal]:
+        message = submission.message.lower()
+        if any(pattern.search(message) for pattern in self.patterns):
+            yield Signal("pattern", self.score)
+
+
+class RecentSubmissionIndex:
+    """Per-process LRU of recent submission times keyed by email and client IP.
+
+    Only submissions that are not rejected are recorded, so a bot hammering the
+    form cannot push a person's address out of the window.
+    """
+
+    def __init__(
+        self,
+        window: float = 3600.0,
+        max_recent: int = 3,
+        score: int = 50,
+        max_keys: int = 10_000,
+    ) -> None:
+        self.window = window
+        self.max_recent = max_recent
+        self.score = score
+        self.max_keys = max_keys
+        self._seen: "OrderedDict[str, Deque[float]]" = OrderedDict()
+
+    @staticmethod
+    def _keys(submission: Submission) -> Tuple[str, str]:
+        return f"email:{submission.email.strip().lower()}", f"ip:{submission.client_ip}"
+
+    def _recent(self, key: str, now: float) -> int:
+        times = self._seen.get(key)
+        if times is None:
+            return 0
+        while times and now - times[0] > self.window:
+            times.popleft()
+        return len(times)
+
+    def __call__(self, submission: Submission, now: float) -> Iterable[Signal]:
+        if any(self._recent(key, now) >= self.max_recent for key in self._keys(submission)):
+            yield Signal("repeat_sender", self.score)
+
+    def record(self, submission: Submission, now: float) -> None:
+        for key in self._keys(submission):
+            times = self._seen.pop(key, None) or deque(maxlen=self.max_recent)
+            times.append(now)
+            self._seen[key] = times
+        while len(self._seen) > self.max_keys:
+            self._seen.popitem(last=False)
+
+
+class SpamFilter:
+    """Score submissions with a pipeline of checks built once at startup.
+
+    Checks are plain callables returning ``Signal``s; their scores are summed
+    and compared with the quarantine and reject thresholds.
+    """
+
+    def __init__(
+        self,
+        checks: Sequence[SpamCheck],
+        quarantine_score: int = 50,
+        reject_score: int = 100,
+        form_tokens: FormTokenCheck | None = None,
+        recent: RecentSubmissionIndex | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.checks = tuple(checks)
+        self.quarantine_score = quarantine_score
+        self.reject_score = reject_score
+        self.form_tokens = form_tokens
+        self.recent = recent
+        self._clock = clock
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "SpamFilter":
+        secret = settings.spam_token_secret
+        if not secret:
+            logger.warning("SPAM_TOKEN_SECRET is not set; form tokens only verify in the process that issued them.")
+            secret = secrets.token_hex(32)
+        form_tokens = FormTokenCheck(secret, min_seconds=settings.spam_min_submit_seconds)
+        recent = RecentSubmissionIndex(
+            window=settings.spam_recent_window_seconds, max_recent=settings.spam_recent_max_submissions
+        )
+        checks: List[SpamCheck] = [
+            HoneypotCheck(),
+            form_tokens,
+            LinkCheck(max_links=settings.spam_max_links),
+            PatternCheck(DEFAULT_PATTERNS if settings.spam_patterns is None else settings.spam_patterns),
+            recent,
+        ]
+        return cls(
+            checks,
+            quarantine_score=settings.spam_quarantine_score,
+            reject_score=settings.spam_reject_score,
+            form_tokens=form_tokens,
+            recent=recent,
+        )
+
+    def issue_form_token(self) -> str:
+        return self.form_tokens.issue() if self.form_tokens is not None else ""
+
+    def evaluate(self, submission: Submission) -> Verdict:
+        now = self._clock()
+        signals = tuple(signal for check in self.checks for signal in check(submission, now))
+        score = sum(signal.score for signal in signals)
+        if score >= self.reject_score:
+            action = REJECT
+        elif score >= self.quarantine_score:
+            action = QUARANTINE
+        else:
+            action = ACCEPT
+        if action != REJECT and self.recent is not None:
+            self.recent.record(submission, now)
+        if action == QUARANTINE:
+            logger.warning(
+                "Quarantined contact submission from %s <%s> (score %s: %s).",
+                submission.name,
+                submission.email,
+                score,
+                ", ".join(signal.name for signal in signals),
+            )
+        SPAM_VERDICTS.labels(action).inc()
+        for signal in signals:
+            SPAM_SIGNALS.labels(signal.name).inc()
+        return Verdict(action, score, signals)
+
+
+__all__ = [
+    "ACCEPT",
+    "DEFAULT_PATTERNS",
+    "FormTokenCheck",
+    "HoneypotCheck",
+    "LinkCheck",
+    "PatternCheck",
+    "QUARANTINE",
+    "REJECT",
+    "RecentSubmissionIndex",
+    "Signal",
+    "SpamCheck",
+    "SpamFilter",
+    "Submission",
+    "Verdict",
+]
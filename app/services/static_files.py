@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import signal
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, PlainTextResponse, Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MEMORY_FILE_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    """One file of the static tree with validators computed once at load time.
+
+    ``body`` is ``None`` for files above the in-memory size limit; those are
+    streamed by ``FileResponse``, which uses zero-copy ``http.response.pathsend``
+    when the server offers it.
+    """
+
+    path: Path
+    body: bytes | None
+    size: int
+    mtime: float
+    etag: str
+    last_modified: str
+    media_type: str
+    stat: os.stat_result
+
+    def base_headers(self) -> Dict[str, str]:
+        return {
+            "etag": self.etag,
+            "last-modified": self.last_modified,
+            "accept-ranges": "bytes",
+        }
+
+
+def _media_type(path: Path) -> str:
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if media_type.startswith("text/") or media_type in {"application/javascript", "application/manifest+json"}:
+        media_type += "; charset=utf-8"
+    return media_type
+
+
+def load_asset(path: Path, max_memory_bytes: int) -> StaticAsset:
+    stat_result = path.stat()
+    if stat_result.st_size <= max_memory_bytes:
+        body: bytes | None = path.read_bytes()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    else:
+        body = None
+        etag = f'"{hashlib.md5(f"{stat_result.st_mtime}-{stat_result.st_size}".encode()).hexdigest()}"'
+    return StaticAsset(
+        path=path,
+        body=body,
+        size=stat_result.st_size,
+        mtime=stat_result.st_mtime,
+        etag=etag,
+        last_modified=formatdate(stat_result.st_mtime, usegmt=True),
+        media_type=_media_type(path),
+        stat=stat_result,
+    )
+
+
+def etag_matches(header: str, etags: Iterable[str]) -> bool:
+    """Weak ``If-None-Match`` comparison of ``header`` against any of ``etags``."""
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or any(etag in candidates for etag in etags)
+
+
+def is_not_modified(headers: Headers, asset: StaticAsset) -> bool:
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, (asset.etag,))
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(asset.mtime) <= since
+
+
+class MalformedRange(ValueError):
+    pass
+
+
+class UnsatisfiableRange(ValueError):
+    pass
+
+
+def parse_range(header: str, size: int) -> List[Tuple[int, int]]:
+    """Parse ``bytes=`` ranges into half-open ``(start, end)`` tuples clamped to ``size``."""
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+        raise MalformedRange(header)
+    ranges: List[Tuple[int, int]] = []
+    for part in spec.split(","):
+        first, dash, last = part.strip().partition("-")
+        if not dash:
+            raise MalformedRange(header)
+        try:
+            if first == "":
+                length = int(last)
+                start, end = max(size - length, 0), size
+            else:
+                start = int(first)
+                end = size if last == "" else min(int(last) + 1, size)
+        except ValueError:
+            raise MalformedRange(header) from None
+        if start < 0 or (last != "" and first != "" and int(last) < start):
+            raise MalformedRange(header)
+        if start < end:
+            ranges.append((start, end))
+    if not ranges:
+        raise UnsatisfiableRange(header)
+    return ranges
+
+
+def _use_range(headers: Headers, asset: StaticAsset) -> bool:
+    if_range = headers.get("if-range")
+    if if_range is None:
+        return True
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        return if_range == asset.etag
+    return if_range == asset.last_modified
+
+
+def _route_path(scope) -> str:
+    path: str = scope["path"]
+    root_path: str = scope.get("root_path", "")
+    if root_path and path.startswith(root_path + "/"):
+        return path[len(root_path) :]
+    return path
+
+
+class MemoryStaticFiles:
+    """Serve a small static tree from memory with conditional and Range support.
+
+    The tree is loaded once (and again on ``reload()``, wired to SIGHUP by the
+    app factory). Lookups are dictionary hits, so no request stats or opens a
+    file, and paths outside the loaded tree cannot be reached.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], max_memory_bytes: int = DEFAULT_MAX_MEMORY_FILE_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_memory_bytes = max_memory_bytes
+        self.assets: Dict[str, StaticAsset] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        assets = {
+            path.relative_to(self.directory).as_posix(): load_asset(path, self.max_memory_bytes)
+            for path in sorted(self.directory.rglob("*"))
+            if path.is_file()
+        }
+        self.assets = assets
+        in_memory = sum(asset.size for asset in assets.values() if asset.body is not None)
+        logger.info("Loaded %s static files (%s bytes in memory) from %s.", len(assets), in_memory, self.directory)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+        asset = self.assets.get(_route_path(scope).lstrip("/"))
+        if asset is None:
+            raise HTTPException(status_code=404)
+
+        response = self.build_response(Headers(scope=scope), asset)
+        await response(scope, receive, send)
+
+    def build_response(self, headers: Headers, asset: StaticAsset) -> Response:
+        if is_not_modified(headers, asset):
+            return Response(status_code=304, headers=asset.base_headers())
+        if asset.body is None:
+            return FileResponse(asset.path, headers=asset.base_headers(), media_type=asset.media_type, stat_result=asset.stat)
+
+        range_header = headers.get("range")
+        if range_header is None or not _use_range(headers, asset):
+            return Response(asset.body, headers=asset.base_headers(), media_type=asset.media_type)
+        try:
+            ranges = parse_range(range_header, asset.size)
+        except MalformedRange:
+            return PlainTextResponse("Malformed range header.", status_code=400)
+        except UnsatisfiableRange:
+            return PlainTextResponse(status_code=416, headers={"content-range": f"bytes */{asset.size}"})
+        if len(ranges) > 1:
+            # Multipart byteranges are rarely used by browsers; the full body is a valid answer.
+            return Response(asset.body, headers=asset.base_headers(), media_type=asset.media_type)
+        start, end = ranges[0]
+        partial_headers = {**asset.base_headers(), "content-range": f"bytes {start}-{end - 1}/{asset.size}"}
+        return Response(asset.body[start:end], status_code=206, headers=partial_headers, media_type=asset.media_type)
+
+
+def install_reload_signal(static: MemoryStaticFiles) -> bool:
+    """Reload ``static`` on SIGHUP; returns ``False`` where loop signal handlers are unavailable."""
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, static.reload)
+    except (NotImplementedError, RuntimeError, AttributeError, ValueError):
+        return False
+    return True
+
+
+def remove_reload_signal() -> None:
+    asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+
+
+__all__ = [
+    "MemoryStaticFiles",
+    "StaticAsset",
+    "etag_matches",
+    "install_reload_signal",
+    "is_not_modified",
+    "load_asset",
+    "parse_range",
+    "remove_reload_signal",
+]
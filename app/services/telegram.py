@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Mapping
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Dict
 
 import httpx
 
-from app.config import get_settings
-from app.workers import registry
+from app.config import Settings, get_settings
+from app.services import tracing
+from app.services.destinations import check_response, destination_registry, fan_out
+from app.services.metrics import TELEGRAM_REQUEST_DURATION
+from app.workers.jobs import SEND_TELEGRAM_MESSAGE
+from app.workers.registry import registry
 
 
 def _format_message(payload: Mapping[str, Any]) -> str:
@@ -23,40 +29,80 @@ def _format_message(payload: Mapping[str, Any]) -> str:
     )
 
 
+@dataclass(frozen=True)
+class TelegramDestination:
+    name: str
+    chat_id: int | str
+    api_url: str
+    default_retry_after: float = 1.0
+
+    async def deliver(self, client: httpx.AsyncClient, payload: Mapping[str, Any]) -> None:
+        start = time.perf_counter()
+        with tracing.span("telegram.send_message", destination=self.name) as span:
+            response = await client.post(
+                self.api_url,
+                json={
+                    "chat_id": self.chat_id,
+                    "text": _format_message(payload),
+                    "disable_web_page_preview": True,
+                },
+            )
+            span.attributes["status"] = response.status_code
+        TELEGRAM_REQUEST_DURATION.labels(str(response.status_code)).observe(time.perf_counter() - start)
+        check_response(response, self.default_retry_after)
+
+
+@destination_registry.register("telegram")
+def _telegram(settings: Settings, spec: Dict[str, Any]) -> TelegramDestination:
+    return TelegramDestination(
+        name=spec.get("name", "telegram"),
+        chat_id=spec["chat_id"],
+        api_url=settings.telegram_api_url,
+        default_retry_after=settings.telegram_default_retry_after,
+    )
+
+
 @registry.on_startup
 async def worker_startup(ctx: dict[str, Any]) -> None:
     """Initialise shared resources for the worker."""
     settings = get_settings()
-    ctx["http_client"] = httpx.AsyncClient(timeout=httpx.Timeout(settings.request_timeout_seconds))
+    ctx["destinations"] = destination_registry.build(settings)
+    ctx["http_client"] = httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.request_timeout_seconds),
+        limits=httpx.Limits(
+            max_connections=settings.telegram_max_connections,
+            max_keepalive_connections=settings.telegram_max_connections,
+        ),
+    )
 
 
 @registry.on_shutdown
 async def worker_shutdown(ctx: dict[str, Any]) -> None:
     """Tear down shared worker resources."""
+    ctx.pop("destinations", None)
     client: httpx.AsyncClient | None = ctx.pop("http_client", None)
     if client is not None:
         await client.aclose()
 
 
-@registry.job()
+@registry.job(SEND_TELEGRAM_MESSAGE)
 async def send_telegram_message(ctx: dict[str, Any], payload: Mapping[str, Any]) -> None:
-    """Dispatch the formatted message to the configured Telegram chat."""
+    """Fan the formatted message out to every configured notification destination."""
     settings = get_settings()
-    message_text = _format_message(payload)
-    client: httpx.AsyncClient = ctx["http_client"]
-
-    response = await client.post(
-        settings.telegram_api_url,
-        json={
-            "chat_id": settings.telegram_chat_id,
-            "text": message_text,
-            "disable_web_page_preview": True,
-        },
+    if "destinations" not in ctx:
+        ctx["destinations"] = destination_registry.build(settings)
+    await fan_out(
+        ctx,
+        ctx["destinations"],
+        payload,
+        concurrency=settings.notification_concurrency,
+        dedupe_ttl=settings.notification_dedupe_ttl_seconds,
+        default_retry_after=settings.telegram_default_retry_after,
     )
-    response.raise_for_status()
 
 
 __all__ = [
+    "TelegramDestination",
     "worker_startup",
     "worker_shutdown",
     "send_telegram_message",
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Protocol
+
+from app.config import Settings
+from app.workers.registry import ENVELOPE_KWARG
+
+TRACE_HEADER = "X-Trace-Id"
+
+_current_trace: ContextVar[str | None] = ContextVar("current_trace", default=None)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    trace_id: str
+    name: str
+    start: float
+    duration_ms: float
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+
+class NullSpanExporter:
+    def export(self, span: Span) -> None:
+        return None
+
+
+class LoggingSpanExporter:
+    def export(self, span: Span) -> None:
+        logger.info("span %s", json.dumps(asdict(span), sort_keys=True))
+
+
+class FileSpanExporter:
+    """Append spans as JSON lines; meant for local debugging and tests."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(asdict(span), sort_keys=True) + "\n"
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line)
+
+    def read(self) -> list[dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        return [json.loads(line) for line in self.path.read_text(encoding="utf-8").splitlines() if line]
+
+
+EXPORTERS: Dict[str, Callable[[Settings], SpanExporter]] = {
+    "none": lambda settings: NullSpanExporter(),
+    "log": lambda settings: LoggingSpanExporter(),
+    "file": lambda settings: FileSpanExporter(settings.trace_file_path),
+}
+
+_exporter: SpanExporter = NullSpanExporter()
+
+
+def set_exporter(exporter: SpanExporter) -> None:
+    global _exporter
+    _exporter = exporter
+
+
+def get_exporter() -> SpanExporter:
+    return _exporter
+
+
+def configure(settings: Settings) -> SpanExporter:
+    """Install the exporter named by ``TRACE_EXPORTER``."""
+    try:
+        factory = EXPORTERS[settings.trace_exporter]
+    except KeyError:
+        raise ValueError(f"Unknown trace exporter '{settings.trace_exporter}'.") from None
+    exporter = factory(settings)
+    set_exporter(exporter)
+    return exporter
+
+
+def new_trace_id() -> str:
+    return uuid.uuid4().hex
+
+
+def current_trace_id() -> str | None:
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_context(trace_id: str | None) -> Iterator[str | None]:
+    token = _current_trace.set(trace_id)
+    try:
+        yield trace_id
+    finally:
+        _current_trace.reset(token)
+
+
+def record_span(name: str, start: float, duration: float, **attributes: Any) -> None:
+    """Export a span measured elsewhere; ``start`` is a UNIX timestamp."""
+    trace_id = _current_trace.get()
+    if trace_id is not None:
+        _exporter.export(Span(trace_id, name, start, round(duration * 1000, 3), attributes=attributes))
+
+
+class _SpanTimer:
+    __slots__ = ("name", "attributes", "_wall", "_start")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]) -> None:
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> "_SpanTimer":
+        self._wall = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        if exc_type is not None:
+            self.attributes["error"] = getattr(exc_type, "__name__", str(exc_type))
+        record_span(self.name, self._wall, time.perf_counter() - self._start, **self.attributes)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        return {}
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str, **attributes: Any) -> _SpanTimer | _NoopSpan:
+    """Time a block as a span of the current trace; a no-op outside a trace."""
+    if _current_trace.get() is None:
+        return _NOOP_SPAN
+    return _SpanTimer(name, attributes)
+
+
+def build_envelope() -> Dict[str, Any]:
+    """Job metadata carried next to (never inside) the user payload."""
+    return {"trace_id": _current_trace.get(), "enqueued_at": time.time()}
+
+
+__all__ = [
+    "ENVELOPE_KWARG",
+    "EXPORTERS",
+    "FileSpanExporter",
+    "LoggingSpanExporter",
+    "NullSpanExporter",
+    "Span",
+    "SpanExporter",
+    "TRACE_HEADER",
+    "build_envelope",
+    "configure",
+    "current_trace_id",
+    "get_exporter",
+    "new_trace_id",
+    "record_span",
+    "set_exporter",
+    "span",
+    "trace_context",
+]
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Protocol, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class ChildProcess(Protocol):
+    pid: int | None
+    exitcode: int | None
+
+    def start(self) -> None: ...
+
+    def is_alive(self) -> bool: ...
+
+    def terminate(self) -> None: ...
+
+    def kill(self) -> None: ...
+
+    def join(self, timeout: float | None = None) -> None: ...
+
+
+ProcessFactory = Callable[..., ChildProcess]
+
+
+@dataclass
+class _Slot:
+    index: int
+    process: ChildProcess | None = None
+    started_at: float = 0.0
+    restarts: int = 0
+    failures: int = 0
+    next_start_at: float = 0.0
+
+
+class ProcessSupervisor:
+    """Keep ``processes`` copies of ``target`` running and stop them gracefully.
+
+    Children that exit cleanly (for example after a request-count recycle) are
+    replaced immediately; crashing children are restarted with exponential
+    backoff that resets once a child has stayed up for ``healthy_after`` seconds.
+    SIGHUP is passed on to the children when ``forward_sighup`` is set and
+    ignored otherwise, so it never takes the whole tree down.
+    """
+
+    def __init__(
+        self,
+        target: Callable[..., None],
+        processes: int,
+        args: Callable[[int], Sequence[Any]] = lambda index: (),
+        name: str = "child",
+        graceful_timeout: float = 30.0,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 30.0,
+        healthy_after: float = 60.0,
+        poll_interval: float = 0.5,
+        process_factory: ProcessFactory | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        forward_sighup: bool = False,
+    ) -> None:
+        if processes < 1:
+            raise ValueError("At least one process is required.")
+        self.target = target
+        self.args = args
+        self.name = name
+        self.graceful_timeout = graceful_timeout
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.healthy_after = healthy_after
+        self.poll_interval = poll_interval
+        self._process_factory = process_factory or multiprocessing.get_context("spawn").Process
+        self._clock = clock
+        self._sleep = sleep
+        self.forward_sighup = forward_sighup
+        self._slots = [_Slot(index) for index in range(processes)]
+        self._stopping = False
+
+    @property
+    def stopping(self) -> bool:
+        return self._stopping
+
+    def _spawn(self, slot: _Slot) -> None:
+        process = self._process_factory(
+            target=self.target,
+            args=tuple(self.args(slot.index)),
+            name=f"{self.name}-{slot.index}",
+            daemon=False,
+        )
+        process.start()
+        slot.process = process
+        slot.started_at = self._clock()
+        logger.info("Started %s-%s (pid %s).", self.name, slot.index, process.pid)
+
+    def start(self) -> None:
+        for slot in self._slots:
+            self._spawn(slot)
+
+    def monitor_once(self) -> None:
+        """Reap exited children and restart the ones whose backoff has elapsed."""
+        now = self._clock()
+        for slot in self._slots:
+            process = slot.process
+            if process is not None and not process.is_alive():
+                process.join(0)
+                exitcode = process.exitcode
+                slot.process = None
+                if now - slot.started_at >= self.healthy_after:
+                    slot.failures = 0
+                if exitcode == 0:
+                    slot.next_start_at = now
+                else:
+                    slot.failures += 1
+                    delay = min(self.backoff_initial * 2 ** (slot.failures - 1), self.backoff_max)
+                    slot.next_start_at = now + delay
+                    logger.warning("%s-%s exited with %s; backing off %.1fs.", self.name, slot.index, exitcode, delay)
+            if slot.process is None and not self._stopping and now >= slot.next_start_at:
+                slot.restarts += 1
+                self._spawn(slot)
+
+    def request_stop(self, signum: int | None = None, frame: Any = None) -> None:
+        self._stopping = True
+
+    def forward_signal(self, signum: int, frame: Any = None) -> None:
+        """Send ``signum`` to every live child."""
+        for slot in self._slots:
+            process = slot.process
+            if process is None or process.pid is None or not process.is_alive():
+                continue
+            try:
+                os.kill(process.pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def stop(self) -> None:
+        """Ask children to drain (SIGTERM) and kill whatever outlives the grace period."""
+        self._stopping = True
+        live = [slot.process for slot in self._slots if slot.process is not None]
+        for process in live:
+            if process.is_alive():
+                process.terminate()
+        deadline = self._clock() + self.graceful_timeout
+        for process in live:
+            process.join(max(deadline - self._clock(), 0))
+            if process.is_alive():
+                logger.warning("Killing %s (pid %s) after graceful timeout.", self.name, process.pid)
+                process.kill()
+                process.join()
+
+    def status(self) -> List[Dict[str, Any]]:
+        now = self._clock()
+        return [
+            {
+                "index": slot.index,
+                "pid": slot.process.pid if slot.process is not None else None,
+                "alive": slot.process is not None and slot.process.is_alive(),
+                "restarts": slot.restarts,
+                "uptime_seconds": round(now - slot.started_at, 1) if slot.process is not None else 0.0,
+            }
+            for slot in self._slots
+        ]
+
+    def run(self) -> int:
+        """Start children, supervise until SIGTERM/SIGINT, then drain them."""
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+        signal.signal(signal.SIGHUP, self.forward_signal if self.forward_sighup else signal.SIG_IGN)
+        self.start()
+        try:
+            while not self._stopping:
+                self._sleep(self.poll_interval)
+                self.monitor_once()
+        finally:
+            self.stop()
+        return 0
+
+
+__all__ = ["ChildProcess", "ProcessSupervisor"]
@@ -0,0 +1,63 @@
+/* Generated by app/services/service_worker.py; do not edit the served copy. */
+const VERSION = "{{ version }}";
+const STATIC_CACHE = `static-${VERSION}`;
+const PAGES_CACHE = `pages-${VERSION}`;
+const PRECACHE = new Set({{ precache | safe }});
+const PAGES = new Set({{ pages | safe }});
+
+self.addEventListener("install", (event) => {
+    event.waitUntil(
+        caches.open(STATIC_CACHE)
+            .then((cache) => cache.addAll([...PRECACHE].map((url) => new Request(url, { cache: "reload" }))))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener("activate", (event) => {
+    event.waitUntil(
+        caches.keys()
+            .then((names) => Promise.all(
+                names
+                    .filter((name) => name !== STATIC_CACHE && name !== PAGES_CACHE)
+                    .map((name) => caches.delete(name))
+            ))
+            .then(() => self.clients.claim())
+    );
+});
+
+async function cacheFirst(request) {
+    const cached = await caches.match(request, { cacheName: STATIC_CACHE, ignoreSearch: true });
+    return cached || fetch(request);
+}
+
+async function staleWhileRevalidate(event) {
+    const cache = await caches.open(PAGES_CACHE);
+    const cached = await cache.match(event.request);
+    const network = fetch(event.request).then((response) => {
+        if (response.ok) {
+            cache.put(event.request, response.clone());
+        }
+        return response;
+    });
+    if (cached) {
+        event.waitUntil(network.catch(() => undefined));
+        return cached;
+    }
+    return network;
+}
+
+self.addEventListener("fetch", (event) => {
+    const { request } = event;
+    if (request.method !== "GET") {
+        return;
+    }
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) {
+        return;
+    }
+    if (PRECACHE.has(url.pathname)) {
+        event.respondWith(cacheFirst(request));
+    } else if (request.mode === "navigate" && PAGES.has(url.pathname)) {
+        event.respondWith(staleWhileRevalidate(event));
+    }
+});
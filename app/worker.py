@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 from app.config import get_settings
-from app.workers import registry, worker_shutdown, worker_startup
+from app.workers import load_job_modules, registry, worker_shutdown, worker_startup
+
+
+_settings = get_settings()
+load_job_modules()
 
 
 class WorkerSettings:
-    redis_settings = get_settings().redis_settings()
+    redis_settings = _settings.redis_settings()
     functions = registry.functions
     on_startup = worker_startup
     on_shutdown = worker_shutdown
     keep_result = 0
+    max_jobs = _settings.worker_max_jobs
+    max_tries = _settings.worker_max_tries
+    health_check_interval = _settings.worker_heartbeat_seconds
+    job_completion_wait = int(_settings.worker_graceful_timeout)
 
 
 __all__ = ["WorkerSettings"]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Sequence, Tuple
+
+from app.config import Settings, get_settings
+from app.server import resolve_worker_count
+from app.services.metrics import CONTENT_TYPE_LATEST
+from app.supervisor import ProcessSupervisor
+
+logger = logging.getLogger(__name__)
+
+SCRAPE_TIMEOUT_SECONDS = 1.0
+_SAMPLE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{.*\})?(\s.*)$")
+
+
+def child_metrics_ports(base_port: int | None, processes: int) -> List[int | None]:
+    """The pool's report listens on ``base_port``; child ``i`` serves on ``base_port + 1 + i``."""
+    if base_port is None:
+        return [None] * processes
+    return [base_port + 1 + index for index in range(processes)]
+
+
+def run_worker_process(metrics_port: int | None) -> None:
+    """Entry point of one pooled ARQ worker, in a freshly spawned interpreter."""
+    if metrics_port is not None:
+        os.environ["WORKER_METRICS_PORT"] = str(metrics_port)
+    get_settings.cache_clear()
+
+    from arq.worker import run_worker
+
+    from app.worker import WorkerSettings
+
+    run_worker(WorkerSettings)  # type: ignore[arg-type]
+
+
+def label_samples(text: str, process: int) -> List[Tuple[str, str]]:
+    """Split exposition text into ``(family, line)`` pairs with a ``process`` label added to samples."""
+    lines: List[Tuple[str, str]] = []
+    family = ""
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        if line.startswith("#"):
+            parts = line.split(maxsplit=3)
+            if len(parts) >= 3 and parts[1] in ("HELP", "TYPE"):
+                family = parts[2]
+            lines.append((family, line))
+            continue
+        match = _SAMPLE.match(line)
+        if match is None:
+            continue
+        name, labels, rest = match.groups()
+        inner = f'process="{process}"' + ("," + labels[1:-1] if labels and labels != "{}" else "")
+        lines.append((family or name, f"{name}{{{inner}}}{rest}"))
+    return lines
+
+
+def merge_metrics(texts: Sequence[Tuple[int, str]]) -> str:
+    """Merge per-process exposition text, keeping each family's HELP/TYPE once."""
+    families: Dict[str, Dict[str, List[str]]] = {}
+    for process, text in texts:
+        for family, line in label_samples(text, process):
+            entry = families.setdefault(family, {"meta": [], "samples": []})
+            if line.startswith("#"):
+                if line not in entry["meta"]:
+                    entry["meta"].append(line)
+            else:
+                entry["samples"].append(line)
+    return "".join(line + "\n" for entry in families.values() for line in entry["meta"] + entry["samples"])
+
+
+def _scrape(host: str, port: int) -> str | None:
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=SCRAPE_TIMEOUT_SECONDS) as response:
+            return response.read().decode()
+    except OSError:
+        return None
+
+
+class PoolReport:
+    """Health and metrics of every pooled worker, gathered on demand."""
+
+    def __init__(self, supervisor: ProcessSupervisor, ports: Sequence[int | None], host: str = "127.0.0.1") -> None:
+        self.supervisor = supervisor
+        self.ports = list(ports)
+        self.host = "127.0.0.1" if host in ("", "0.0.0.0", "::") else host
+
+    def collect(self) -> Tuple[Dict[str, Any], str]:
+        processes = []
+        texts: List[Tuple[int, str]] = []
+        for status, port in zip(self.supervisor.status(), self.ports):
+            text = _scrape(self.host, port) if port is not None and status["alive"] else None
+            if text is not None:
+                texts.append((status["index"], text))
+            processes.append({**status, "metrics_port": port, "metrics_ok": text is not None})
+        alive = sum(1 for process in processes if process["alive"])
+        restarts = sum(process["restarts"] for process in processes)
+        summary = (
+            "# HELP worker_pool_processes_alive Pooled ARQ worker processes currently running.\n"
+            "# TYPE worker_pool_processes_alive gauge\n"
+            f"worker_pool_processes_alive {alive}\n"
+            "# HELP worker_pool_restarts_total Pooled ARQ worker processes restarted by the supervisor.\n"
+            "# TYPE worker_pool_restarts_total counter\n"
+            f"worker_pool_restarts_total {restarts}\n"
+        )
+        health = {"healthy": alive == len(processes) and not self.supervisor.stopping, "processes": processes}
+        return health, summary + merge_metrics(texts)
+
+
+def start_report_server(report: PoolReport, host: str, port: int) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` and ``/health`` for the whole pool from a background thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            health, metrics_text = report.collect()
+            if self.path == "/health":
+                status, content_type = (200 if health["healthy"] else 503), "application/json"
+                body = json.dumps(health).encode()
+            elif self.path == "/metrics":
+                status, content_type, body = 200, CONTENT_TYPE_LATEST, metrics_text.encode()
+            else:
+                status, content_type, body = 404, "text/plain", b"Not found"
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return None
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="worker-pool-report", daemon=True).start()
+    return server
+
+
+def run_pool(settings: Settings | None = None) -> int:
+    """Run ``WORKER_PROCESSES`` ARQ workers and supervise them until SIGTERM."""
+    settings = settings or get_settings()
+    processes = resolve_worker_count(settings.worker_processes)
+    ports = child_metrics_ports(settings.worker_metrics_port, processes)
+    logger.info("Starting %s ARQ workers with max_jobs=%s each.", processes, settings.worker_max_jobs)
+    supervisor = ProcessSupervisor(
+        run_worker_process,
+        processes=processes,
+        args=lambda index: (ports[index],),
+        name="worker",
+        graceful_timeout=settings.worker_graceful_timeout + 5,
+    )
+    report_server = None
+    if settings.worker_metrics_port is not None:
+        report = PoolReport(supervisor, ports, settings.worker_metrics_host)
+        report_server = start_report_server(report, settings.worker_metrics_host, settings.worker_metrics_port)
+    try:
+        return supervisor.run()
+    finally:
+        if report_server is not None:
+            report_server.shutdown()
+            report_server.server_close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(run_pool())
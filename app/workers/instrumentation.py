@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Dict
+
+from app.config import get_settings
+from app.services.metrics import JOB_DURATION, JOB_RETRIES, start_metrics_server
+from app.services import tracing
+from app.services.profiling import Profiler
+from app.workers.registry import CallNext, registry
+
+
+@registry.middleware
+async def record_job_metrics(ctx: Dict[str, Any], job_name: str, call_next: CallNext) -> Any:
+    """Record duration, outcome and retry attempts for every registered job."""
+    if ctx.get("job_try", 1) > 1:
+        JOB_RETRIES.labels(job_name).inc()
+    outcome = "error"
+    start = time.perf_counter()
+    try:
+        result = await call_next()
+        outcome = "success"
+        return result
+    finally:
+        JOB_DURATION.labels(job_name, outcome).observe(time.perf_counter() - start)
+
+
+@registry.middleware
+async def trace_job(ctx: Dict[str, Any], job_name: str, call_next: CallNext) -> Any:
+    """Restore the trace started by the web request and time queue wait plus execution."""
+    envelope = ctx.get("envelope") or {}
+    with tracing.trace_context(envelope.get("trace_id")):
+        enqueued_at = envelope.get("enqueued_at")
+        if enqueued_at is not None:
+            tracing.record_span("job.queue_wait", enqueued_at, max(time.time() - enqueued_at, 0.0), job=job_name)
+        with tracing.span(f"job.{job_name}", job_try=ctx.get("job_try", 1)):
+            return await call_next()
+
+
+@registry.middleware
+async def profile_job(ctx: Dict[str, Any], job_name: str, call_next: CallNext) -> Any:
+    """Capture a stack profile of sampled jobs when ``PROFILING_ENABLED`` is set."""
+    profiler: Profiler | None = ctx.get("profiler")
+    sampler = profiler.start() if profiler is not None and profiler.should_profile() else None
+    if profiler is None or sampler is None:
+        return await call_next()
+    try:
+        return await call_next()
+    finally:
+        profiler.finish(sampler, job_name)
+
+
+@registry.on_startup
+async def instrumentation_startup(ctx: Dict[str, Any]) -> None:
+    """Serve worker metrics when ``WORKER_METRICS_PORT`` is set and arm the job profiler."""
+    settings = get_settings()
+    tracing.configure(settings)
+    if settings.worker_metrics_port is not None:
+        ctx["metrics_server"] = await start_metrics_server(settings.worker_metrics_host, settings.worker_metrics_port)
+    if settings.profiling_enabled:
+        ctx["profiler"] = Profiler.from_settings(settings)
+
+
+@registry.on_shutdown
+async def instrumentation_shutdown(ctx: Dict[str, Any]) -> None:
+    ctx.pop("profiler", None)
+    server = ctx.pop("metrics_server", None)
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+
+__all__ = ["record_job_metrics", "trace_job", "profile_job", "instrumentation_startup", "instrumentation_shutdown"]
@@ -0,0 +1,29 @@
+"""Job names and queue keys shared by the web app and the worker.
+
+The web process enqueues by name from here so it never imports job modules
+(and their worker-only dependencies such as ``httpx``).
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# Mirror ``arq.constants`` so the web process does not import arq just for these strings.
+QUEUE_NAME = "arq:queue"
+HEALTH_CHECK_KEY = QUEUE_NAME + ":health-check"
+
+SEND_TELEGRAM_MESSAGE = "send_telegram_message"
+
+# Modules that register jobs, hooks and middleware on the shared registry.
+JOB_MODULES = (
+    "app.workers.instrumentation",
+    "app.services.telegram",
+)
+
+
+def load_job_modules() -> None:
+    for module in JOB_MODULES:
+        importlib.import_module(module)
+
+
+__all__ = ["HEALTH_CHECK_KEY", "JOB_MODULES", "QUEUE_NAME", "SEND_TELEGRAM_MESSAGE", "load_job_modules"]
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Awaitable, Callable
 from typing import Any, Dict, List
 
 JobCallable = Callable[[Dict[str, Any], Dict[str, Any]], Awaitable[None]]
 LifecycleHook = Callable[[Dict[str, Any]], Awaitable[None]]
+CallNext = Callable[[], Awaitable[Any]]
+JobMiddleware = Callable[[Dict[str, Any], str, CallNext], Awaitable[Any]]
+
+# Keyword argument carrying job metadata (trace context, enqueue time) next to the payload.
+ENVELOPE_KWARG = "__envelope__"
 
 
 class JobRegistry:
@@ -14,6 +20,7 @@ class JobRegistry:
         self._jobs: Dict[str, JobCallable] = {}
         self._startup: List[LifecycleHook] = []
         self._shutdown: List[LifecycleHook] = []
+        self._middleware: List[JobMiddleware] = []
 
     def job(self, name: str | None = None) -> Callable[[JobCallable], JobCallable]:
         def decorator(func: JobCallable) -> JobCallable:
@@ -33,15 +40,34 @@ class JobRegistry:
         self._shutdown.append(func)
         return func
 
+    def middleware(self, func: JobMiddleware) -> JobMiddleware:
+        """Wrap every job execution; the first registered middleware runs outermost."""
+        self._middleware.append(func)
+        return func
+
     def job_name(self, func: JobCallable) -> str:
         for name, handler in self._jobs.items():
             if handler is func:
                 return name
         raise KeyError("Function not registered as a job.")
 
+    def _wrap(self, name: str, handler: JobCallable) -> JobCallable:
+        @functools.wraps(handler)
+        async def execute(ctx: Dict[str, Any], *args: Any, **kwargs: Any) -> Any:
+            ctx["envelope"] = kwargs.pop(ENVELOPE_KWARG, None) or {}
+            async def call(index: int) -> Any:
+                if index == len(self._middleware):
+                    return await handler(ctx, *args, **kwargs)
+                return await self._middleware[index](ctx, name, lambda: call(index + 1))
+
+            return await call(0)
+
+        execute.__name__ = execute.__qualname__ = name
+        return execute
+
     @property
     def functions(self) -> List[JobCallable]:
-        return list(self._jobs.values())
+        return [self._wrap(name, handler) for name, handler in self._jobs.items()]
 
     async def run_startup(self, ctx: Dict[str, Any]) -> None:
         for hook in self._startup:
@@ -54,4 +80,4 @@ class JobRegistry:
 
 registry = JobRegistry()
 
-__all__ = ["registry", "JobRegistry", "JobCallable"]
+__all__ = ["registry", "JobRegistry", "JobCallable", "JobMiddleware", "ENVELOPE_KWARG"]
@@ -0,0 +1,114 @@
+"""Minimal local stand-in for the Telegram Bot API ``sendMessage`` endpoint.
+
+Speaks HTTP/1.1 with keep-alive so the worker's connection reuse can be
+observed, and injects latency, 429 throttling and 5xx errors on demand.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class FakeTelegramConfig:
+    latency: float = 0.02
+    jitter: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    error_rate: float = 0.0
+    seed: int | None = None
+
+
+@dataclass
+class FakeTelegramStats:
+    connections: int = 0
+    requests: int = 0
+    delivered: int = 0
+    throttled: int = 0
+    errors: int = 0
+    deliveries: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def requests_per_connection(self) -> float:
+        return self.requests / self.connections if self.connections else 0.0
+
+
+class FakeTelegramServer:
+    def __init__(self, config: FakeTelegramConfig | None = None) -> None:
+        self.config = config or FakeTelegramConfig()
+        self.stats = FakeTelegramStats()
+        self._random = random.Random(self.config.seed)
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None, "server not started"
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> "FakeTelegramServer":
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self) -> "FakeTelegramServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats.connections += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                headers = dict(
+                    line.split(":", 1) for line in head.decode("latin-1").split("\r\n")[1:] if ":" in line
+                )
+                length = int(next((v for k, v in headers.items() if k.strip().lower() == "content-length"), "0"))
+                body = await reader.readexactly(length) if length else b""
+                status, payload = await self._respond(body)
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\nConnection: keep-alive\r\n\r\n".encode()
+                    + data
+                )
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def _respond(self, body: bytes) -> tuple[int, dict]:
+        self.stats.requests += 1
+        config = self.config
+        delay = config.latency + (self._random.uniform(0, config.jitter) if config.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        roll = self._random.random()
+        if roll < config.throttle_rate:
+            self.stats.throttled += 1
+            return 429, {
+                "ok": False,
+                "error_code": 429,
+                "description": "Too Many Requests",
+                "parameters": {"retry_after": config.retry_after},
+            }
+        if roll < config.throttle_rate + config.error_rate:
+            self.stats.errors += 1
+            return 500, {"ok": False, "error_code": 500, "description": "Internal Server Error"}
+
+        self.stats.delivered += 1
+        text = json.loads(body or b"{}").get("text", "")
+        self.stats.deliveries[text] = time.perf_counter()
+        return 200, {"ok": True, "result": {"message_id": self.stats.delivered}}
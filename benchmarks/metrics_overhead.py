@@ -0,0 +1,70 @@
+"""Measure the per-request cost of ``MetricsMiddleware``.
+
+Run with ``uv run python -m benchmarks.metrics_overhead``. The script drives a
+bare ASGI app with and without the middleware and exits non-zero when the
+added latency per request exceeds the budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+
+from app.services.metrics import MetricsMiddleware, MetricsRegistry
+
+BUDGET_MICROSECONDS = 5.0
+
+
+class _Route:
+    name = "home"
+
+
+async def _bare_app(scope, receive, send) -> None:
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _receive() -> dict:
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message) -> None:
+    return None
+
+
+async def _drive(app, iterations: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/"}
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await app(dict(scope), _receive, _send)
+    return time.perf_counter() - start
+
+
+async def measure(iterations: int, rounds: int) -> float:
+    histogram = MetricsRegistry().histogram("bench_seconds", "Benchmark.", ("route", "method", "status"))
+    instrumented = MetricsMiddleware(_bare_app, histogram=histogram)
+    overheads = []
+    for _ in range(rounds):
+        baseline = await _drive(_bare_app, iterations)
+        measured = await _drive(instrumented, iterations)
+        overheads.append((measured - baseline) / iterations * 1e6)
+    return min(overheads)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--budget-us", type=float, default=BUDGET_MICROSECONDS)
+    args = parser.parse_args(argv)
+
+    overhead = asyncio.run(measure(args.iterations, args.rounds))
+    print(f"metrics middleware overhead: {overhead:.2f} us/request (budget {args.budget_us:.2f} us)")
+    return 0 if overhead <= args.budget_us else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
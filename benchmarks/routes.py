@@ -0,0 +1,200 @@
+"""Load-test every public route in-process and against a real uvicorn server.
+
+Run with ``uv run python -m benchmarks.routes``. Results are compared with the
+JSON baselines in ``benchmarks/baselines/``; the command exits non-zero when a
+latency, throughput or allocation figure regresses beyond ``--threshold``.
+Use ``--update-baseline`` on the reference machine to refresh them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable
+
+import httpx
+
+from benchmarks.support import (
+    RouteResult,
+    create_bench_app,
+    find_regressions,
+    format_table,
+    load_baseline,
+    save_baseline,
+)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    path: str
+    expected_status: int
+    body: Callable[[int], dict] | None = None
+
+
+def _contact_body(index: int) -> dict:
+    return {
+        "name": "Bench User",
+        "email": f"bench{index}@example.com",
+        "message": "Benchmark message that satisfies the validation rules.",
+    }
+
+
+SCENARIOS = (
+    Scenario("home", "GET", "/", 200),
+    Scenario("legal-page", "GET", "/legal/privacy", 200),
+    Scenario("static", "GET", "/static/css/app.css", 200),
+    Scenario("sitemap", "GET", "/sitemap.xml", 200),
+    Scenario("enqueue_contact_message", "POST", "/api/contact", 202, _contact_body),
+)
+
+_counter = itertools.count()
+
+
+async def _request(client: httpx.AsyncClient, scenario: Scenario) -> float:
+    index = next(_counter)
+    # Spread contact submissions across client addresses so the per-IP limit never trips.
+    headers = {"X-Forwarded-For": f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}"}
+    kwargs = {"json": scenario.body(index)} if scenario.body else {}
+    start = time.perf_counter()
+    response = await client.request(scenario.method, scenario.path, headers=headers, **kwargs)
+    elapsed = time.perf_counter() - start
+    if response.status_code != scenario.expected_status:
+        raise RuntimeError(f"{scenario.name}: unexpected status {response.status_code}")
+    return elapsed
+
+
+async def _run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    measure_allocations: bool,
+) -> RouteResult:
+    for _ in range(min(50, requests)):
+        await _request(client, scenario)
+
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            latencies.append(await _request(client, scenario))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    peak_alloc = None
+    if measure_allocations:
+        samples = []
+        tracemalloc.start()
+        for _ in range(min(100, requests)):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await _request(client, scenario)
+            _, peak = tracemalloc.get_traced_memory()
+            samples.append(peak - baseline)
+        tracemalloc.stop()
+        peak_alloc = sum(samples) / len(samples) / 1024
+
+    return RouteResult.from_samples(scenario.name, latencies, elapsed, peak_alloc)
+
+
+@contextlib.asynccontextmanager
+async def inprocess_client() -> AsyncIterator[httpx.AsyncClient]:
+    app = create_bench_app()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.asynccontextmanager
+async def uvicorn_client() -> AsyncIterator[httpx.AsyncClient]:
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "benchmarks.support:create_bench_app",
+            "--factory",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ]
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=httpx.Limits(max_keepalive_connections=64)) as client:
+            deadline = time.monotonic() + 15
+            while True:
+                try:
+                    await client.get("/robots.txt")
+                    break
+                except httpx.TransportError:
+                    if time.monotonic() > deadline or process.poll() is not None:
+                        raise RuntimeError("uvicorn did not start in time")
+                    await asyncio.sleep(0.1)
+            yield client
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+async def run_mode(mode: str, requests: int, concurrency: int) -> list[RouteResult]:
+    opener = inprocess_client if mode == "inprocess" else uvicorn_client
+    async with opener() as client:
+        return [
+            await _run_scenario(client, scenario, requests, concurrency, measure_allocations=mode == "inprocess")
+            for scenario in SCENARIOS
+        ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=("inprocess", "uvicorn", "all"), default="all")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed regression as a fraction")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    modes = ("inprocess", "uvicorn") if args.mode == "all" else (args.mode,)
+    failed = False
+    for mode in modes:
+        results = asyncio.run(run_mode(mode, args.requests, args.concurrency))
+        name = f"routes-{mode}"
+        print(f"\n[{mode}]\n{format_table(results)}")
+        if args.update_baseline:
+            print(f"baseline written to {save_baseline(name, results)}")
+            continue
+        regressions = find_regressions(results, load_baseline(name), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
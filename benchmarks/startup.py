@@ -0,0 +1,136 @@
+"""Measure web-process import time and lifespan startup against a budget.
+
+Run with ``uv run python -m benchmarks.startup``. Each measurement runs in a
+fresh interpreter: ``python -X importtime -c "import main"`` for the import
+cost (which includes building the app) and a lifespan start-up with an
+in-memory queue. ``tests/test_startup_budget.py`` checks that worker-only
+modules stay out of the web process, and enforces the same budgets when
+``STARTUP_BUDGET_CHECK=1`` is set.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Derived from five runs of this script on the reference container (Python
+# 3.10): ``import main`` took 449-454 ms under ``-X importtime`` and the
+# lifespan 52-53 ms. The import budget adds about a third for machine noise.
+# The lifespan figure is small enough that a third is within scheduler jitter,
+# so its budget allows up to double. A regression that doubles the import
+# time, or more than doubles the lifespan, fails the gate.
+# Re-measure and update both numbers when the baseline legitimately moves.
+IMPORT_BUDGET_SECONDS = 0.6
+LIFESPAN_BUDGET_SECONDS = 0.1
+# Worker-only code and lazily loaded backends that importing the web app must not pull in.
+FORBIDDEN_MODULES = (
+    "app.services.telegram",
+    "app.workers.instrumentation",
+    "arq",
+    "coredis",
+    "httpx",
+    "limits",
+    "redis",
+)
+
+_LIFESPAN_SNIPPET = """
+import asyncio, json, time
+from benchmarks.support import create_bench_app
+
+async def main():
+    app = create_bench_app()
+    start = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        elapsed = time.perf_counter() - start
+    print(json.dumps({"lifespan_seconds": elapsed}))
+
+asyncio.run(main())
+"""
+
+_MODULES_SNIPPET = """
+import json, sys
+import main
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+@dataclass
+class ImportProfile:
+    total_seconds: float
+    modules: dict[str, float]
+
+    def heaviest(self, count: int = 10) -> list[tuple[str, float]]:
+        return sorted(self.modules.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+def _python(*args: str) -> subprocess.CompletedProcess[str]:
+    # pytest-cov switches coverage on in child interpreters via COV_CORE_*;
+    # measuring under a tracer would inflate every figure by about half.
+    env = {key: value for key, value in os.environ.items() if not key.startswith("COV_CORE_")}
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+def parse_importtime(stderr: str) -> ImportProfile:
+    """Parse ``-X importtime`` output: cumulative time of ``main`` and self time per module."""
+    modules: dict[str, float] = {}
+    total = 0.0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        module = name.strip()
+        modules[module] = modules.get(module, 0.0) + int(self_us) / 1_000_000
+        if module == "main":
+            total = int(cumulative_us) / 1_000_000
+    return ImportProfile(total, modules)
+
+
+def measure_import() -> ImportProfile:
+    return parse_importtime(_python("-X", "importtime", "-c", "import main").stderr)
+
+
+def imported_modules() -> list[str]:
+    return json.loads(_python("-c", _MODULES_SNIPPET).stdout.strip().splitlines()[-1])
+
+
+def forbidden_imports(modules: list[str]) -> list[str]:
+    return sorted(
+        name for name in modules if any(name == bad or name.startswith(bad + ".") for bad in FORBIDDEN_MODULES)
+    )
+
+
+def measure_lifespan() -> float:
+    return json.loads(_python("-c", _LIFESPAN_SNIPPET).stdout.strip().splitlines()[-1])["lifespan_seconds"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    profiles = [measure_import() for _ in range(args.rounds)]
+    best = min(profiles, key=lambda profile: profile.total_seconds)
+    lifespan = min(measure_lifespan() for _ in range(args.rounds))
+    leaked = forbidden_imports(imported_modules())
+
+    print(f"import main: {best.total_seconds * 1000:.1f} ms (budget {IMPORT_BUDGET_SECONDS * 1000:.0f} ms)")
+    print("heaviest modules (self time):")
+    for name, seconds in best.heaviest():
+        print(f"  {name:<40} {seconds * 1000:8.1f} ms")
+    print(f"lifespan startup: {lifespan * 1000:.1f} ms (budget {LIFESPAN_BUDGET_SECONDS * 1000:.0f} ms)")
+    if leaked:
+        print(f"worker-only modules imported by the web app: {', '.join(leaked)}")
+
+    over_budget = best.total_seconds > IMPORT_BUDGET_SECONDS or lifespan > LIFESPAN_BUDGET_SECONDS
+    return 1 if over_budget or leaked else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
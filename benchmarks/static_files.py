@@ -0,0 +1,86 @@
+"""Compare the in-memory static backend with Starlette's ``StaticFiles`` mount.
+
+Run with ``uv run python -m benchmarks.static_files``. Both backends are
+mounted on a bare Starlette app and driven in-process through
+``httpx.ASGITransport`` with the same request mix, so the figures isolate the
+per-request file handling (``stat`` + ``open`` + read vs. a dictionary hit).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+
+from app.services.static_files import MemoryStaticFiles
+from benchmarks.support import RouteResult, format_table
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+CASES = (
+    ("css", "/static/css/app.css", {}),
+    ("font", "/static/fonts/FiraCode-Regular.woff2", {}),
+    ("bootstrap", "/static/vendor/bootstrap/css/bootstrap.min.css", {}),
+    ("range", "/static/fonts/FiraCode-Regular.woff2", {"Range": "bytes=0-4095"}),
+)
+
+
+def _app(backend: str) -> Starlette:
+    static = MemoryStaticFiles(STATIC_DIR) if backend == "memory" else StaticFiles(directory=STATIC_DIR)
+    return Starlette(routes=[Mount("/static", app=static)])
+
+
+async def _run_case(
+    client: httpx.AsyncClient, label: str, path: str, headers: dict[str, str], requests: int, concurrency: int
+) -> RouteResult:
+    for _ in range(min(50, requests)):
+        await client.get(path, headers=headers)
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code not in (200, 206):
+                raise RuntimeError(f"{label}: unexpected status {response.status_code}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return RouteResult.from_samples(label, latencies, time.perf_counter() - start, None)
+
+
+async def run(requests: int, concurrency: int) -> list[RouteResult]:
+    results = []
+    for backend in ("starlette", "memory"):
+        transport = httpx.ASGITransport(app=_app(backend))
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name, path, headers in CASES:
+                results.append(await _run_case(client, f"{backend}:{name}", path, headers, requests, concurrency))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args.requests, args.concurrency))
+    print(format_table(results))
+    by_name = {result.route: result for result in results}
+    for name, _, _ in CASES:
+        before, after = by_name[f"starlette:{name}"], by_name[f"memory:{name}"]
+        print(f"{name}: {after.rps / before.rps:.2f}x requests/sec")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
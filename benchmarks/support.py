@@ -0,0 +1,140 @@
+"""Shared helpers for the benchmark suite: app stand-ins, statistics and baselines."""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI
+from limits.aio.storage import MemoryStorage
+
+from app.factory import create_app
+from app.services.rate_limit import reset_rate_limit_service
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+
+class InMemoryQueue:
+    """``DummyRedis``-style stand-in for the ARQ pool used by ``/api/contact``.
+
+    Jobs are treated as picked up as soon as they are enqueued, so the
+    ``QueueMonitor`` samples behind the backpressure check see an empty queue
+    and every submission runs the full admit path.
+    """
+
+    def __init__(self) -> None:
+        self.jobs: list[tuple[str, Any]] = []
+
+    async def enqueue_job(self, name: str, *args: Any, **kwargs: Any) -> str:
+        self.jobs.append((name, args))
+        return f"{name}-{len(self.jobs)}"
+
+    async def zcard(self, name: str) -> int:
+        return 0
+
+    async def zrange(self, name: str, start: int, end: int, withscores: bool = False) -> list[tuple[bytes, float]]:
+        return []
+
+    async def close(self) -> None:
+        self.jobs.clear()
+
+
+def create_bench_app() -> FastAPI:
+    """App factory used in-process and by ``uvicorn --factory`` for benchmarks."""
+    reset_rate_limit_service(MemoryStorage())
+    queue = InMemoryQueue()
+
+    async def factory() -> InMemoryQueue:
+        return queue
+
+    return create_app(redis_pool_factory=factory)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+@dataclass
+class RouteResult:
+    route: str
+    requests: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    rps: float
+    peak_alloc_kib: float | None = None
+
+    @classmethod
+    def from_samples(
+        cls,
+        route: str,
+        latencies: list[float],
+        elapsed: float,
+        peak_alloc_kib: float | None = None,
+    ) -> "RouteResult":
+        return cls(
+            route=route,
+            requests=len(latencies),
+            p50_ms=round(percentile(latencies, 50) * 1000, 3),
+            p95_ms=round(percentile(latencies, 95) * 1000, 3),
+            p99_ms=round(percentile(latencies, 99) * 1000, 3),
+            rps=round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+            peak_alloc_kib=None if peak_alloc_kib is None else round(peak_alloc_kib, 2),
+        )
+
+
+def load_baseline(name: str) -> dict[str, dict[str, Any]]:
+    path = BASELINE_DIR / f"{name}.json"
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(name: str, results: list[RouteResult]) -> Path:
+    BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    path = BASELINE_DIR / f"{name}.json"
+    payload = {result.route: asdict(result) for result in results}
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def find_regressions(
+    results: list[RouteResult],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Return human-readable regressions exceeding ``threshold`` (a fraction, e.g. 0.2)."""
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.route)
+        if reference is None:
+            continue
+        for field in ("p50_ms", "p95_ms", "p99_ms", "peak_alloc_kib"):
+            current, previous = getattr(result, field), reference.get(field)
+            if current is None or not previous:
+                continue
+            if current > previous * (1 + threshold):
+                regressions.append(f"{result.route}: {field} {previous} -> {current}")
+        previous_rps = reference.get("rps")
+        if previous_rps and result.rps < previous_rps * (1 - threshold):
+            regressions.append(f"{result.route}: rps {previous_rps} -> {result.rps}")
+    return regressions
+
+
+def format_table(results: list[RouteResult]) -> str:
+    header = f"{'route':<24}{'reqs':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'rps':>10}{'alloc KiB':>11}"
+    rows = [header, "-" * len(header)]
+    for result in results:
+        alloc = "-" if result.peak_alloc_kib is None else f"{result.peak_alloc_kib:.2f}"
+        rows.append(
+            f"{result.route:<24}{result.requests:>7}{result.p50_ms:>10.3f}{result.p95_ms:>10.3f}"
+            f"{result.p99_ms:>10.3f}{result.rps:>10.1f}{alloc:>11}"
+        )
+    return "\n".join(rows)
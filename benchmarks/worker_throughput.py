@@ -0,0 +1,214 @@
+"""Measure contact-job throughput of ``WorkerSettings`` against a fake Telegram API.
+
+Run with ``uv run python -m benchmarks.worker_throughput``. Jobs are pushed
+through an in-memory queue stand-in that mimics ARQ's scheduling (``max_jobs``
+concurrent slots, ``Retry`` deferrals, ``max_tries``), so the real job
+functions, lifecycle hooks and HTTP client are exercised without Redis.
+Tune ``--max-jobs``, ``--pool-size`` and ``--max-tries`` to compare settings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import heapq
+import itertools
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from benchmarks.fake_telegram import FakeTelegramConfig, FakeTelegramServer
+from benchmarks.support import percentile
+
+
+@dataclass(order=True)
+class _QueuedJob:
+    run_at: float
+    sequence: int
+    name: str = field(compare=False)
+    args: tuple = field(compare=False)
+    kwargs: dict = field(compare=False)
+    job_try: int = field(compare=False, default=1)
+
+
+class LocalQueue:
+    """In-memory replacement for the ARQ Redis queue with ``enqueue_job`` semantics.
+
+    It also keeps the Redis sets ``fan_out`` uses to skip destinations that
+    were already delivered to when a job is retried.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[_QueuedJob] = []
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._sets: dict[str, set[str]] = {}
+        self.enqueued_at: dict[int, float] = {}
+
+    async def smembers(self, key: str) -> set[str]:
+        return set(self._sets.get(key, ()))
+
+    async def sadd(self, key: str, *members: str) -> int:
+        existing = self._sets.setdefault(key, set())
+        added = set(members) - existing
+        existing.update(added)
+        return len(added)
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        return key in self._sets
+
+    async def enqueue_job(self, name: str, *args: Any, **kwargs: Any) -> int:
+        sequence = next(self._sequence)
+        self.enqueued_at[sequence] = time.perf_counter()
+        self.push(_QueuedJob(time.perf_counter(), sequence, name, args, kwargs))
+        return sequence
+
+    def push(self, job: _QueuedJob) -> None:
+        heapq.heappush(self._heap, job)
+        self._wakeup.set()
+
+    async def pop(self) -> _QueuedJob:
+        while True:
+            if self._heap:
+                delay = self._heap[0].run_at - time.perf_counter()
+                if delay <= 0:
+                    return heapq.heappop(self._heap)
+            else:
+                delay = None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+
+async def run_harness(jobs: int, max_jobs: int, max_tries: int, fake: FakeTelegramServer) -> dict[str, Any]:
+    from arq import Retry
+
+    from app.worker import WorkerSettings
+
+    functions = {func.__name__: func for func in WorkerSettings.functions}
+    queue = LocalQueue()
+    ctx: dict[str, Any] = {"redis": queue}
+    await WorkerSettings.on_startup(ctx)
+
+    completed = failed = retries = 0
+    done = asyncio.Event()
+
+    async def consume() -> None:
+        nonlocal completed, failed, retries
+        while True:
+            job = await queue.pop()
+            job_ctx = {**ctx, "job_id": str(job.sequence), "job_try": job.job_try}
+            try:
+                await functions[job.name](job_ctx, *job.args, **job.kwargs)
+                completed += 1
+            except Retry as exc:
+                if job.job_try < max_tries:
+                    retries += 1
+                    job.job_try += 1
+                    job.run_at = time.perf_counter() + (exc.defer_score or 0) / 1000
+                    queue.push(job)
+                    continue
+                failed += 1
+            except Exception:
+                failed += 1
+            if completed + failed >= jobs:
+                done.set()
+
+    start = time.perf_counter()
+    for index in range(jobs):
+        await queue.enqueue_job(
+            "send_telegram_message",
+            {"name": f"bench-{index}", "email": f"bench{index}@example.com", "message": "Throughput benchmark."},
+        )
+    consumers = [asyncio.create_task(consume()) for _ in range(max_jobs)]
+    await done.wait()
+    elapsed = time.perf_counter() - start
+    for task in consumers:
+        task.cancel()
+    await asyncio.gather(*consumers, return_exceptions=True)
+    await WorkerSettings.on_shutdown(ctx)
+
+    latencies = []
+    for text, delivered_at in fake.stats.deliveries.items():
+        index = int(text.split("Name: bench-", 1)[1].split("\n", 1)[0])
+        latencies.append(delivered_at - queue.enqueued_at[index])
+
+    return {
+        "jobs": jobs,
+        "completed": completed,
+        "failed": failed,
+        "retries": retries,
+        "elapsed_s": round(elapsed, 3),
+        "jobs_per_s": round(completed / elapsed, 1),
+        "latency_p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "latency_p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "latency_p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "http_requests": fake.stats.requests,
+        "http_connections": fake.stats.connections,
+        "requests_per_connection": round(fake.stats.requests_per_connection, 1),
+        "throttled": fake.stats.throttled,
+        "server_errors": fake.stats.errors,
+    }
+
+
+async def _main(args: argparse.Namespace) -> dict[str, Any]:
+    config = FakeTelegramConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    async with FakeTelegramServer(config) as fake:
+        from app.config import get_settings
+
+        overrides = {
+            "TELEGRAM_API_BASE": fake.base_url,
+            "TELEGRAM_MAX_CONNECTIONS": str(args.pool_size),
+            "WORKER_MAX_JOBS": str(args.max_jobs),
+            "WORKER_MAX_TRIES": str(args.max_tries),
+        }
+        saved = {key: os.environ.get(key) for key in overrides}
+        os.environ.update(overrides)
+        get_settings.cache_clear()
+        try:
+            return await run_harness(args.jobs, args.max_jobs, args.max_tries, fake)
+        finally:
+            # Callers running the harness in-process (the test suite) must not
+            # inherit the fake server's URL or the benchmark's worker limits.
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+            get_settings.cache_clear()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--max-jobs", type=int, default=10, help="concurrent job slots (WORKER_MAX_JOBS)")
+    parser.add_argument("--pool-size", type=int, default=10, help="HTTP connections (TELEGRAM_MAX_CONNECTIONS)")
+    parser.add_argument("--max-tries", type=int, default=5, help="attempts per job (WORKER_MAX_TRIES)")
+    parser.add_argument("--latency", type=float, default=0.02, help="fake API latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of calls answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls answered with 500")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(_main(args))
+    width = max(len(key) for key in report)
+    for key, value in report.items():
+        print(f"{key:<{width}}  {value}")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+
 import httpx
 import pytest
 import pytest_asyncio
@@ -13,16 +15,46 @@ from limits.aio.storage import MemoryStorage
 class DummyRedis:
     def __init__(self) -> None:
         self.jobs: list[tuple[str, dict[str, str]]] = []
+        self.envelopes: list[dict[str, object]] = []
+        self.scores: list[float] = []
+        self.keys: set[str] = set()
+        self.pings = 0
         self.closed: bool = False
 
-    async def enqueue_job(self, name: str, payload: dict[str, str]):
+    async def enqueue_job(self, name: str, payload: dict[str, str], **kwargs: object):
         self.jobs.append((name, payload))
+        self.envelopes.append(kwargs)
+        self.scores.append(time.time() * 1000)
         return f"{name}-job"
 
+    async def ping(self) -> bool:
+        self.pings += 1
+        return True
+
+    async def exists(self, *names: str) -> int:
+        return sum(1 for name in names if name in self.keys)
+
+    async def zcard(self, name: str) -> int:
+        return len(self.scores)
+
+    async def zrange(self, name: str, start: int, end: int, withscores: bool = False):
+        ordered = sorted(self.scores)[start : None if end == -1 else end + 1]
+        return [(f"job-{index}".encode(), score) for index, score in enumerate(ordered)]
+
     async def close(self) -> None:
         self.closed = True
 
 
+class Clock:
+    """Manually advanced stand-in for ``time.monotonic``."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
 @pytest.fixture
 def dummy_redis() -> DummyRedis:
     return DummyRedis()
@@ -53,6 +85,7 @@ async def client(dummy_redis: DummyRedis):
     app = create_app(redis_pool_factory=factory)
     lifespan = app.router.lifespan_context(app)
     await lifespan.__aenter__()
+    await app.state.redis_pool.wait(1.0)
     try:
         transport = httpx.ASGITransport(app=app)
         async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as async_client:
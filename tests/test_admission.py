@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from app.config import get_settings
+from app.factory import create_app
+from app.services.admission import AdmissionController, AdmissionMiddleware, ClassLimiter, Overloaded, classify
+from app.services.metrics import metrics
+from tests.conftest import Clock
+
+
+def make_limiter(clock: Clock | None = None, **overrides: Any) -> ClassLimiter:
+    options: dict[str, Any] = dict(
+        max_in_flight=1, max_queue=1, queue_timeout=0.5, codel_target=0.05, codel_interval=0.1
+    )
+    options.update(overrides)
+    return ClassLimiter("pages", clock=clock or Clock(100), **options)
+
+
+def test_paths_are_classified() -> None:
+    assert classify("/") == "pages"
+    assert classify("/legal/privacy") == "pages"
+    assert classify("/static/css/app.css") == "static"
+    assert classify("/api/contact") == "api"
+    assert classify("/metrics") is None
+
+
+@pytest.mark.asyncio
+async def test_waiters_receive_released_slots_in_order() -> None:
+    limiter = make_limiter(max_queue=2)
+    await limiter.acquire()
+    order: list[int] = []
+
+    async def wait(index: int) -> None:
+        await limiter.acquire()
+        order.append(index)
+
+    tasks = [asyncio.create_task(wait(index)) for index in (1, 2)]
+    await asyncio.sleep(0)
+    assert limiter.queued == 2
+    assert limiter.saturated
+
+    limiter.release()
+    await asyncio.sleep(0)
+    limiter.release()
+    await asyncio.gather(*tasks)
+
+    assert order == [1, 2]
+    assert limiter.in_flight == 1
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_and_timeouts_reject() -> None:
+    limiter = make_limiter(queue_timeout=0.01)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    with pytest.raises(Overloaded) as full:
+        await limiter.acquire()
+    assert full.value.reason == "queue_full"
+
+    with pytest.raises(Overloaded) as timed_out:
+        await waiter
+    assert timed_out.value.reason == "timeout"
+    assert limiter.queued == 0
+
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_handed_off_slot() -> None:
+    limiter = make_limiter()
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.release()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.in_flight == 0
+
+    await limiter.acquire()
+    abandoned = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    abandoned.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await abandoned
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_codel_drops_while_sojourn_stays_above_target() -> None:
+    clock = Clock(100)
+    limiter = make_limiter(clock)
+    await limiter.acquire()
+
+    limiter._observe_sojourn(0.2)
+    assert not limiter.dropping
+    clock.now += 0.05
+    limiter._observe_sojourn(0.2)
+    assert not limiter.dropping
+    clock.now += 0.1
+    limiter._observe_sojourn(0.2)
+    assert limiter.dropping
+
+    with pytest.raises(Overloaded) as dropped:
+        await limiter.acquire()
+    assert dropped.value.reason == "codel"
+
+    limiter._observe_sojourn(0.01)
+    assert not limiter.dropping
+
+
+@pytest.mark.asyncio
+async def test_slow_queue_enters_dropping_until_the_queue_drains() -> None:
+    limiter = ClassLimiter(
+        "pages", max_in_flight=1, max_queue=1, queue_timeout=0.01, codel_target=0.001, codel_interval=0.001
+    )
+    await limiter.acquire()
+
+    for _ in range(2):
+        with pytest.raises(Overloaded):
+            await limiter.acquire()
+    assert limiter.dropping
+
+    limiter.release()
+    await limiter.acquire()
+    assert not limiter.dropping
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    limiter.release()
+    await waiter
+    assert not limiter.dropping
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_api_is_shed_while_pages_are_saturated() -> None:
+    controller = AdmissionController(
+        {name: make_limiter() for name in ("pages", "static", "api")},
+        retry_after=3,
+    )
+    pages = controller.limiters["pages"]
+    await controller.admit("pages")
+    waiter = asyncio.create_task(controller.admit("pages"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(Overloaded) as shed:
+        await controller.admit("api")
+    assert shed.value.reason == "priority"
+    assert await controller.admit("static") is controller.limiters["static"]
+
+    pages.release()
+    await waiter
+    assert await controller.admit("api") is controller.limiters["api"]
+
+
+@pytest.mark.asyncio
+async def test_middleware_returns_503_with_retry_after() -> None:
+    metrics.reset()
+    release = asyncio.Event()
+    started = asyncio.Event()
+
+    async def slow_app(scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] == "/slow":
+            started.set()
+            await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    controller = AdmissionController(
+        {name: make_limiter(max_queue=0) for name in ("pages", "static", "api")},
+        retry_after=2,
+    )
+    app = AdmissionMiddleware(slow_app, controller)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        slow = asyncio.create_task(client.get("/slow"))
+        await started.wait()
+
+        rejected = await client.get("/")
+        static = await client.get("/static/css/app.css")
+        exempt = await client.get("/metrics")
+
+        release.set()
+        assert (await slow).status_code == 200
+
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == "2"
+    assert rejected.json() == {"detail": "Service is temporarily overloaded. Please retry shortly."}
+    assert static.status_code == 200
+    assert exempt.status_code == 200
+    assert controller.limiters["pages"].in_flight == 0
+    assert 'admission_rejections_total{route_class="pages",reason="queue_full"} 1.0' in metrics.render()
+
+
+def test_admission_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ADMISSION_ENABLED", "false")
+    get_settings.cache_clear()
+    app = create_app()
+    assert all(middleware.cls is not AdmissionMiddleware for middleware in app.user_middleware)
+
+    monkeypatch.setenv("ADMISSION_ENABLED", "true")
+    monkeypatch.setenv("ADMISSION_API_LIMIT", "4")
+    monkeypatch.setenv("ADMISSION_RETRY_AFTER_SECONDS", "1.5")
+    get_settings.cache_clear()
+    app = create_app()
+    (middleware,) = [entry for entry in app.user_middleware if entry.cls is AdmissionMiddleware]
+    controller = middleware.kwargs["controller"]
+    assert controller.limiters["api"].max_in_flight == 4
+    assert controller.retry_after == 2
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from contextlib import asynccontextmanager
 from types import SimpleNamespace
 
@@ -18,6 +19,7 @@ from tests.conftest import DummyRedis
 async def lifespan_client(app):
     lifespan = app.router.lifespan_context(app)
     await lifespan.__aenter__()
+    await app.state.redis_pool.wait(1.0)
     try:
         transport = httpx.ASGITransport(app=app)
         async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as async_client:
@@ -134,7 +136,7 @@ async def test_app_uses_default_pool_factory(monkeypatch: pytest.MonkeyPatch) ->
         captured_settings["settings"] = redis_settings
         return dummy_pool
 
-    monkeypatch.setattr("app.factory.create_pool", fake_create_pool)
+    monkeypatch.setattr("arq.connections.create_pool", fake_create_pool)
 
     app = create_app()
     async with lifespan_client(app) as async_client:
@@ -169,3 +171,119 @@ async def test_app_handles_synchronous_close() -> None:
         await async_client.get("/")
 
     assert sync_pool.closed is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (b"", {"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}),
+        (
+            b"{bad",
+            {
+                "type": "json_invalid",
+                "loc": ["body", 1],
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": "Expecting property name enclosed in double quotes"},
+            },
+        ),
+        (
+            b"[1]",
+            {
+                "type": "model_type",
+                "loc": ["body"],
+                "msg": "Input should be a valid dictionary or instance of ContactRequest",
+                "input": [1],
+                "ctx": {"class_name": "ContactRequest"},
+            },
+        ),
+    ],
+)
+async def test_contact_endpoint_rejects_malformed_bodies(
+    client: httpx.AsyncClient, dummy_redis: DummyRedis, content: bytes, expected: dict
+) -> None:
+    response = await client.post("/api/contact", content=content, headers={"content-type": "application/json"})
+
+    assert response.status_code == httpx.codes.UNPROCESSABLE_ENTITY
+    assert response.json() == {"detail": [expected]}
+    assert dummy_redis.jobs == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content", [b"\xc3(", b'{"name": "\xff\xfe"}', b"\xff\xfe{"])
+async def test_contact_endpoint_rejects_undecodable_bodies(
+    client: httpx.AsyncClient, dummy_redis: DummyRedis, content: bytes
+) -> None:
+    response = await client.post("/api/contact", content=content, headers={"content-type": "application/json"})
+
+    assert response.status_code == httpx.codes.BAD_REQUEST
+    assert response.json() == {"detail": "There was an error parsing the body"}
+    assert dummy_redis.jobs == []
+
+
+@pytest.mark.asyncio
+async def test_contact_endpoint_decodes_streamed_bodies_after_reassembly(
+    client: httpx.AsyncClient, dummy_redis: DummyRedis
+) -> None:
+    body = json.dumps(
+        {"name": "Zoë Streamed", "email": "zoe@example.com", "message": "Split across chunks mid-character."},
+        ensure_ascii=False,
+    ).encode()
+    split = body.index("ë".encode()) + 1
+
+    async def chunks(parts: list[bytes]):
+        for part in parts:
+            yield part
+
+    headers = {"content-type": "application/json"}
+    accepted = await client.post("/api/contact", content=chunks([body[:split], body[split:]]), headers=headers)
+    rejected = await client.post("/api/contact", content=chunks([b'{"name": "', b"\xc3(", b'"}']), headers=headers)
+
+    assert accepted.status_code == httpx.codes.ACCEPTED
+    assert dummy_redis.jobs[0][1]["name"] == "Zoë Streamed"
+    assert rejected.status_code == httpx.codes.BAD_REQUEST
+    assert rejected.json() == {"detail": "There was an error parsing the body"}
+    assert len(dummy_redis.jobs) == 1
+
+
+@pytest.mark.asyncio
+async def test_contact_endpoint_reports_field_errors(client: httpx.AsyncClient) -> None:
+    response = await client.post("/api/contact", json={"name": "x", "email": "bad", "message": "short"})
+
+    assert response.status_code == httpx.codes.UNPROCESSABLE_ENTITY
+    errors = response.json()["detail"]
+    assert [error["loc"] for error in errors] == [["body", "name"], ["body", "email"], ["body", "message"]]
+    assert errors[0]["type"] == "string_too_short"
+
+
+@pytest.mark.asyncio
+async def test_contact_openapi_documents_request_body(client: httpx.AsyncClient) -> None:
+    schema = (await client.get("/openapi.json")).json()
+
+    body = schema["paths"]["/api/contact"]["post"]["requestBody"]
+    assert body["content"]["application/json"]["schema"]["required"] == ["name", "email", "message"]
+
+
+@pytest.mark.asyncio
+async def test_contact_endpoint_rejects_oversized_bodies(
+    client: httpx.AsyncClient, dummy_redis: DummyRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CONTACT_MAX_BODY_BYTES", "64")
+    get_settings.cache_clear()
+    declared = await client.post("/api/contact", content=b"x" * 65, headers={"content-type": "application/json"})
+
+    sent: list[int] = []
+
+    async def chunks():
+        for index in range(100):
+            sent.append(index)
+            yield b"x" * 16
+
+    streamed = await client.post("/api/contact", content=chunks(), headers={"content-type": "application/json"})
+
+    for response in (declared, streamed):
+        assert response.status_code == httpx.codes.REQUEST_ENTITY_TOO_LARGE
+        assert response.json() == {"detail": "Request body is too large."}
+    assert len(sent) < 100
+    assert dummy_redis.jobs == []
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+from typing import Any
+
+import httpx
+import pytest
+from arq import Retry
+
+from app.config import Settings
+from app.services.destinations import (
+    DestinationRegistry,
+    DestinationThrottled,
+    WebhookDestination,
+    destination_registry,
+    fan_out,
+)
+from app.services.telegram import TelegramDestination
+
+PAYLOAD = {"name": "Lead", "email": "lead@example.com", "message": "Please get in touch."}
+
+
+class SetRedis:
+    def __init__(self) -> None:
+        self.sets: dict[str, set[bytes]] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def smembers(self, key: str) -> set[bytes]:
+        return set(self.sets.get(key, set()))
+
+    async def sadd(self, key: str, *members: str) -> int:
+        self.sets.setdefault(key, set()).update(member.encode() for member in members)
+        return len(members)
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        self.ttls[key] = seconds
+        return True
+
+
+class FakeDestination:
+    running = 0
+    max_running = 0
+
+    def __init__(self, name: str, failures: list[BaseException] | None = None, delay: float = 0.0) -> None:
+        self.name = name
+        self.failures = list(failures or [])
+        self.delay = delay
+        self.calls = 0
+
+    async def deliver(self, client: httpx.AsyncClient, payload: dict[str, Any]) -> None:
+        self.calls += 1
+        FakeDestination.running += 1
+        FakeDestination.max_running = max(FakeDestination.max_running, FakeDestination.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                raise self.failures.pop(0)
+        finally:
+            FakeDestination.running -= 1
+
+
+def _status_error(code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://sink.example")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(code, request=request))
+
+
+def test_registry_builds_configured_destinations() -> None:
+    legacy = destination_registry.build(Settings(TELEGRAM_CHAT_ID=42))
+    assert legacy == [TelegramDestination("telegram", 42, Settings().telegram_api_url)]
+
+    settings = Settings(
+        NOTIFICATION_DESTINATIONS=[
+            {"type": "telegram", "name": "sales", "chat_id": "-100123"},
+            {"type": "webhook", "name": "crm", "url": "https://crm.example/hook", "secret": "s3cret"},
+        ]
+    )
+    sales, crm = destination_registry.build(settings)
+    assert (sales.name, sales.chat_id) == ("sales", "-100123")
+    assert crm == WebhookDestination("crm", "https://crm.example/hook", "s3cret")
+
+    with pytest.raises(ValueError, match="Unknown"):
+        destination_registry.build(Settings(NOTIFICATION_DESTINATIONS=[{"type": "pigeon"}]))
+    with pytest.raises(ValueError, match="unique"):
+        destination_registry.build(Settings(NOTIFICATION_DESTINATIONS=[{"type": "webhook", "url": "u"}] * 2))
+
+    registry = DestinationRegistry()
+    registry.register("sink")(lambda settings, spec: FakeDestination("sink"))
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register("sink")(lambda settings, spec: FakeDestination("sink"))
+
+
+@pytest.mark.asyncio
+async def test_webhook_posts_signed_json() -> None:
+    captured: dict[str, Any] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        captured["body"] = request.content
+        captured["signature"] = request.headers.get("x-webhook-signature")
+        return httpx.Response(204)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await WebhookDestination("crm", "https://crm.example/hook", "s3cret").deliver(client, PAYLOAD)
+        expected = hmac.new(b"s3cret", captured["body"], hashlib.sha256).hexdigest()
+        assert json.loads(captured["body"]) == PAYLOAD
+        assert captured["signature"] == f"sha256={expected}"
+
+        await WebhookDestination("open", "https://open.example/hook").deliver(client, PAYLOAD)
+        assert captured["signature"] is None
+
+
+@pytest.mark.asyncio
+async def test_webhook_reports_throttling() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "soon"}, text="busy")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(DestinationThrottled) as exc_info:
+            await WebhookDestination("crm", "https://crm.example/hook", default_retry_after=2.5).deliver(client, PAYLOAD)
+    assert exc_info.value.retry_after == 2.5
+
+
+@pytest.mark.asyncio
+async def test_fan_out_retries_only_destinations_that_have_not_succeeded() -> None:
+    redis = SetRedis()
+    ok = FakeDestination("ok")
+    throttled = FakeDestination("throttled", [DestinationThrottled(5.0)])
+    flaky = FakeDestination("flaky", [httpx.ConnectError("down")])
+    ctx = {"http_client": None, "redis": redis, "job_id": "job-1"}
+
+    with pytest.raises(Retry) as exc_info:
+        await fan_out(ctx, [ok, throttled, flaky], PAYLOAD, dedupe_ttl=60)
+    assert exc_info.value.defer_score == 5000
+    assert redis.sets["contact:delivered:job-1"] == {b"ok"}
+    assert redis.ttls["contact:delivered:job-1"] == 60
+
+    await fan_out(ctx, [ok, throttled, flaky], PAYLOAD)
+    assert (ok.calls, throttled.calls, flaky.calls) == (1, 2, 2)
+    assert redis.sets["contact:delivered:job-1"] == {b"ok", b"throttled", b"flaky"}
+
+
+@pytest.mark.asyncio
+async def test_fan_out_bounds_concurrency_and_raises_permanent_failures_last() -> None:
+    FakeDestination.running = FakeDestination.max_running = 0
+    broken = FakeDestination("broken", [_status_error(400)])
+    others = [FakeDestination(f"chat-{index}", delay=0.01) for index in range(5)]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await fan_out({"http_client": None}, [broken, *others], PAYLOAD, concurrency=2)
+
+    assert FakeDestination.max_running == 2
+    assert all(destination.calls == 1 for destination in others)
+
+    transient = FakeDestination("transient", [_status_error(503)])
+    with pytest.raises(Retry) as exc_info:
+        await fan_out({"http_client": None}, [transient], PAYLOAD, default_retry_after=3.0)
+    assert exc_info.value.defer_score == 3000
+
+
+@pytest.mark.asyncio
+async def test_fan_out_does_not_resend_permanent_failures_on_retry() -> None:
+    redis = SetRedis()
+    broken = FakeDestination("broken", [_status_error(400)])
+    throttled = FakeDestination("throttled", [DestinationThrottled(1.0)])
+    ctx = {"http_client": None, "redis": redis, "job_id": "job-2"}
+
+    with pytest.raises(Retry):
+        await fan_out(ctx, [broken, throttled], PAYLOAD)
+    assert redis.sets["contact:delivered:job-2"] == {b"broken"}
+
+    await fan_out(ctx, [broken, throttled], PAYLOAD)
+    assert (broken.calls, throttled.calls) == (1, 2)
+
+
+class ReadOnlyRedis(SetRedis):
+    async def sadd(self, key: str, *members: str) -> int:
+        raise ConnectionError("redis went away")
+
+
+@pytest.mark.asyncio
+async def test_fan_out_treats_a_send_as_done_when_recording_it_fails() -> None:
+    sent = FakeDestination("sent")
+
+    await fan_out({"http_client": None, "redis": ReadOnlyRedis(), "job_id": "job-3"}, [sent], PAYLOAD)
+
+    assert sent.calls == 1
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+from limits.aio.storage import MemoryStorage
+
+from app.factory import create_app
+from app.services.admission import classify
+from app.services.health import WORKER_HEARTBEAT_KEY, ReadinessProbe
+from app.services.rate_limit import reset_rate_limit_service
+from tests.conftest import Clock, DummyRedis
+
+
+class BrokenStorage(MemoryStorage):
+    async def check(self) -> bool:
+        raise ConnectionError("storage down")
+
+
+class HangingRedis(DummyRedis):
+    async def ping(self) -> bool:
+        await asyncio.sleep(1)
+        return True  # pragma: no cover - always times out
+
+
+@pytest.mark.asyncio
+async def test_healthz_does_no_io(client: httpx.AsyncClient, dummy_redis: DummyRedis) -> None:
+    response = await client.get("/healthz")
+
+    assert response.status_code == httpx.codes.OK
+    assert response.json() == {"status": "ok"}
+    assert response.headers["cache-control"] == "no-store"
+    assert dummy_redis.pings == 0
+
+
+@pytest.mark.asyncio
+async def test_readyz_reports_dependencies(client: httpx.AsyncClient, dummy_redis: DummyRedis) -> None:
+    dummy_redis.keys.add(WORKER_HEARTBEAT_KEY)
+
+    response = await client.get("/readyz")
+
+    assert response.status_code == httpx.codes.OK
+    report = response.json()
+    assert report["ready"] is True
+    assert set(report["checks"]) == {"warm_up", "legal_content", "redis", "rate_limit_storage", "worker_heartbeat"}
+    assert all(check["ok"] for check in report["checks"].values())
+    assert report["checks"]["redis"]["latency_ms"] >= 0
+    assert report["checks"]["worker_heartbeat"]["required"] is False
+
+
+@pytest.mark.asyncio
+async def test_readyz_is_cached_between_probes(client: httpx.AsyncClient, dummy_redis: DummyRedis) -> None:
+    responses = await asyncio.gather(*(client.get("/readyz") for _ in range(10)))
+
+    assert {response.status_code for response in responses} == {httpx.codes.OK}
+    assert dummy_redis.pings == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_worker_heartbeat_does_not_fail_readiness(client: httpx.AsyncClient) -> None:
+    report = (await client.get("/readyz")).json()
+
+    assert report["ready"] is True
+    assert report["checks"]["worker_heartbeat"]["ok"] is False
+
+
+@pytest.mark.asyncio
+async def test_readyz_fails_before_warm_up() -> None:
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.get("/readyz")
+
+    assert response.status_code == httpx.codes.SERVICE_UNAVAILABLE
+    checks = response.json()["checks"]
+    assert checks["warm_up"] == {"ok": False, "latency_ms": 0.0, "detail": "lifespan warm-up in progress", "required": True}
+    assert checks["redis"]["detail"] == "job queue pool unavailable"
+    assert "worker_heartbeat" not in checks
+
+
+@pytest.mark.asyncio
+async def test_probe_reports_failures_and_timeouts() -> None:
+    reset_rate_limit_service(BrokenStorage())
+    clock = Clock()
+    probe = ReadinessProbe(ttl=2.0, timeout=0.01, clock=clock)
+    state: Any = SimpleNamespace(warmed_up=True, redis=HangingRedis())
+
+    report = await probe.check(state)
+    assert report["ready"] is False
+    assert report["checks"]["redis"]["detail"] == "timeout"
+    assert report["checks"]["rate_limit_storage"]["detail"] == "ConnectionError: storage down"
+
+    state.redis = DummyRedis()
+    assert await probe.check(state) is report
+    clock.now = 2.0
+    assert (await probe.check(state))["checks"]["redis"]["ok"] is True
+
+
+def test_health_endpoints_skip_admission_control() -> None:
+    assert classify("/healthz") is None
+    assert classify("/readyz") is None
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Iterator
+
+import httpx
+import pytest
+
+from app.config import get_settings
+from app.services import metrics as metrics_module
+from app.services.metrics import MetricsRegistry, metrics
+from app.workers import instrumentation
+from app.workers.registry import JobRegistry
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics() -> Iterator[None]:
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("events_total", "Events seen.", ("kind",))
+    gauge = registry.gauge("queue_depth", "Jobs waiting.")
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+    counter.labels('a"b').inc()
+    counter.labels('a"b').inc(2)
+    gauge.set(7)
+    histogram.labels("home").observe(0.05)
+    histogram.labels("home").observe(0.5)
+    histogram.labels("home").observe(5)
+
+    text = registry.render()
+
+    assert "# TYPE events_total counter" in text
+    assert 'events_total{kind="a\\"b"} 3.0' in text
+    assert "queue_depth 7.0" in text
+    assert 'latency_seconds_bucket{route="home",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="home",le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{route="home",le="+Inf"} 3' in text
+    assert 'latency_seconds_sum{route="home"} 5.55' in text
+    assert 'latency_seconds_count{route="home"} 3' in text
+
+
+def test_registry_rejects_duplicates_and_bad_labels() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("dupe_total", "Duplicate.", ("kind",))
+
+    with pytest.raises(ValueError):
+        registry.counter("dupe_total", "Duplicate.")
+    with pytest.raises(ValueError):
+        counter.labels("a", "b")
+
+
+def test_unlabelled_helpers_and_timer() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("plain_total", "Plain.")
+    histogram = registry.histogram("plain_seconds", "Plain.")
+
+    counter.inc()
+    with histogram.time():
+        pass
+    histogram.observe(0.001)
+
+    text = registry.render()
+    assert "plain_total 1.0" in text
+    assert "plain_seconds_count 2" in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_latencies(client: httpx.AsyncClient) -> None:
+    await client.get("/")
+    await client.get("/legal/privacy")
+    await client.get("/static/css/app.css")
+    await client.get("/missing")
+    await client.request("BREW", "/missing")
+    await client.request("PROPFIND-x", "/missing")
+    await client.post(
+        "/api/contact",
+        json={"name": "Metric", "email": "metric@example.com", "message": "Long enough metrics message."},
+    )
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == httpx.codes.OK
+    assert response.headers["content-type"] == metrics_module.CONTENT_TYPE_LATEST
+    text = response.text
+    assert 'http_request_duration_seconds_count{route="home",method="GET",status="200"} 1' in text
+    assert 'http_request_duration_seconds_count{route="legal-page",method="GET",status="200"} 1' in text
+    assert 'http_request_duration_seconds_count{route="static",method="GET",status="200"} 1' in text
+    assert 'http_request_duration_seconds_count{route="unmatched",method="GET",status="404"} 1' in text
+    assert 'http_request_duration_seconds_count{route="unmatched",method="OTHER",status="404"} 2' in text
+    assert "BREW" not in text
+    assert 'route="enqueue_contact_message",method="POST",status="202"' in text
+    assert 'template_render_duration_seconds_count{template="home.html"} 1' in text
+    assert 'job_enqueue_duration_seconds_count{job="send_telegram_message"} 1' in text
+    assert 'rate_limit_decision_duration_seconds_count{namespace="contact",outcome="allowed"} 1' in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_middleware_passes_through_non_http_scopes() -> None:
+    seen: list[str] = []
+
+    async def app(scope, receive, send) -> None:
+        seen.append(scope["type"])
+
+    middleware = metrics_module.MetricsMiddleware(app)
+    await middleware({"type": "lifespan"}, None, None)
+
+    assert seen == ["lifespan"]
+
+
+@pytest.mark.asyncio
+async def test_job_metrics_middleware_records_outcomes_and_retries() -> None:
+    registry = JobRegistry()
+    registry.middleware(instrumentation.record_job_metrics)
+
+    @registry.job()
+    async def flaky(ctx: dict[str, Any], payload: dict[str, Any]) -> str:
+        if payload["fail"]:
+            raise RuntimeError("boom")
+        return "done"
+
+    (job,) = registry.functions
+    assert await job({"job_try": 2}, {"fail": False}) == "done"
+    with pytest.raises(RuntimeError):
+        await job({}, {"fail": True})
+
+    text = metrics.render()
+    assert 'job_retries_total{job="flaky"} 1.0' in text
+    assert 'job_duration_seconds_count{job="flaky",outcome="success"} 1' in text
+    assert 'job_duration_seconds_count{job="flaky",outcome="error"} 1' in text
+
+
+@pytest.mark.asyncio
+async def test_worker_metrics_server_lifecycle(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("WORKER_METRICS_HOST", "127.0.0.1")
+    monkeypatch.setenv("WORKER_METRICS_PORT", "0")
+    get_settings.cache_clear()
+
+    ctx: dict[str, Any] = {}
+    await instrumentation.instrumentation_startup(ctx)
+    server = ctx["metrics_server"]
+    port = server.sockets[0].getsockname()[1]
+
+    async with httpx.AsyncClient() as http_client:
+        response = await http_client.get(f"http://127.0.0.1:{port}/metrics")
+    assert response.status_code == httpx.codes.OK
+    assert "job_duration_seconds" in response.text
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /metrics")
+    writer.write_eof()
+    assert await reader.read() == b""
+    writer.close()
+
+    await instrumentation.instrumentation_shutdown(ctx)
+    assert "metrics_server" not in ctx
+
+
+@pytest.mark.asyncio
+async def test_worker_metrics_server_disabled_by_default() -> None:
+    ctx: dict[str, Any] = {}
+    await instrumentation.instrumentation_startup(ctx)
+    assert "metrics_server" not in ctx
+    await instrumentation.instrumentation_shutdown(ctx)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+from jinja2 import DictLoader, Environment
+from starlette.applications import Starlette
+from starlette.responses import HTMLResponse, PlainTextResponse
+from starlette.routing import Route
+
+from app.routers.pages import templates
+from app.services.preload import EARLY_HINT, PreloadMiddleware, extract_hints
+
+LAYOUT = """
+<link rel="stylesheet" href="{{ url_for('static', path='css/site.css') }}">
+{% include 'partials/nav.html' %}{% include 'partials/nav.html' %}
+{% block body %}{% endblock %}
+<script src="{{ url_for('static', path='js/site.js') }}"></script>
+"""
+
+
+def test_hints_follow_template_inheritance_and_stylesheet_fonts(tmp_path: Path) -> None:
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "site.css").write_text(
+        "@font-face { src: url('../fonts/Body.woff2?v=2') format('woff2'), url(../fonts/Body.ttf); }\n"
+        "@font-face { src: url(\"../fonts/Body.woff2\"); }\n"
+        ".icon { background: url(../img/icon.svg); }\n"
+    )
+    env = Environment(
+        loader=DictLoader(
+            {
+                "layout.html": LAYOUT,
+                "partials/nav.html": "<nav></nav>",
+                "page.html": "{% extends 'layout.html' %}{% block body %}"
+                "<link rel=\"stylesheet\" href=\"{{ url_for('static', path='css/missing.css') }}\">"
+                "{% endblock %}",
+            }
+        )
+    )
+
+    hints = extract_hints(env, "page.html", "fonts/*.woff2", static_root=tmp_path)
+
+    assert [hint.link() for hint in hints] == [
+        "</static/css/site.css>; rel=preload; as=style",
+        "</static/css/missing.css>; rel=preload; as=style",
+        '</static/fonts/Body.woff2>; rel=preload; as=font; type="font/woff2"; crossorigin',
+        "</static/js/site.js>; rel=preload; as=script",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pages_announce_their_critical_subresources(client: httpx.AsyncClient) -> None:
+    response = await client.get("/")
+    links = response.headers["link"].split(", ")
+
+    assert "</static/css/app.css>; rel=preload; as=style" in links
+    assert '</static/fonts/FiraCode-Regular.woff2>; rel=preload; as=font; type="font/woff2"; crossorigin' in links
+    assert "</static/vendor/bootstrap/js/bootstrap.bundle.min.js>; rel=preload; as=script" in links
+    assert (await client.get("/legal/terms")).headers["link"] == response.headers["link"]
+
+    assert "link" not in (await client.get("/legal/unknown")).headers
+    assert "link" not in (await client.get("/robots.txt")).headers
+    assert "link" not in (await client.get("/static/css/app.css")).headers
+
+
+async def _call(app, path: str, method: str = "GET", extensions: dict | None = None) -> list[dict]:
+    messages: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "extensions": extensions or {},
+    }
+    scope["app"] = app
+    await app(scope, receive, send)
+    return messages
+
+
+def _app(**options) -> Starlette:
+    async def page(request):
+        return HTMLResponse("<p>hi</p>")
+
+    async def text(request):
+        return PlainTextResponse("hi")
+
+    app = Starlette(routes=[Route("/", page, name="home"), Route("/text", text, name="text")])
+    app.add_middleware(
+        PreloadMiddleware, env=templates.env, routes={"home": "home.html", "text": "home.html"}, **options
+    )
+    return app
+
+
+@pytest.mark.asyncio
+async def test_early_hints_are_sent_only_when_the_server_supports_them() -> None:
+    app = _app()
+
+    hinted = await _call(app, "/", extensions={EARLY_HINT: {}})
+    assert hinted[0]["type"] == EARLY_HINT
+    assert b"</static/css/app.css>; rel=preload; as=style" in hinted[0]["links"]
+    assert hinted[1]["type"] == "http.response.start"
+
+    plain = await _call(app, "/")
+    assert plain[0]["type"] == "http.response.start"
+    assert (b"link", b", ".join(hinted[0]["links"])) in plain[0]["headers"]
+
+    disabled = await _call(_app(early_hints=False), "/", extensions={EARLY_HINT: {}})
+    assert disabled[0]["type"] == "http.response.start"
+
+
+@pytest.mark.asyncio
+async def test_non_html_and_unsafe_requests_are_left_alone() -> None:
+    app = _app()
+
+    for path, method in (("/text", "GET"), ("/", "POST"), ("/missing", "GET")):
+        messages = await _call(app, path, method)
+        assert messages[0]["type"] == "http.response.start"
+        assert all(name != b"link" for name, _ in messages[0]["headers"])
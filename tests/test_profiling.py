@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from app.config import get_settings
+from app.factory import create_app
+from app.services.profiling import PROFILE_HEADER, Profiler, ProfilingMiddleware, sign_profile_token
+from app.workers import instrumentation
+from app.workers.registry import JobRegistry
+from tests.conftest import DummyRedis
+
+
+def _busy_wait(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _wait_for_profiles(directory: Path, count: int = 1) -> list[Path]:
+    for _ in range(200):
+        files = sorted(directory.glob("*.collapsed"))
+        if len(files) >= count:
+            return files
+        await asyncio.sleep(0.01)
+    raise AssertionError("profile was not written")
+
+
+@asynccontextmanager
+async def profiled_client(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, **env: str):
+    monkeypatch.setenv("PROFILING_ENABLED", "true")
+    monkeypatch.setenv("PROFILING_OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setenv("PROFILING_INTERVAL_SECONDS", "0.001")
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    get_settings.cache_clear()
+    dummy = DummyRedis()
+
+    async def factory():
+        return dummy
+
+    app = create_app(redis_pool_factory=factory)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            yield client
+
+
+def test_profile_tokens_are_verified() -> None:
+    profiler = Profiler(Path("unused"), interval=0.01, secret="s3cret")
+
+    assert profiler.verify_token(sign_profile_token("s3cret"))
+    assert not profiler.verify_token(sign_profile_token("other"))
+    assert not profiler.verify_token(sign_profile_token("s3cret", ttl_seconds=-10))
+    assert not profiler.verify_token("garbage")
+    assert not profiler.verify_token(None)
+    assert not Profiler(Path("unused"), interval=0.01).verify_token(sign_profile_token("s3cret"))
+
+
+def test_sampling_rate_selects_requests() -> None:
+    assert Profiler(Path("unused"), interval=0.01, sample_rate=1.0).should_profile()
+    assert not Profiler(Path("unused"), interval=0.01, sample_rate=0.0).should_profile()
+
+
+@pytest.mark.asyncio
+async def test_signed_request_writes_collapsed_stacks(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    async with profiled_client(monkeypatch, tmp_path, PROFILING_SECRET="s3cret") as client:
+        response = await client.get("/", headers={PROFILE_HEADER: sign_profile_token("s3cret")})
+        assert response.status_code == httpx.codes.OK
+        (profile,) = await _wait_for_profiles(tmp_path)
+
+        unsigned = await client.get("/legal/privacy")
+        assert unsigned.status_code == httpx.codes.OK
+
+    assert "-home-" in profile.name
+    lines = profile.read_text(encoding="utf-8").splitlines()
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert len(list(tmp_path.glob("*.collapsed"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_only_one_profile_runs_at_a_time(tmp_path: Path) -> None:
+    profiler = Profiler(tmp_path, interval=0.001, sample_rate=1.0)
+    first = profiler.start()
+    assert first is not None
+    assert profiler.start() is None
+
+    _busy_wait(0.05)
+    profiler.finish(first, "busy/label")
+    first.join(timeout=2)
+
+    (profile,) = tmp_path.glob("*.collapsed")
+    assert "-busy_label-" in profile.name
+    assert "test_profiling:_busy_wait" in profile.read_text(encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_profiling_middleware_skips_non_http_and_busy_profiler(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    async def app(scope, receive, send) -> None:
+        calls.append(scope["type"])
+
+    profiler = Profiler(tmp_path, interval=0.001, sample_rate=1.0)
+    middleware = ProfilingMiddleware(app, profiler)
+    await middleware({"type": "lifespan"}, None, None)
+
+    running = profiler.start()
+    await middleware({"type": "http", "headers": [], "path": "/"}, None, None)
+    assert running is not None
+    profiler.finish(running, "manual")
+    running.join(timeout=2)
+
+    assert calls == ["lifespan", "http"]
+    assert len(list(tmp_path.glob("*.collapsed"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_job_profiling_middleware(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("PROFILING_ENABLED", "true")
+    monkeypatch.setenv("PROFILING_SAMPLE_RATE", "1.0")
+    monkeypatch.setenv("PROFILING_OUTPUT_DIR", str(tmp_path))
+    get_settings.cache_clear()
+
+    registry = JobRegistry()
+    registry.middleware(instrumentation.profile_job)
+
+    @registry.job()
+    async def sample(ctx: dict[str, Any], payload: dict[str, Any]) -> str:
+        return payload["value"]
+
+    (job,) = registry.functions
+    assert await job({}, {"value": "unprofiled"}) == "unprofiled"
+
+    ctx: dict[str, Any] = {}
+    await instrumentation.instrumentation_startup(ctx)
+    assert await job(ctx, {"value": "profiled"}) == "profiled"
+    (profile,) = await _wait_for_profiles(tmp_path)
+    await instrumentation.instrumentation_shutdown(ctx)
+
+    assert "-sample-" in profile.name
+    assert "profiler" not in ctx
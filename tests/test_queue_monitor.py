@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from app.services import queue_monitor as queue_monitor_module
+from app.services.metrics import metrics
+from app.services.queue_monitor import BackpressurePolicy, QueueMonitor, QueueSnapshot
+from tests.conftest import Clock, DummyRedis
+
+PAYLOAD = {"name": "Queue", "email": "queue@example.com", "message": "Long enough backlog message."}
+
+
+class SlowRedis(DummyRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.samples = 0
+
+    async def zcard(self, name: str) -> int:
+        self.samples += 1
+        await asyncio.sleep(0)
+        return await super().zcard(name)
+
+
+class FailingRedis:
+    calls = 0
+
+    async def zcard(self, name: str) -> int:
+        self.calls += 1
+        raise ConnectionError("redis down")
+
+
+def backlog(depth: int, age: float = 0.0) -> DummyRedis:
+    redis = DummyRedis()
+    now_ms = time.time() * 1000
+    redis.scores = [now_ms - age * 1000] + [now_ms] * (depth - 1)
+    return redis
+
+
+@pytest.mark.asyncio
+async def test_monitor_samples_depth_and_lag_and_caches() -> None:
+    clock = Clock(10)
+    monitor = QueueMonitor(sample_interval=1.0, clock=clock)
+    redis = backlog(3, age=42)
+
+    snapshot = await monitor.sample(redis)
+    assert snapshot.depth == 3
+    assert snapshot.oldest_age == pytest.approx(42, abs=1)
+
+    redis.scores = []
+    assert await monitor.sample(redis) is snapshot
+
+    clock.now += 1.0
+    assert await monitor.sample(redis) == QueueSnapshot(0, 0.0, clock.now)
+    assert "arq_queue_depth 0.0" in metrics.render()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_samples_share_one_redis_round_trip() -> None:
+    monitor = QueueMonitor(sample_interval=1.0)
+    redis = SlowRedis()
+
+    first, second = await asyncio.gather(monitor.sample(redis), monitor.sample(redis))
+
+    assert first == second
+    assert redis.samples == 1
+
+
+@pytest.mark.asyncio
+async def test_monitor_keeps_last_snapshot_on_errors() -> None:
+    clock = Clock(10)
+    monitor = QueueMonitor(sample_interval=1.0, clock=clock)
+    assert monitor.snapshot == QueueSnapshot()
+    await monitor.sample(backlog(5))
+
+    clock.now += 2
+    failing = FailingRedis()
+    snapshot = await monitor.sample(failing)
+    await monitor.sample(failing)
+
+    assert snapshot.depth == 5
+    assert failing.calls == 1
+
+
+def test_policy_delay_scales_between_thresholds() -> None:
+    policy = BackpressurePolicy(soft_depth=10, hard_depth=20, soft_age=60, hard_age=60, max_delay=1.0, retry_after=5)
+
+    assert policy.delay(QueueSnapshot(depth=5)) == 0
+    assert policy.delay(QueueSnapshot(depth=15)) == 0.5
+    assert policy.delay(QueueSnapshot(depth=5, oldest_age=60)) == 1.0
+    assert not policy.rejects(QueueSnapshot(depth=19))
+    assert policy.rejects(QueueSnapshot(depth=20))
+    assert policy.rejects(QueueSnapshot(oldest_age=60))
+
+
+@pytest.mark.asyncio
+async def test_contact_is_slowed_then_rejected(
+    monkeypatch: pytest.MonkeyPatch, client: httpx.AsyncClient, dummy_redis: DummyRedis
+) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(queue_monitor_module.asyncio, "sleep", fake_sleep)
+    app: Any = client._transport.app  # type: ignore[attr-defined]
+    app.state.queue_monitor = QueueMonitor(sample_interval=0)
+    app.state.backpressure_policy = BackpressurePolicy(
+        soft_depth=2, hard_depth=4, soft_age=600, hard_age=900, max_delay=1.0, retry_after=29.5
+    )
+
+    dummy_redis.scores = [time.time() * 1000] * 3
+    slowed = await client.post("/api/contact", json=PAYLOAD)
+    assert slowed.status_code == httpx.codes.ACCEPTED
+    assert sleeps == [0.5]
+
+    rejected = await client.post("/api/contact", json=PAYLOAD, headers={"X-Forwarded-For": "203.0.113.9"})
+    assert rejected.status_code == httpx.codes.SERVICE_UNAVAILABLE
+    assert rejected.headers["retry-after"] == "30"
+    assert len(dummy_redis.jobs) == 1
+
+    text = (await client.get("/metrics")).text
+    assert "arq_queue_depth 4.0" in text
+    assert 'contact_backpressure_total{action="rejected"} 1.0' in text
+
+    app.state.queue_monitor = None
+    unmonitored = await client.post("/api/contact", json=PAYLOAD)
+    assert unmonitored.status_code == httpx.codes.ACCEPTED
+
+
+@pytest.mark.asyncio
+async def test_shed_submissions_do_not_use_up_the_rate_limit(
+    client: httpx.AsyncClient, dummy_redis: DummyRedis
+) -> None:
+    app: Any = client._transport.app  # type: ignore[attr-defined]
+    app.state.queue_monitor = QueueMonitor(sample_interval=0)
+    app.state.backpressure_policy = BackpressurePolicy(
+        soft_depth=1, hard_depth=1, soft_age=600, hard_age=900, max_delay=1.0, retry_after=5
+    )
+    dummy_redis.scores = [time.time() * 1000]
+
+    for _ in range(5):
+        shed = await client.post("/api/contact", json=PAYLOAD)
+        assert shed.status_code == httpx.codes.SERVICE_UNAVAILABLE
+
+    dummy_redis.scores = []
+    accepted = await client.post("/api/contact", json=PAYLOAD)
+    assert accepted.status_code == httpx.codes.ACCEPTED
@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 
 import pytest
+from fastapi import HTTPException, Request
+from limits import RateLimitItemPerMinute
 from limits.aio.storage import MemoryStorage
 
 from app.services import rate_limit
@@ -33,10 +35,23 @@ def test_build_redis_storage_includes_password(monkeypatch: pytest.MonkeyPatch)
     monkeypatch.setenv("REDIS_HOST", "cache")
     monkeypatch.setenv("REDIS_PORT", "6380")
     monkeypatch.setenv("REDIS_DB", "2")
-    monkeypatch.setattr(rate_limit, "RedisStorage", DummyStorage)
+    monkeypatch.setattr("limits.aio.storage.RedisStorage", DummyStorage)
     rate_limit.get_settings.cache_clear()
 
     storage = rate_limit._build_redis_storage()
 
     assert isinstance(storage, DummyStorage)
     assert captured_uri["uri"] == "redis://:super-secret@cache:6380/2"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_accepts_items_and_strings() -> None:
+    rate_limit.reset_rate_limit_service(MemoryStorage())
+    request = Request({"type": "http", "headers": [], "client": ("203.0.113.1", 1234)})
+
+    for item in (RateLimitItemPerMinute(1), "1/minute"):
+        dependency = rate_limit.rate_limit(item, namespace=f"spec-{type(item).__name__}")
+        await dependency(request)
+        with pytest.raises(HTTPException) as exc_info:
+            await dependency(request)
+        assert exc_info.value.status_code == 429
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.factory import create_app
+from app.services.redis_pool import CONNECTING, FAILED, READY, RedisPoolManager
+from tests.conftest import DummyRedis
+
+PAYLOAD = {"name": "Slow Redis", "email": "slow@example.com", "message": "Sent while the pool is connecting."}
+
+
+class SlowPoolFactory:
+    """Hands out the pool only once ``release()`` is called."""
+
+    def __init__(self, pool: DummyRedis) -> None:
+        self.pool = pool
+        self.calls = 0
+        self.cancelled = False
+        self._released = asyncio.Event()
+
+    def release(self) -> None:
+        self._released.set()
+
+    async def __call__(self) -> DummyRedis:
+        self.calls += 1
+        try:
+            await self._released.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self.pool
+
+
+@pytest.mark.asyncio
+async def test_startup_does_not_wait_for_redis(dummy_redis: DummyRedis) -> None:
+    factory = SlowPoolFactory(dummy_redis)
+    app = create_app(redis_pool_factory=factory)
+    lifespan = app.router.lifespan_context(app)
+
+    started = time.perf_counter()
+    await lifespan.__aenter__()
+    assert time.perf_counter() - started < 1.0
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            page = await client.get("/")
+            assert page.status_code == httpx.codes.OK
+            assert app.state.redis_pool.state == CONNECTING
+
+            ready = await client.get("/readyz")
+            assert ready.status_code == httpx.codes.SERVICE_UNAVAILABLE
+            assert ready.json()["checks"]["redis"]["detail"] == "job queue pool connecting"
+
+            asyncio.get_running_loop().call_later(0.05, factory.release)
+            response = await client.post("/api/contact", json=PAYLOAD)
+    finally:
+        await lifespan.__aexit__(None, None, None)
+
+    assert response.status_code == httpx.codes.ACCEPTED
+    assert [name for name, _ in dummy_redis.jobs] == ["send_telegram_message"]
+    assert app.state.redis_pool.state == READY
+    assert dummy_redis.closed is True
+
+
+@pytest.mark.asyncio
+async def test_contact_degrades_when_pool_is_not_ready(monkeypatch: pytest.MonkeyPatch, dummy_redis: DummyRedis) -> None:
+    monkeypatch.setenv("REDIS_READY_WAIT_SECONDS", "0.01")
+    factory = SlowPoolFactory(dummy_redis)
+    app = create_app(redis_pool_factory=factory)
+    lifespan = app.router.lifespan_context(app)
+    await lifespan.__aenter__()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            response = await client.post("/api/contact", json=PAYLOAD)
+    finally:
+        await lifespan.__aexit__(None, None, None)
+
+    assert response.status_code == httpx.codes.SERVICE_UNAVAILABLE
+    assert response.json()["detail"] == "Job queue unavailable."
+    assert factory.cancelled is True
+    assert dummy_redis.closed is False
+
+
+@pytest.mark.asyncio
+async def test_manager_backs_off_then_keeps_retrying_slowly() -> None:
+    pool = DummyRedis()
+    sleeps: list[tuple[float, str]] = []
+    while_failed: list[tuple[str, object]] = []
+    calls = 0
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append((seconds, manager.state))
+        if manager.state == FAILED and not while_failed:
+            while_failed.append((manager.detail, await manager.wait(1.0)))
+
+    async def factory() -> DummyRedis:
+        nonlocal calls
+        calls += 1
+        if calls <= 7:
+            raise ConnectionError("redis down")
+        return pool
+
+    manager = RedisPoolManager(
+        factory, attempts=5, backoff_initial=0.5, backoff_max=3.0, retry_interval=30.0, sleep=fake_sleep
+    )
+    manager.start()
+    manager.start()
+
+    assert await manager.wait(1.0) is pool
+    assert calls == 8
+    assert [seconds for seconds, _ in sleeps] == [0.5, 1.0, 2.0, 3.0, 30.0, 30.0, 30.0]
+    assert [state for _, state in sleeps] == [CONNECTING] * 4 + [FAILED] * 3
+    assert while_failed == [
+        ("job queue pool failed after 5 attempts: ConnectionError: redis down; retrying every 30s", None)
+    ]
+    assert manager.state == READY
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_manager_recovers_after_transient_failures() -> None:
+    pool = DummyRedis()
+    published: list[DummyRedis] = []
+    failures = [OSError("connection refused")]
+    gate = asyncio.Event()
+
+    async def fake_sleep(seconds: float) -> None:
+        await gate.wait()
+
+    async def factory() -> DummyRedis:
+        if failures:
+            raise failures.pop()
+        return pool
+
+    manager = RedisPoolManager(factory, on_ready=published.append, sleep=fake_sleep)
+    manager.start()
+    await asyncio.sleep(0)
+    assert manager.detail == "job queue pool connecting (last error: OSError: connection refused)"
+
+    gate.set()
+    assert await manager.wait(1.0) is pool
+    assert published == [pool]
+    await manager.close()
+    assert pool.closed is True
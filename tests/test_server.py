@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import socket
+from typing import Any
+
+import pytest
+
+from app import server
+from app.config import Settings, get_settings
+
+
+def test_loop_and_http_prefer_fast_implementations(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+    assert (server.select_loop(), server.select_http()) == ("uvloop", "httptools")
+
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    assert (server.select_loop(), server.select_http()) == ("asyncio", "h11")
+
+
+def test_worker_count_defaults_to_available_cpus(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2}, raising=False)
+
+    assert server.resolve_worker_count(4) == 4
+    assert server.resolve_worker_count(0) == 3
+
+
+def test_bind_socket_listens_only_with_backlog() -> None:
+    worker_socket = server.bind_socket("127.0.0.1", 0, reuse_port=server.supports_reuse_port())
+    try:
+        with pytest.raises(OSError):
+            worker_socket.accept()
+    finally:
+        worker_socket.close()
+
+    shared = server.bind_socket("127.0.0.1", 0, reuse_port=False, backlog=16)
+    try:
+        port = shared.getsockname()[1]
+        with socket.create_connection(("127.0.0.1", port), timeout=1):
+            connection, _ = shared.accept()
+            connection.close()
+        assert shared.get_inheritable()
+    finally:
+        shared.close()
+
+
+def test_uvicorn_config_applies_recycling_and_proxy_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(server.random, "randint", lambda low, high: high)
+    settings = Settings(
+        WEB_MAX_REQUESTS=1000,
+        WEB_MAX_REQUESTS_JITTER=50,
+        WEB_GRACEFUL_TIMEOUT=12.5,
+        WEB_BACKLOG=512,
+        FORWARDED_ALLOW_IPS="*",
+    )
+
+    config = server.build_uvicorn_config(settings)
+
+    assert config.app == server.APP_IMPORT_STRING
+    assert config.limit_max_requests == 1050
+    assert config.timeout_graceful_shutdown == 12
+    assert config.backlog == 512
+    assert config.proxy_headers is True
+    assert config.forwarded_allow_ips == "*"
+    assert server.build_uvicorn_config(Settings()).limit_max_requests is None
+
+
+def test_serve_worker_runs_uvicorn_on_its_own_socket(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("WEB_HOST", "127.0.0.1")
+    monkeypatch.setenv("WEB_PORT", "0")
+    get_settings.cache_clear()
+    served: list[Any] = []
+
+    class FakeServer:
+        def __init__(self, config: Any) -> None:
+            self.config = config
+
+        def run(self, sockets: list[socket.socket]) -> None:
+            served.append((self.config, sockets))
+            for sock in sockets:
+                sock.close()
+
+    monkeypatch.setattr("uvicorn.Server", FakeServer)
+
+    server.serve_worker()
+    shared = socket.socket()
+    server.serve_worker(shared)
+
+    assert len(served) == 2
+    assert served[0][1][0] is not shared
+    assert served[1][1] == [shared]
+
+
+def test_run_production_supervises_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: dict[str, Any] = {}
+
+    class FakeSupervisor:
+        def __init__(
+            self, target: Any, processes: int, args: Any, name: str, graceful_timeout: float, forward_sighup: bool
+        ) -> None:
+            created.update(
+                target=target,
+                processes=processes,
+                args=args(0),
+                name=name,
+                timeout=graceful_timeout,
+                forward_sighup=forward_sighup,
+            )
+
+        def run(self) -> int:
+            return 0
+
+    monkeypatch.setattr(server, "ProcessSupervisor", FakeSupervisor)
+    settings = Settings(
+        WEB_HOST="127.0.0.1", WEB_PORT=0, WEB_WORKERS=3, WEB_GRACEFUL_TIMEOUT=10, SPAM_TOKEN_SECRET="shared"
+    )
+
+    assert server.run_production(settings) == 0
+    assert created == {
+        "target": server.serve_worker,
+        "processes": 3,
+        "args": (None,),
+        "name": "web",
+        "timeout": 15,
+        "forward_sighup": True,
+    }
+
+    monkeypatch.setattr(server, "supports_reuse_port", lambda: False)
+    assert server.run_production(settings) == 0
+    (shared,) = created["args"]
+    assert isinstance(shared, socket.socket)
+    shared.close()
+
+
+def test_run_production_requires_a_shared_spam_secret_for_several_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    started: list[int] = []
+
+    class FakeSupervisor:
+        def __init__(self, target: Any, processes: int, **kwargs: Any) -> None:
+            started.append(processes)
+
+        def run(self) -> int:
+            return 0
+
+    monkeypatch.setattr(server, "ProcessSupervisor", FakeSupervisor)
+    monkeypatch.setattr(server, "supports_reuse_port", lambda: True)
+
+    assert server.run_production(Settings(WEB_WORKERS=2)) == 1
+    assert started == []
+
+    assert server.run_production(Settings(WEB_WORKERS=1)) == 0
+    assert server.run_production(Settings(WEB_WORKERS=2, SPAM_ENABLED=False)) == 0
+    assert started == [1, 2]
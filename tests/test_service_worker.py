@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.factory import create_app
+from app.routers.pages import templates
+from app.services.service_worker import ServiceWorkerScript, build_precache_manifest, manifest_version
+from app.services.static_files import MemoryStaticFiles
+from tests.conftest import DummyRedis
+
+
+def _constant(script: str, name: str):
+    match = re.search(rf"const {name} = new Set\((.*)\);", script)
+    assert match is not None
+    return json.loads(match.group(1))
+
+
+def test_manifest_is_content_hashed(tmp_path: Path) -> None:
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "site.css").write_text("body { color: red; }")
+    (tmp_path / "notes.txt").write_text("not precached")
+    static = MemoryStaticFiles(tmp_path)
+
+    manifest = build_precache_manifest(static.assets, ["css/*.css"])
+    assert manifest == [{"url": "/static/css/site.css", "revision": static.assets["css/site.css"].etag.strip('"')}]
+
+    script = ServiceWorkerScript(templates.env, static, ["css/*.css"])
+    first = script.document(["/"])
+    assert script.document(["/"]) is first
+
+    (tmp_path / "css" / "site.css").write_text("body { color: blue; }")
+    static.reload()
+    second = script.document(["/"])
+    assert second.etag != first.etag
+    assert manifest_version(build_precache_manifest(static.assets, ["css/*.css"])) in second.body.decode()
+
+
+@pytest.mark.asyncio
+async def test_service_worker_precaches_static_tree_and_pages(client: httpx.AsyncClient) -> None:
+    response = await client.get("/sw.js")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert response.headers["cache-control"] == "no-cache"
+    precache = _constant(response.text, "PRECACHE")
+    assert "/static/css/app.css" in precache
+    assert "/static/fonts/FiraCode-Regular.woff2" in precache
+    assert "/static/vendor/bootstrap/js/bootstrap.bundle.min.js" in precache
+    assert "/static/icons/android-chrome-512x512.png" not in precache
+    assert _constant(response.text, "PAGES") == ["/", "/legal/terms", "/legal/privacy", "/legal/cookies"]
+
+    revalidated = await client.get("/sw.js", headers={"If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert 'navigator.serviceWorker.register("/sw.js")' in (await client.get("/")).text
+
+
+@pytest.mark.asyncio
+async def test_service_worker_can_be_disabled(monkeypatch: pytest.MonkeyPatch, dummy_redis: DummyRedis) -> None:
+    monkeypatch.setenv("SERVICE_WORKER_ENABLED", "false")
+
+    async def factory():
+        return dummy_redis
+
+    app = create_app(redis_pool_factory=factory)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            assert (await client.get("/sw.js")).status_code == 404
+            assert "serviceWorker" not in (await client.get("/")).text
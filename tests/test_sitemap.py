@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import gzip
+from datetime import date
+
+import httpx
+import pytest
+
+from app.config import get_settings
+from app.services.sitemap import accepts_gzip, get_sitemap_documents, parse_updated_at
+
+SITE = "https://example.test"
+
+
+def test_updated_at_is_parsed_into_dates() -> None:
+    assert parse_updated_at("Last updated: May 7, 2025") == date(2025, 5, 7)
+    assert parse_updated_at("2025-10-30") == date(2025, 10, 30)
+    assert parse_updated_at("sometime") is None
+
+
+def test_accept_encoding_negotiation() -> None:
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("br;q=1.0, *;q=0.5")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("identity")
+    assert not accepts_gzip("")
+
+
+def test_sitemap_is_generated_from_legal_content() -> None:
+    text = get_sitemap_documents(SITE)["sitemap.xml"].body.decode()
+
+    assert "<urlset" in text
+    assert f"<loc>{SITE}/</loc>" in text
+    assert f"<loc>{SITE}/legal/terms</loc>" in text
+    assert "<lastmod>2025-05-07</lastmod>" in text
+    home = text[text.index(f"<loc>{SITE}/</loc>") : text.index("</url>")]
+    assert "<lastmod>" not in home
+    assert text.index("/legal/terms") < text.index("/legal/privacy") < text.index("/legal/cookies")
+
+
+def test_home_lastmod_comes_from_settings() -> None:
+    text = get_sitemap_documents(SITE, home_updated_at=date(2025, 10, 30))["sitemap.xml"].body.decode()
+
+    home = text[text.index(f"<loc>{SITE}/</loc>") : text.index("</url>")]
+    assert "<lastmod>2025-10-30</lastmod>" in home
+
+
+def test_large_sitemaps_are_sharded_behind_an_index() -> None:
+    documents = get_sitemap_documents(SITE, max_urls=3)
+
+    index = documents["sitemap.xml"].body.decode()
+    assert "<sitemapindex" in index
+    assert f"<loc>{SITE}/sitemap-1.xml</loc>" in index
+    assert f"<loc>{SITE}/sitemap-2.xml</loc>" in index
+    assert "<lastmod>" in index
+    assert documents["sitemap-1.xml"].body.decode().count("<url>") == 3
+    assert documents["sitemap-2.xml"].body.decode().count("<url>") == 1
+    assert "sitemap-3.xml" not in documents
+
+
+@pytest.mark.asyncio
+async def test_sitemap_supports_gzip_and_conditional_requests(client: httpx.AsyncClient) -> None:
+    plain = await client.get("/sitemap.xml", headers={"Accept-Encoding": "identity"})
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in plain.headers
+
+    compressed = await client.get("/sitemap.xml", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.text == plain.text
+    assert compressed.headers["etag"] != plain.headers["etag"]
+
+    for etag in (plain.headers["etag"], f'W/{compressed.headers["etag"]}', "*"):
+        cached = await client.get("/sitemap.xml", headers={"If-None-Match": etag})
+        assert cached.status_code == httpx.codes.NOT_MODIFIED
+        assert cached.content == b""
+
+    stale = await client.get("/sitemap.xml", headers={"If-None-Match": '"other"'})
+    assert stale.status_code == httpx.codes.OK
+
+
+@pytest.mark.asyncio
+async def test_shards_are_served(monkeypatch: pytest.MonkeyPatch, client: httpx.AsyncClient) -> None:
+    monkeypatch.setenv("SITE_URL", SITE)
+    monkeypatch.setenv("SITEMAP_MAX_URLS", "2")
+    get_settings.cache_clear()
+
+    index = await client.get("/sitemap.xml")
+    shard = await client.get("/sitemap-2.xml")
+    missing = await client.get("/sitemap-9.xml")
+    robots = await client.get("/robots.txt")
+
+    assert "<sitemapindex" in index.text
+    assert shard.status_code == httpx.codes.OK
+    assert shard.text.count("<url>") == 2
+    assert missing.status_code == httpx.codes.NOT_FOUND
+    assert robots.text == f"User-agent: *\nAllow: /\n\nSitemap: {SITE}/sitemap.xml\n"
+    assert gzip.decompress(get_sitemap_documents(SITE, 2)["robots.txt"].gzip_body) == robots.content
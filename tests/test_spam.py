@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import re
+
+import httpx
+import pytest
+
+from app.config import Settings
+from app.services.spam import (
+    ACCEPT,
+    QUARANTINE,
+    REJECT,
+    FormTokenCheck,
+    LinkCheck,
+    PatternCheck,
+    RecentSubmissionIndex,
+    SpamFilter,
+    Submission,
+)
+from tests.conftest import DummyRedis
+
+MESSAGE = "Hello, I would like to discuss a project with you."
+
+
+def _submission(**overrides: str) -> Submission:
+    values = {"name": "Jane", "email": "jane@example.com", "message": MESSAGE, "client_ip": "203.0.113.5"}
+    return Submission(**{**values, **overrides})
+
+
+def _signals(check, submission: Submission, now: float = 100.0) -> list[tuple[str, int]]:
+    return [(signal.name, signal.score) for signal in check(submission, now)]
+
+
+def test_form_token_measures_time_to_submit() -> None:
+    tokens = FormTokenCheck("secret", min_seconds=3, max_age=60, clock=lambda: 100.0)
+    token = tokens.issue()
+
+    assert _signals(tokens, _submission(form_token=token), now=101.0) == [("too_fast", 100)]
+    assert _signals(tokens, _submission(form_token=token), now=110.0) == []
+    assert _signals(tokens, _submission(form_token=token), now=500.0) == [("form_token_expired", 20)]
+    forged = FormTokenCheck("other", clock=lambda: 100.0).issue()
+    assert _signals(tokens, _submission(form_token=forged), now=110.0) == [("form_token_invalid", 40)]
+    assert _signals(tokens, _submission(form_token=""), now=110.0) == [("form_token_invalid", 40)]
+
+
+def test_links_and_patterns_are_scored() -> None:
+    links = LinkCheck(max_links=1, score_per_link=30)
+    message = "See https://a.example and www.b.example and http://c.example"
+    assert _signals(links, _submission(message=message)) == [("links", 60)]
+    assert _signals(links, _submission()) == []
+    two_sites = "Our sites: https://www.acme.example and HTTPS://WWW.acme-shop.example/about"
+    assert _signals(LinkCheck(max_links=2), _submission(message=two_sites)) == []
+
+    patterns = PatternCheck()
+    assert _signals(patterns, _submission(message="Cheap BACKLINKS for your site")) == [("pattern", 60)]
+    assert _signals(patterns, _submission()) == []
+    assert _signals(PatternCheck(()), _submission(message="casino")) == []
+
+
+def test_recent_index_flags_repeat_senders_and_stays_bounded() -> None:
+    index = RecentSubmissionIndex(window=60, max_recent=2, max_keys=4)
+    for now in (0.0, 1.0):
+        assert _signals(index, _submission(), now) == []
+        index.record(_submission(), now)
+    assert _signals(index, _submission(client_ip="198.51.100.1"), 2.0) == [("repeat_sender", 50)]
+    assert _signals(index, _submission(), 62.0) == []
+
+    for number in range(3):
+        index.record(_submission(email=f"other{number}@example.com", client_ip=f"10.0.0.{number}"), 3.0)
+    assert _signals(index, _submission(), 3.0) == []
+
+
+def test_filter_sums_signals_into_verdicts() -> None:
+    tokens = FormTokenCheck("secret", clock=lambda: 0.0)
+    recent = RecentSubmissionIndex()
+    spam_filter = SpamFilter(
+        [tokens, PatternCheck(), recent], form_tokens=tokens, recent=recent, clock=lambda: 10.0
+    )
+    token = spam_filter.issue_form_token()
+
+    assert spam_filter.evaluate(_submission(form_token=token)).action == ACCEPT
+    assert spam_filter.evaluate(_submission(form_token=token, message="casino deals")).action == QUARANTINE
+    rejected = spam_filter.evaluate(_submission(message="casino deals"))
+    assert (rejected.action, rejected.score) == (REJECT, 100)
+    assert SpamFilter([]).issue_form_token() == ""
+
+
+def test_filter_from_settings_uses_configured_patterns() -> None:
+    settings = Settings(SPAM_TOKEN_SECRET="shared", SPAM_PATTERNS=["\\bmeeting\\b"])
+    first, second = SpamFilter.from_settings(settings), SpamFilter.from_settings(settings)
+
+    verdict = second.evaluate(_submission(form_token=first.issue_form_token(), message="Let us book a meeting soon."))
+    assert [signal.name for signal in verdict.signals] == ["too_fast", "pattern"]
+
+
+async def _home_token(client: httpx.AsyncClient) -> str:
+    page = (await client.get("/")).text
+    match = re.search(r'name="form_token" value="([^"]+)"', page)
+    assert match is not None
+    return match.group(1)
+
+
+@pytest.mark.asyncio
+async def test_bot_submissions_are_counted_but_not_queued(client: httpx.AsyncClient, dummy_redis: DummyRedis) -> None:
+    token = await _home_token(client)
+    payload = {"name": "Bot", "email": "bot@example.com", "message": MESSAGE, "form_token": token}
+
+    honeypot = await client.post("/api/contact", json={**payload, "website": "https://spam.example"})
+    too_fast = await client.post("/api/contact", json=payload)
+
+    for response in (honeypot, too_fast):
+        assert response.status_code == httpx.codes.ACCEPTED
+        assert response.json() == {"queued": False}
+    assert dummy_redis.jobs == []
+    metrics = (await client.get("/metrics")).text
+    assert 'contact_spam_verdicts_total{verdict="reject"}' in metrics
+
+
+def test_quarantined_submissions_are_logged(caplog: pytest.LogCaptureFixture) -> None:
+    spam_filter = SpamFilter([LinkCheck(max_links=0, score_per_link=50)], quarantine_score=50, reject_score=100)
+
+    with caplog.at_level("WARNING", logger="app.services.spam"):
+        verdict = spam_filter.evaluate(_submission(message="Details at https://www.acme.example"))
+
+    assert verdict.action == "quarantine"
+    assert [record.getMessage() for record in caplog.records] == [
+        "Quarantined contact submission from Jane <jane@example.com> (score 50: links)."
+    ]
+
+
+@pytest.mark.asyncio
+async def test_people_with_two_site_links_are_queued(
+    client: httpx.AsyncClient, dummy_redis: DummyRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    token = await _home_token(client)
+    tokens = client._transport.app.state.spam_filter.form_tokens  # type: ignore[attr-defined]
+    monkeypatch.setattr(tokens, "min_seconds", 0.0)
+    message = "Please review https://www.acme.example and https://www.acme-shop.example before we talk."
+
+    response = await client.post(
+        "/api/contact",
+        json={"name": "Person", "email": "person@example.com", "message": message, "form_token": token},
+    )
+
+    assert response.json() == {"queued": True}
+    assert len(dummy_redis.jobs) == 1
+
+
+@pytest.mark.asyncio
+async def test_people_are_queued_without_the_spam_fields(
+    client: httpx.AsyncClient, dummy_redis: DummyRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    token = await _home_token(client)
+    tokens = client._transport.app.state.spam_filter.form_tokens  # type: ignore[attr-defined]
+    monkeypatch.setattr(tokens, "min_seconds", 0.0)
+    payload = {"name": "Person", "email": "person@example.com", "message": MESSAGE}
+
+    response = await client.post("/api/contact", json={**payload, "website": "", "form_token": token})
+
+    assert response.json() == {"queued": True}
+    assert [job for _, job in dummy_redis.jobs] == [payload]
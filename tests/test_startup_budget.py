@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from benchmarks import startup
+
+# The budgets are wall-clock numbers from one reference machine; shared CI
+# runners are too noisy to fail a build on them, so the timing gate is opt-in.
+requires_budget_check = pytest.mark.skipif(
+    os.environ.get("STARTUP_BUDGET_CHECK") != "1", reason="set STARTUP_BUDGET_CHECK=1 to enforce startup budgets"
+)
+
+
+def test_web_process_does_not_import_worker_only_modules() -> None:
+    assert startup.forbidden_imports(startup.imported_modules()) == []
+
+
+@requires_budget_check
+def test_import_and_lifespan_stay_within_budget() -> None:
+    profile = startup.measure_import()
+
+    assert 0 < profile.total_seconds <= startup.IMPORT_BUDGET_SECONDS
+    assert startup.measure_lifespan() <= startup.LIFESPAN_BUDGET_SECONDS
+
+
+def test_parse_importtime_output() -> None:
+    profile = startup.parse_importtime(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     json.decoder\n"
+        "import time:       300 |        420 |   json\n"
+        "import time:      1000 |       1420 | main\n"
+    )
+
+    assert profile.total_seconds == 0.00142
+    assert profile.heaviest(1) == [("main", 0.001)]
+    assert startup.forbidden_imports(["httpx", "httpx._client", "httpxy", "app.config"]) == ["httpx", "httpx._client"]
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+from email.utils import formatdate
+from pathlib import Path
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from app.services import static_files as static_module
+from app.services.static_files import MemoryStaticFiles, parse_range
+
+STATIC_ROOT = Path(__file__).resolve().parents[1] / "static"
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "site.css").write_text("body { color: #0f0; }\n", encoding="utf-8")
+    (tmp_path / "big.bin").write_bytes(bytes(range(256)) * 8)
+    return tmp_path
+
+
+def make_client(static: MemoryStaticFiles) -> httpx.AsyncClient:
+    app = Starlette(routes=[Mount("/assets", app=static)])
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver/assets")
+
+
+def test_parse_range_variants() -> None:
+    assert parse_range("bytes=0-9", 100) == [(0, 10)]
+    assert parse_range("bytes=90-", 100) == [(90, 100)]
+    assert parse_range("bytes=-5", 100) == [(95, 100)]
+    assert parse_range("bytes=95-200", 100) == [(95, 100)]
+    assert parse_range("bytes=0-1, 5-6", 100) == [(0, 2), (5, 7)]
+    for malformed in ("items=0-1", "bytes=", "bytes=5", "bytes=a-b", "bytes=9-2"):
+        with pytest.raises(static_module.MalformedRange):
+            parse_range(malformed, 100)
+    with pytest.raises(static_module.UnsatisfiableRange):
+        parse_range("bytes=200-", 100)
+
+
+def test_route_path_strips_mount_prefix() -> None:
+    assert static_module._route_path({"path": "/static/a.css", "root_path": "/static"}) == "/a.css"
+    assert static_module._route_path({"path": "/a.css", "root_path": ""}) == "/a.css"
+
+
+@pytest.mark.asyncio
+async def test_serves_files_from_memory_with_validators(tree: Path) -> None:
+    static = MemoryStaticFiles(tree)
+    (tree / "css" / "site.css").unlink()
+
+    async with make_client(static) as client:
+        response = await client.get("/css/site.css")
+        head = await client.head("/css/site.css")
+        missing = await client.get("/css/../big.bin/nope")
+        post = await client.post("/css/site.css")
+
+    assert response.status_code == httpx.codes.OK
+    assert response.text == "body { color: #0f0; }\n"
+    assert response.headers["content-type"] == "text/css; charset=utf-8"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"].startswith('"')
+    assert head.content == b""
+    assert head.headers["content-length"] == response.headers["content-length"]
+    assert missing.status_code == httpx.codes.NOT_FOUND
+    assert post.status_code == httpx.codes.METHOD_NOT_ALLOWED
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests(tree: Path) -> None:
+    static = MemoryStaticFiles(tree)
+    asset = static.assets["css/site.css"]
+    later = formatdate(asset.mtime + 60, usegmt=True)
+    earlier = formatdate(asset.mtime - 60, usegmt=True)
+
+    async with make_client(static) as client:
+        by_etag = await client.get("/css/site.css", headers={"If-None-Match": f"W/{asset.etag}"})
+        other_etag = await client.get("/css/site.css", headers={"If-None-Match": '"nope"', "If-Modified-Since": later})
+        by_date = await client.get("/css/site.css", headers={"If-Modified-Since": later})
+        stale_date = await client.get("/css/site.css", headers={"If-Modified-Since": earlier})
+        bad_date = await client.get("/css/site.css", headers={"If-Modified-Since": "yesterday"})
+
+    assert by_etag.status_code == httpx.codes.NOT_MODIFIED
+    assert by_etag.headers["etag"] == asset.etag
+    assert other_etag.status_code == httpx.codes.OK
+    assert by_date.status_code == httpx.codes.NOT_MODIFIED
+    assert stale_date.status_code == httpx.codes.OK
+    assert bad_date.status_code == httpx.codes.OK
+
+
+@pytest.mark.asyncio
+async def test_range_requests(tree: Path) -> None:
+    static = MemoryStaticFiles(tree)
+    asset = static.assets["big.bin"]
+
+    async with make_client(static) as client:
+        partial = await client.get("/big.bin", headers={"Range": "bytes=10-19"})
+        suffix = await client.get("/big.bin", headers={"Range": "bytes=-4"})
+        multi = await client.get("/big.bin", headers={"Range": "bytes=0-1,4-5"})
+        bad = await client.get("/big.bin", headers={"Range": "pages=1"})
+        unsatisfiable = await client.get("/big.bin", headers={"Range": "bytes=5000-"})
+        if_range_match = await client.get("/big.bin", headers={"Range": "bytes=0-0", "If-Range": asset.etag})
+        if_range_stale = await client.get("/big.bin", headers={"Range": "bytes=0-0", "If-Range": '"old"'})
+        if_range_date = await client.get("/big.bin", headers={"Range": "bytes=0-0", "If-Range": asset.last_modified})
+
+    assert partial.status_code == httpx.codes.PARTIAL_CONTENT
+    assert partial.content == bytes(range(10, 20))
+    assert partial.headers["content-range"] == "bytes 10-19/2048"
+    assert suffix.content == bytes(range(252, 256))
+    assert multi.status_code == httpx.codes.OK
+    assert len(multi.content) == 2048
+    assert bad.status_code == httpx.codes.BAD_REQUEST
+    assert unsatisfiable.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE
+    assert unsatisfiable.headers["content-range"] == "bytes */2048"
+    assert if_range_match.status_code == httpx.codes.PARTIAL_CONTENT
+    assert if_range_stale.status_code == httpx.codes.OK
+    assert if_range_date.status_code == httpx.codes.PARTIAL_CONTENT
+
+
+@pytest.mark.asyncio
+async def test_large_files_are_streamed_from_disk(tree: Path) -> None:
+    static = MemoryStaticFiles(tree, max_memory_bytes=1024)
+    asset = static.assets["big.bin"]
+    assert asset.body is None
+
+    async with make_client(static) as client:
+        full = await client.get("/big.bin")
+        partial = await client.get("/big.bin", headers={"Range": "bytes=0-3"})
+        cached = await client.get("/big.bin", headers={"If-None-Match": asset.etag})
+
+    assert full.content == bytes(range(256)) * 8
+    assert full.headers["etag"] == asset.etag
+    assert full.headers["content-type"] == "application/octet-stream"
+    assert partial.content == bytes(range(4))
+    assert cached.status_code == httpx.codes.NOT_MODIFIED
+
+
+@pytest.mark.asyncio
+async def test_sighup_reloads_the_tree(tree: Path) -> None:
+    static = MemoryStaticFiles(tree)
+    assert static_module.install_reload_signal(static)
+    try:
+        (tree / "new.txt").write_text("fresh", encoding="utf-8")
+        os.kill(os.getpid(), signal.SIGHUP)
+        for _ in range(100):
+            if "new.txt" in static.assets:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        static_module.remove_reload_signal()
+
+    assert static.assets["new.txt"].body == b"fresh"
+
+
+def test_reload_signal_needs_a_running_loop(tree: Path) -> None:
+    assert not static_module.install_reload_signal(MemoryStaticFiles(tree))
+
+
+@pytest.mark.asyncio
+async def test_app_serves_static_tree_from_memory(client: httpx.AsyncClient) -> None:
+    response = await client.get("/static/css/app.css")
+    cached = await client.get("/static/css/app.css", headers={"If-None-Match": response.headers["etag"]})
+    missing = await client.get("/static/css/missing.css")
+
+    assert response.status_code == httpx.codes.OK
+    assert response.content == (STATIC_ROOT / "css" / "app.css").read_bytes()
+    assert response.headers["content-type"] == "text/css; charset=utf-8"
+    assert cached.status_code == httpx.codes.NOT_MODIFIED
+    assert missing.status_code == httpx.codes.NOT_FOUND
+    assert missing.json() == {"detail": "Not Found"}
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import os
+import signal
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from app.supervisor import ProcessSupervisor
+from tests.conftest import Clock
+
+
+class FakeProcess:
+    instances: list["FakeProcess"] = []
+
+    def __init__(self, target: Callable[..., None], args: tuple, name: str, daemon: bool) -> None:
+        self.target = target
+        self.args = args
+        self.name = name
+        self.pid: int | None = None
+        self.exitcode: int | None = None
+        self.alive = False
+        self.terminated = False
+        self.killed = False
+        self.ignore_terminate = False
+        FakeProcess.instances.append(self)
+
+    def start(self) -> None:
+        self.pid = 1000 + len(FakeProcess.instances)
+        self.alive = True
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def exit(self, code: int) -> None:
+        self.alive = False
+        self.exitcode = code
+
+    def terminate(self) -> None:
+        self.terminated = True
+        if not self.ignore_terminate:
+            self.exit(-signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.killed = True
+        self.exit(-signal.SIGKILL)
+
+    def join(self, timeout: float | None = None) -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def reset_instances() -> None:
+    FakeProcess.instances = []
+
+
+def _noop(*args: Any) -> None:  # pragma: no cover - never executed by fake processes
+    return None
+
+
+def _await_sighup(marker: str) -> None:  # pragma: no cover - runs in the spawned child
+    signal.signal(signal.SIGHUP, lambda signum, frame: Path(marker).write_text("reloaded"))
+    Path(f"{marker}.ready").touch()
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline and not Path(marker).exists():
+        time.sleep(0.01)
+
+
+def _wait_for(path: Path, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def make_supervisor(clock: Clock, processes: int = 2, **kwargs: Any) -> ProcessSupervisor:
+    return ProcessSupervisor(
+        _noop,
+        processes=processes,
+        args=lambda index: (f"slot-{index}",),
+        name="test",
+        process_factory=FakeProcess,
+        clock=clock,
+        backoff_initial=1.0,
+        backoff_max=4.0,
+        healthy_after=60.0,
+        **kwargs,
+    )
+
+
+def test_requires_at_least_one_process() -> None:
+    with pytest.raises(ValueError):
+        ProcessSupervisor(_noop, processes=0)
+
+
+def test_start_spawns_each_slot_with_its_arguments() -> None:
+    supervisor = make_supervisor(Clock())
+    supervisor.start()
+
+    assert [process.args for process in FakeProcess.instances] == [("slot-0",), ("slot-1",)]
+    assert [process.name for process in FakeProcess.instances] == ["test-0", "test-1"]
+    assert all(entry["alive"] for entry in supervisor.status())
+
+
+def test_clean_exit_is_replaced_immediately() -> None:
+    clock = Clock()
+    supervisor = make_supervisor(clock, processes=1)
+    supervisor.start()
+
+    FakeProcess.instances[0].exit(0)
+    supervisor.monitor_once()
+
+    assert len(FakeProcess.instances) == 2
+    assert supervisor.status()[0]["restarts"] == 1
+
+
+def test_crashes_back_off_exponentially_and_reset_when_healthy() -> None:
+    clock = Clock()
+    supervisor = make_supervisor(clock, processes=1)
+    supervisor.start()
+
+    delays = []
+    for _ in range(4):
+        FakeProcess.instances[-1].exit(1)
+        supervisor.monitor_once()
+        crashed_at = clock.now
+        spawned = len(FakeProcess.instances)
+        while len(FakeProcess.instances) == spawned:
+            clock.now += 0.5
+            supervisor.monitor_once()
+        delays.append(clock.now - crashed_at)
+
+    assert delays == [1.0, 2.0, 4.0, 4.0]
+    assert supervisor.status()[0]["pid"] is not None
+
+    clock.now += 120
+    FakeProcess.instances[-1].exit(1)
+    supervisor.monitor_once()
+    spawned = len(FakeProcess.instances)
+    clock.now += 1.0
+    supervisor.monitor_once()
+    assert len(FakeProcess.instances) == spawned + 1
+
+
+def test_no_restarts_while_stopping() -> None:
+    clock = Clock()
+    supervisor = make_supervisor(clock, processes=1)
+    supervisor.start()
+    supervisor.request_stop(signal.SIGTERM, None)
+
+    FakeProcess.instances[0].exit(0)
+    supervisor.monitor_once()
+
+    assert supervisor.stopping
+    assert len(FakeProcess.instances) == 1
+    assert supervisor.status() == [{"index": 0, "pid": None, "alive": False, "restarts": 0, "uptime_seconds": 0.0}]
+
+
+def test_stop_terminates_then_kills_stragglers() -> None:
+    clock = Clock()
+    supervisor = make_supervisor(clock, graceful_timeout=5.0)
+    supervisor.start()
+    stubborn, polite = FakeProcess.instances
+    stubborn.ignore_terminate = True
+    polite.exit(0)
+
+    supervisor.stop()
+
+    assert stubborn.terminated and stubborn.killed
+    assert not polite.terminated and not polite.killed
+
+
+def test_run_supervises_until_signalled(monkeypatch: pytest.MonkeyPatch) -> None:
+    handlers: dict[int, Any] = {}
+    monkeypatch.setattr(signal, "signal", lambda signum, handler: handlers.setdefault(signum, handler))
+    clock = Clock()
+    ticks: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        ticks.append(seconds)
+        if len(ticks) == 2:
+            handlers[signal.SIGTERM](signal.SIGTERM, None)
+
+    supervisor = make_supervisor(clock, sleep=fake_sleep, poll_interval=0.25)
+
+    assert supervisor.run() == 0
+    assert ticks == [0.25, 0.25]
+    assert set(handlers) == {signal.SIGTERM, signal.SIGINT, signal.SIGHUP}
+    assert handlers[signal.SIGHUP] is signal.SIG_IGN
+    assert all(process.terminated for process in FakeProcess.instances)
+
+
+def test_forward_signal_reaches_live_children_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[tuple[int, int]] = []
+
+    def fake_kill(pid: int, signum: int) -> None:
+        sent.append((pid, signum))
+        if pid == gone.pid:
+            raise ProcessLookupError(pid)
+
+    monkeypatch.setattr("app.supervisor.os.kill", fake_kill)
+    supervisor = make_supervisor(Clock(), processes=3, forward_sighup=True)
+    supervisor.start()
+    live, gone, dead = FakeProcess.instances
+    dead.exit(1)
+
+    supervisor.forward_signal(signal.SIGHUP)
+
+    assert sent == [(live.pid, signal.SIGHUP), (gone.pid, signal.SIGHUP)]
+
+
+def test_run_forwards_sighup_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    handlers: dict[int, Any] = {}
+    monkeypatch.setattr(signal, "signal", lambda signum, handler: handlers.setdefault(signum, handler))
+    supervisor = make_supervisor(Clock(), forward_sighup=True, sleep=lambda seconds: supervisor.request_stop())
+
+    supervisor.run()
+
+    assert handlers[signal.SIGHUP] == supervisor.forward_signal
+
+
+def test_sighup_to_the_supervisor_reaches_real_children(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Keep pytest-cov out of the spawned child; it would leave a stray data file behind.
+    for key in [key for key in os.environ if key.startswith("COV_CORE_")]:
+        monkeypatch.delenv(key)
+    marker = tmp_path / "child"
+    supervisor = ProcessSupervisor(_await_sighup, processes=1, args=lambda index: (str(marker),), forward_sighup=True)
+    previous = signal.signal(signal.SIGHUP, supervisor.forward_signal)
+    supervisor.start()
+    try:
+        assert _wait_for(tmp_path / "child.ready")
+        os.kill(os.getpid(), signal.SIGHUP)
+        assert _wait_for(marker)
+    finally:
+        signal.signal(signal.SIGHUP, previous)
+        supervisor.stop()
+
+    assert marker.read_text() == "reloaded"
+    assert supervisor.status()[0]["alive"] is False
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, Iterator
+
+import httpx
+import pytest
+
+from app.config import Settings, get_settings
+from app.factory import create_app
+from app.services import tracing
+from app.services.telegram import send_telegram_message
+from app.workers import registry
+from app.workers.jobs import load_job_modules
+from app.workers.registry import ENVELOPE_KWARG
+from tests.conftest import DummyRedis
+
+
+@pytest.fixture(autouse=True)
+def restore_exporter() -> Iterator[None]:
+    load_job_modules()
+    yield
+    tracing.set_exporter(tracing.NullSpanExporter())
+
+
+@pytest.mark.asyncio
+async def test_trace_follows_contact_from_request_to_telegram(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    trace_file = tmp_path / "spans.jsonl"
+    monkeypatch.setenv("TRACE_EXPORTER", "file")
+    monkeypatch.setenv("TRACE_FILE_PATH", str(trace_file))
+    get_settings.cache_clear()
+    dummy = DummyRedis()
+
+    async def factory():
+        return dummy
+
+    app = create_app(redis_pool_factory=factory)
+    payload = {"name": "Traced", "email": "trace@example.com", "message": "Please trace this message."}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            response = await client.post("/api/contact", json=payload)
+
+    trace_id = response.headers[tracing.TRACE_HEADER]
+    assert dummy.jobs == [(registry.job_name(send_telegram_message), payload)]
+    (envelope_kwargs,) = dummy.envelopes
+    assert envelope_kwargs[ENVELOPE_KWARG]["trace_id"] == trace_id
+    assert tracing.current_trace_id() is None
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+
+    (job,) = [func for func in registry.functions if func.__wrapped__ is send_telegram_message]
+    ctx: dict[str, Any] = {"http_client": httpx.AsyncClient(transport=httpx.MockTransport(handler)), "job_try": 1}
+    await job(ctx, payload, **envelope_kwargs)
+    await ctx["http_client"].aclose()
+
+    spans = tracing.FileSpanExporter(trace_file).read()
+    assert {span["trace_id"] for span in spans} == {trace_id}
+    assert [span["name"] for span in spans] == [
+        "contact.rate_limit",
+        "contact.validation",
+        "contact.spam_check",
+        "contact.enqueue",
+        "job.queue_wait",
+        "telegram.send_message",
+        "job.send_telegram_message",
+    ]
+    assert spans[5]["attributes"] == {"destination": "telegram", "status": 200}
+    assert ctx["envelope"] == envelope_kwargs[ENVELOPE_KWARG]
+
+
+@pytest.mark.asyncio
+async def test_jobs_without_envelope_run_untraced(tmp_path: Path) -> None:
+    exporter = tracing.FileSpanExporter(tmp_path / "spans.jsonl")
+    tracing.set_exporter(exporter)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+
+    (job,) = [func for func in registry.functions if func.__wrapped__ is send_telegram_message]
+    ctx: dict[str, Any] = {"http_client": httpx.AsyncClient(transport=httpx.MockTransport(handler))}
+    await job(ctx, {"name": "Plain", "email": "plain@example.com", "message": "No trace here."})
+    await ctx["http_client"].aclose()
+
+    assert exporter.read() == []
+
+
+def test_span_records_errors(tmp_path: Path) -> None:
+    exporter = tracing.FileSpanExporter(tmp_path / "spans.jsonl")
+    tracing.set_exporter(exporter)
+
+    with tracing.trace_context("abc"):
+        with pytest.raises(RuntimeError):
+            with tracing.span("failing", step=1):
+                raise RuntimeError("boom")
+
+    (span,) = exporter.read()
+    assert span["attributes"] == {"step": 1, "error": "RuntimeError"}
+
+
+def test_configure_selects_exporters(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    file_exporter = tracing.configure(Settings(TRACE_EXPORTER="file", TRACE_FILE_PATH=str(tmp_path / "t.jsonl")))
+    assert isinstance(file_exporter, tracing.FileSpanExporter)
+    assert tracing.get_exporter() is file_exporter
+
+    log_exporter = tracing.configure(Settings(TRACE_EXPORTER="log"))
+    with caplog.at_level(logging.INFO, logger="app.services.tracing"), tracing.trace_context("def"):
+        tracing.record_span("logged", 0.0, 0.001)
+    assert isinstance(log_exporter, tracing.LoggingSpanExporter)
+    assert '"name": "logged"' in caplog.text
+
+    tracing.NullSpanExporter().export(tracing.Span("t", "n", 0.0, 0.0))
+    with pytest.raises(ValueError):
+        tracing.configure(Settings(TRACE_EXPORTER="zipkin"))
@@ -5,7 +5,9 @@ from typing import Any, Dict
 
 import httpx
 import pytest
+from arq import Retry
 
+from app.config import get_settings
 from app.services.telegram import send_telegram_message, worker_shutdown, worker_startup
 
 
@@ -50,7 +52,7 @@ async def test_send_telegram_message_posts_payload() -> None:
 @pytest.mark.asyncio
 async def test_send_telegram_message_propagates_http_error() -> None:
     async def handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(500, json={"detail": "error"})
+        return httpx.Response(400, json={"detail": "error"})
 
     transport = httpx.MockTransport(handler)
     ctx = {"http_client": httpx.AsyncClient(transport=transport)}
@@ -61,3 +63,57 @@ async def test_send_telegram_message_propagates_http_error() -> None:
         await send_telegram_message(ctx, payload)
 
     await ctx["http_client"].aclose()
+
+
+@pytest.mark.asyncio
+async def test_send_telegram_message_retries_server_errors() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502, json={"detail": "bad gateway"})
+
+    ctx = {"http_client": httpx.AsyncClient(transport=httpx.MockTransport(handler))}
+
+    with pytest.raises(Retry) as exc_info:
+        await send_telegram_message(ctx, {"name": "Err", "email": "err@example.com", "message": "Fails"})
+
+    assert exc_info.value.defer_score == 1000
+    await ctx["http_client"].aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("response", "expected_defer"),
+    [
+        (httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 7}}), 7.0),
+        (httpx.Response(429, headers={"Retry-After": "3"}, text="slow down"), 3.0),
+        (httpx.Response(429, json={"ok": False}), 1.0),
+    ],
+)
+async def test_send_telegram_message_retries_when_throttled(response: httpx.Response, expected_defer: float) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return response
+
+    ctx = {"http_client": httpx.AsyncClient(transport=httpx.MockTransport(handler))}
+    payload = {"name": "Slow", "email": "slow@example.com", "message": "Throttled"}
+
+    with pytest.raises(Retry) as exc_info:
+        await send_telegram_message(ctx, payload)
+
+    assert exc_info.value.defer_score == int(expected_defer * 1000)
+    await ctx["http_client"].aclose()
+
+
+@pytest.mark.asyncio
+async def test_send_telegram_message_uses_configured_api_base(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TELEGRAM_API_BASE", "http://127.0.0.1:9999/")
+    get_settings.cache_clear()
+    captured: Dict[str, str] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        captured["url"] = str(request.url)
+        return httpx.Response(200, json={"ok": True})
+
+    ctx = {"http_client": httpx.AsyncClient(transport=httpx.MockTransport(handler))}
+    await send_telegram_message(ctx, {"name": "Local", "email": "local@example.com", "message": "Hi"})
+    await ctx["http_client"].aclose()
+
+    assert captured["url"] == "http://127.0.0.1:9999/bottest-token/sendMessage"
@@ -5,7 +5,7 @@ import pytest
 from app.config import get_settings
 from app.services.telegram import send_telegram_message
 from app.worker import WorkerSettings
-from app.workers import worker_shutdown, worker_startup
+from app.workers import jobs, worker_shutdown, worker_startup
 
 
 def test_worker_settings_configuration() -> None:
@@ -13,8 +13,20 @@ def test_worker_settings_configuration() -> None:
 
     assert WorkerSettings.redis_settings.host == settings.redis_host
     assert WorkerSettings.redis_settings.port == settings.redis_port
-    assert WorkerSettings.functions == [send_telegram_message]
+    assert [func.__wrapped__ for func in WorkerSettings.functions] == [send_telegram_message]
     assert WorkerSettings.keep_result == 0
+    assert WorkerSettings.max_jobs == settings.worker_max_jobs
+    assert WorkerSettings.max_tries == settings.worker_max_tries
+    assert WorkerSettings.health_check_interval == settings.worker_heartbeat_seconds
+    assert WorkerSettings.job_completion_wait == int(settings.worker_graceful_timeout)
+
+
+def test_job_constants_match_arq() -> None:
+    from arq.constants import default_queue_name, health_check_key_suffix
+
+    assert jobs.QUEUE_NAME == default_queue_name
+    assert jobs.HEALTH_CHECK_KEY == default_queue_name + health_check_key_suffix
+    assert send_telegram_message.__name__ == jobs.SEND_TELEGRAM_MESSAGE
 
 
 @pytest.mark.asyncio
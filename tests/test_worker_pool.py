@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import pytest
+
+from app import worker_pool
+from app.config import Settings, get_settings
+from app.supervisor import ProcessSupervisor
+
+CHILD_METRICS = """# HELP arq_job_duration_seconds Job duration.
+# TYPE arq_job_duration_seconds histogram
+arq_job_duration_seconds_bucket{job="send",le="+Inf"} 2
+arq_job_duration_seconds_count{job="send"} 2
+# HELP arq_up Up.
+# TYPE arq_up gauge
+arq_up 1
+
+"""
+
+
+class FakeSupervisor:
+    def __init__(self, statuses: list[dict[str, Any]], stopping: bool = False) -> None:
+        self.statuses = statuses
+        self.stopping = stopping
+
+    def status(self) -> list[dict[str, Any]]:
+        return self.statuses
+
+
+@pytest.fixture
+def child_server() -> Iterator[int]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            body = CHILD_METRICS.encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _status(index: int, alive: bool = True, restarts: int = 0) -> dict[str, Any]:
+    return {"index": index, "pid": 100 + index, "alive": alive, "restarts": restarts, "uptime_seconds": 1.0}
+
+
+def test_child_ports_follow_the_report_port() -> None:
+    assert worker_pool.child_metrics_ports(9100, 3) == [9101, 9102, 9103]
+    assert worker_pool.child_metrics_ports(None, 2) == [None, None]
+
+
+def test_metrics_from_children_are_labelled_and_merged() -> None:
+    merged = worker_pool.merge_metrics([(0, CHILD_METRICS), (1, CHILD_METRICS + "{garbage} 1\n")])
+    lines = merged.splitlines()
+
+    assert lines.count("# TYPE arq_job_duration_seconds histogram") == 1
+    assert lines[:4] == [
+        "# HELP arq_job_duration_seconds Job duration.",
+        "# TYPE arq_job_duration_seconds histogram",
+        'arq_job_duration_seconds_bucket{process="0",job="send",le="+Inf"} 2',
+        'arq_job_duration_seconds_count{process="0",job="send"} 2',
+    ]
+    assert 'arq_up{process="0"} 1' in lines
+    assert 'arq_up{process="1"} 1' in lines
+    assert not any("garbage" in line for line in lines)
+
+
+def test_report_aggregates_health_and_metrics(child_server: int) -> None:
+    supervisor = FakeSupervisor([_status(0, restarts=2), _status(1), _status(2, alive=False)])
+    unused = ThreadingHTTPServer(("127.0.0.1", 0), BaseHTTPRequestHandler)
+    closed_port = unused.server_address[1]
+    unused.server_close()
+    report = worker_pool.PoolReport(supervisor, [child_server, closed_port, None], host="0.0.0.0")  # type: ignore[arg-type]
+
+    health, metrics_text = report.collect()
+
+    assert health["healthy"] is False
+    assert [process["metrics_ok"] for process in health["processes"]] == [True, False, False]
+    assert "worker_pool_processes_alive 2" in metrics_text
+    assert "worker_pool_restarts_total 2" in metrics_text
+    assert 'arq_up{process="0"} 1' in metrics_text
+    assert 'process="1"' not in metrics_text
+
+
+def test_report_server_exposes_health_and_metrics(child_server: int) -> None:
+    supervisor = FakeSupervisor([_status(0)])
+    server = worker_pool.start_report_server(
+        worker_pool.PoolReport(supervisor, [child_server]), "127.0.0.1", 0  # type: ignore[arg-type]
+    )
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{base}/health", timeout=2) as response:
+            assert json.loads(response.read())["healthy"] is True
+        with urllib.request.urlopen(f"{base}/metrics", timeout=2) as response:
+            assert 'arq_up{process="0"} 1' in response.read().decode()
+        supervisor.stopping = True
+        with pytest.raises(urllib.error.HTTPError) as unhealthy:
+            urllib.request.urlopen(f"{base}/health", timeout=2)
+        assert unhealthy.value.code == 503
+        with pytest.raises(urllib.error.HTTPError) as missing:
+            urllib.request.urlopen(f"{base}/other", timeout=2)
+        assert missing.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_worker_process_runs_arq_with_its_metrics_port(monkeypatch: pytest.MonkeyPatch) -> None:
+    ran: list[Any] = []
+    monkeypatch.setattr("arq.worker.run_worker", lambda settings_cls: ran.append(settings_cls))
+    monkeypatch.delenv("WORKER_METRICS_PORT", raising=False)
+
+    worker_pool.run_worker_process(None)
+    assert "WORKER_METRICS_PORT" not in os.environ
+    worker_pool.run_worker_process(9105)
+
+    from app.worker import WorkerSettings
+
+    assert ran == [WorkerSettings, WorkerSettings]
+    assert get_settings().worker_metrics_port == 9105
+    monkeypatch.delenv("WORKER_METRICS_PORT")
+
+
+@pytest.mark.parametrize("metrics_port", [None, 0])
+def test_run_pool_supervises_workers(monkeypatch: pytest.MonkeyPatch, metrics_port: int | None) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_run(self: ProcessSupervisor) -> int:
+        captured["supervisor"] = self
+        return 0
+
+    monkeypatch.setattr(ProcessSupervisor, "run", fake_run)
+    settings = Settings(WORKER_PROCESSES=3, WORKER_GRACEFUL_TIMEOUT=10, WORKER_METRICS_PORT=metrics_port)
+
+    assert worker_pool.run_pool(settings) == 0
+
+    supervisor = captured["supervisor"]
+    assert supervisor.name == "worker"
+    assert supervisor.graceful_timeout == 15
+    assert len(supervisor.status()) == 3
+    expected = (None,) if metrics_port is None else (3,)
+    assert supervisor.args(2) == expected
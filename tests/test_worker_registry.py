@@ -26,7 +26,7 @@ async def test_job_registry_registers_jobs_and_hooks() -> None:
         ctx["value"] = payload["value"]
 
     assert registry.job_name(sample) == "sample"
-    assert registry.functions == [sample]
+    assert [func.__wrapped__ for func in registry.functions] == [sample]
 
     context: dict[str, Any] = {}
     await registry.run_startup(context)
@@ -60,3 +60,29 @@ def test_job_registry_job_name_errors_for_unknown_function() -> None:
 
     with pytest.raises(KeyError):
         registry.job_name(dummy)
+
+
+@pytest.mark.asyncio
+async def test_job_registry_middleware_wraps_jobs_in_order() -> None:
+    registry = JobRegistry()
+    events: list[str] = []
+
+    @registry.middleware
+    async def outer(ctx: dict[str, Any], job_name: str, call_next) -> Any:
+        events.append(f"outer:{job_name}")
+        return await call_next()
+
+    @registry.middleware
+    async def inner(ctx: dict[str, Any], job_name: str, call_next) -> Any:
+        events.append(f"inner:{job_name}")
+        return await call_next()
+
+    @registry.job(name="custom")
+    async def handler(ctx: dict[str, Any], payload: dict[str, Any]) -> str:
+        events.append("handler")
+        return payload["value"]
+
+    (job,) = registry.functions
+    assert job.__qualname__ == "custom"
+    assert await job({}, {"value": "ok"}) == "ok"
+    assert events == ["outer:custom", "inner:custom", "handler"]
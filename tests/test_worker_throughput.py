@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+import pytest
+
+from app.config import get_settings
+from benchmarks import worker_throughput
+
+HARNESS_ENV = ("TELEGRAM_API_BASE", "TELEGRAM_MAX_CONNECTIONS", "WORKER_MAX_JOBS", "WORKER_MAX_TRIES")
+
+
+@pytest.fixture(autouse=True)
+def isolated_environment(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    for key in HARNESS_ENV:
+        monkeypatch.delenv(key, raising=False)
+    yield
+    get_settings.cache_clear()
+
+
+def test_harness_delivers_every_job_and_exits_cleanly(capsys: pytest.CaptureFixture[str]) -> None:
+    assert worker_throughput.main(["--jobs", "20", "--latency", "0"]) == 0
+
+    report = dict(line.split(None, 1) for line in capsys.readouterr().out.splitlines())
+    assert report["completed"] == "20"
+    assert report["failed"] == "0"
+    assert [key for key in HARNESS_ENV if key in os.environ] == []
+
+
+def test_harness_exits_non_zero_when_jobs_fail(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("WORKER_MAX_TRIES", "7")
+
+    assert worker_throughput.main(["--jobs", "10", "--latency", "0", "--error-rate", "1", "--max-tries", "1"]) == 1
+    assert os.environ["WORKER_MAX_TRIES"] == "7"